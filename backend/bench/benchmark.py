@@ -0,0 +1,302 @@
+"""
+가짜 open.go.kr 서버를 띄우고 headless 엔진(src/main.py)을 실행해 처리량을 측정.
+
+    python bench/benchmark.py --configs 3 --docs 50 --latency 0.05 --workers 2
+    python bench/benchmark.py --alertRate 0.1 --errorRate 0.05 -- --excelMode stream
+    python bench/benchmark.py --compareLean --assets 20 --assetLatency 0.05
+
+`--` 뒤의 인자는 엔진에 그대로 전달한다.
+결과는 문서/분, 다운로드/분, 최대 메모리(RSS)와 엔진 --profile 리포트 경로를 담은 JSON.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from fakeOpenGoKr import (
+    NO_MATCH,
+    NO_RESULT,
+    FakeOpenGoKrServer,
+    addFakeArguments,
+    fakeConfigOf,
+)
+
+try:
+    import psutil
+except ImportError:  # psutil이 없으면 resource의 자식 프로세스 최대 RSS로 대체
+    psutil = None
+
+SRC_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"
+)
+EXCEL_NAME = "bench.xlsx"
+# --compareLean에서 비교하는 페이지 로드 구간
+PAGE_PHASES = ["driver.mainPage", "page.main", "page.tab", "search.open", "document"]
+
+
+def makeConfigs(count: int, faults: bool) -> List[Dict[str, str]]:
+    configs = [
+        {
+            "query": f"전자칠판{i}",
+            "organization": f"벤치마크학교{i}",
+            "location": "서울특별시교육청",
+            "include": "null",
+            "exclude": "null",
+            "startDate": "2025-01-01",
+            "endDate": "2025-12-31",
+        }
+        for i in range(count)
+    ]
+    if faults:
+        # 기관 매칭 실패, 검색 결과 0건 흐름도 함께 측정
+        configs.append({**configs[0], "organization": NO_MATCH})
+        configs.append({**configs[0], "query": NO_RESULT})
+    return configs
+
+
+class MemorySampler(threading.Thread):
+    """엔진 프로세스와 자식(chromedriver, Chrome) RSS 합계의 최대값을 주기적으로 기록"""
+
+    def __init__(self, pid: int, interval: float = 0.5) -> None:
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.peakBytes = 0
+        self.stopEvent = threading.Event()
+
+    def run(self) -> None:
+        if psutil is None:
+            return
+        try:
+            root = psutil.Process(self.pid)
+        except psutil.NoSuchProcess:
+            return
+        while not self.stopEvent.wait(self.interval):
+            total = 0
+            try:
+                for proc in [root] + root.children(recursive=True):
+                    try:
+                        total += proc.memory_info().rss
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        continue
+            except psutil.NoSuchProcess:
+                return
+            self.peakBytes = max(self.peakBytes, total)
+
+    def stop(self) -> int:
+        self.stopEvent.set()
+        self.join(timeout=self.interval * 2)
+        if psutil is None:
+            import resource
+
+            # 리눅스는 KB, macOS는 byte 단위
+            peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+            return peak if sys.platform == "darwin" else peak * 1024
+        return self.peakBytes
+
+
+def countFiles(root: str) -> int:
+    count = 0
+    for dirPath, dirNames, fileNames in os.walk(root):
+        dirNames[:] = [d for d in dirNames if not d.startswith(".")]
+        count += sum(1 for name in fileNames if not name.endswith(".part"))
+    return count
+
+
+def runEngine(
+    baseUrl: str,
+    baseDir: str,
+    configs: List[Dict],
+    engineArgs: List[str],
+    verbose: bool,
+) -> Dict[str, Any]:
+    cmd = [
+        sys.executable,
+        os.path.join(SRC_DIR, "main.py"),
+        "--baseDir", baseDir,
+        "--excelName", EXCEL_NAME,
+        "--data", json.dumps(configs, ensure_ascii=False),
+        "--debug", '"false"',
+        "--profile", "true",
+        *engineArgs,
+    ]  # fmt: skip
+    env = {**os.environ, "OPEN_GO_KR_BASE_URL": baseUrl, "PYTHONUNBUFFERED": "1"}
+    started = time.monotonic()
+    proc = subprocess.Popen(
+        cmd,
+        cwd=SRC_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+    )
+    sampler = MemorySampler(proc.pid)
+    sampler.start()
+    profilePath: Optional[str] = None
+    errors: List[str] = []
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        if verbose:
+            sys.stdout.write(line)
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(event, dict):
+            continue
+        if event.get("event") == "profile":
+            profilePath = event.get("path")
+        elif event.get("level") == "error":
+            errors.append(event.get("msg", ""))
+    code = proc.wait()
+    elapsed = time.monotonic() - started
+    return {
+        "exitCode": code,
+        "elapsedSec": elapsed,
+        "peakRssBytes": sampler.stop(),
+        "profilePath": profilePath,
+        "errors": errors,
+    }
+
+
+def measure(
+    server: FakeOpenGoKrServer, args: argparse.Namespace, engineArgs: List[str]
+) -> Dict[str, Any]:
+    baseDir = tempfile.mkdtemp(prefix="opengokr_bench_")
+    configs = makeConfigs(args.configs, args.faults)
+    # 이전 실행 기록/첨부파일 저장소/기관 캐시가 측정에 섞이지 않도록 기본은 모두 끔
+    defaults = [
+        "--workers", str(args.workers),
+        "--journal", "false",
+        "--attachmentStore", "false",
+        "--institutionCache", "false",
+    ]  # fmt: skip
+    serverBefore = server.stats.snapshot()
+    run = runEngine(
+        server.baseUrl, baseDir, configs, defaults + engineArgs, args.verbose
+    )
+
+    downloadDir = os.path.join(baseDir, "excel_database", EXCEL_NAME.split(".")[0])
+    profile = {}
+    if run["profilePath"] and os.path.exists(run["profilePath"]):
+        with open(run["profilePath"], encoding="utf-8") as f:
+            profile = json.load(f)
+    phases = profile.get("phases", {})
+    documents = phases.get("document", {}).get("count", 0)
+    downloads = countFiles(os.path.join(downloadDir, "files"))
+    minutes = run["elapsedSec"] / 60
+    serverAfter = server.stats.snapshot()
+    result = {
+        "exitCode": run["exitCode"],
+        "configs": len(configs),
+        "elapsedSec": round(run["elapsedSec"], 2),
+        "documents": documents,
+        "downloads": downloads,
+        "documentsPerMin": round(documents / minutes, 1) if minutes else 0,
+        "downloadsPerMin": round(downloads / minutes, 1) if minutes else 0,
+        "peakRssMb": round(run["peakRssBytes"] / 1024 / 1024, 1),
+        "server": {
+            key: value - serverBefore.get(key, 0) for key, value in serverAfter.items()
+        },
+        "phases": {
+            name: {k: v for k, v in phase.items() if k != "histogram"}
+            for name, phase in phases.items()
+        },
+        "counters": profile.get("counters", {}),
+        "gauges": profile.get("gauges", {}),
+        "errors": run["errors"],
+        "profilePath": run["profilePath"] if args.keep else None,
+    }
+    if not args.keep:
+        shutil.rmtree(baseDir, ignore_errors=True)
+    return result
+
+
+def compareLean(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    # 페이지 로드 구간 p50/평균과 탭당 메모리, 전체 메모리의 변화율(%)
+    def change(a: Optional[float], b: Optional[float]) -> Optional[float]:
+        return round((b - a) / a * 100, 1) if a else None
+
+    result: Dict[str, Any] = {}
+    for name in PAGE_PHASES:
+        a, b = before["phases"].get(name), after["phases"].get(name)
+        if a and b:
+            result[name] = {
+                "p50Sec": [a["p50Sec"], b["p50Sec"], change(a["p50Sec"], b["p50Sec"])],
+                "meanSec": [
+                    a["meanSec"],
+                    b["meanSec"],
+                    change(a["meanSec"], b["meanSec"]),
+                ],
+            }
+    for name in ("tab.jsHeapMb", "tab.domNodes"):
+        a, b = before["gauges"].get(name), after["gauges"].get(name)
+        if a and b:
+            result[name] = [a["mean"], b["mean"], change(a["mean"], b["mean"])]
+    for key in ("elapsedSec", "peakRssMb", "documentsPerMin"):
+        result[key] = [before[key], after[key], change(before[key], after[key])]
+    return result
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+    engineArgs: List[str] = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, engineArgs = argv[:split], argv[split + 1 :]
+
+    parser = argparse.ArgumentParser(description="open.go.kr 엔진 처리량 벤치마크")
+    parser.add_argument("--configs", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--faults", action="store_true", help="매칭 실패/0건 config 추가"
+    )
+    parser.add_argument("--keep", action="store_true", help="결과 디렉토리 유지")
+    parser.add_argument("--out", type=str, default="", help="결과 JSON 저장 경로")
+    parser.add_argument("--verbose", action="store_true", help="엔진 출력 그대로 표시")
+    parser.add_argument(
+        "--compareLean",
+        action="store_true",
+        help="--lean false/true로 두 번 실행해 비교",
+    )
+    addFakeArguments(parser)
+    args = parser.parse_args(argv)
+
+    server = FakeOpenGoKrServer(0, fakeConfigOf(args))
+    server.startInBackground()
+    try:
+        if args.compareLean:
+            before = measure(server, args, engineArgs + ["--lean", "false"])
+            after = measure(server, args, engineArgs + ["--lean", "true"])
+            # 각 항목은 [lean 끔, lean 켬, 변화율(%)]
+            result = {
+                "before": before,
+                "after": after,
+                "change": compareLean(before, after),
+            }
+            exitCode = before["exitCode"] or after["exitCode"]
+        else:
+            result = measure(server, args, engineArgs)
+            exitCode = result["exitCode"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    sys.exit(0 if exitCode == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
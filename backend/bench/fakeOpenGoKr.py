@@ -0,0 +1,572 @@
+"""
+open.go.kr 흐름을 흉내 내는 로컬 가짜 서버.
+
+크롤러가 사용하는 XPath/CSS 선택자와 요청 형태(메인 검색 -> 상세검색 iframe ->
+기관찾기 jstree 팝업 -> 결과 더보기 -> XHR 페이지네이션 -> 상세 페이지 ->
+form POST 첨부파일 다운로드)를 그대로 재현한다.
+지연(latency)과 장애(HTTP 500, 다운로드 실패 alert, 느린 응답, 초당 요청 제한)를 주입할 수 있다.
+
+실제 사이트를 캡처한 것이 아니라 크롤러 구현이 가정하는 형태를 옮긴 것이다. 특히
+- 검색 결과는 kwd/insttCd/startDate/endDate를 쿼리스트링으로 받는 GET URL로 다시 열 수 있고
+- 목록은 pageIndex/rowPage를 form POST로 보내는 XHR(infoListAjax.do)로 페이지를 넘기며
+- 첨부파일은 fileDownload.do 요청 한 번으로 받는다 (기본은 onclick 함수가 만드는 form POST,
+  --downloadLinks href면 GET 링크)
+고 가정하므로, 여기서 잰 수치는 이 가정이 실제 사이트와 맞을 때만 의미가 있다.
+
+    python bench/fakeOpenGoKr.py --port 8800 --docs 120 --latency 0.05
+    OPEN_GO_KR_BASE_URL=http://127.0.0.1:8800 python src/main.py ...
+"""
+
+import argparse
+import base64
+import hashlib
+import html
+import json
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit
+
+LOCATIONS = ["서울특별시교육청", "경기도교육청", "부산광역시교육청", "행정안전부"]
+# 이 문자열이 들어간 기관/검색어는 매칭 실패, 결과 0건 흐름을 재현
+NO_MATCH = "없는기관"
+NO_RESULT = "결과없음"
+PNG_1PX = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+
+@dataclass
+class FakeConfig:
+    docs: int = 30  # 검색 1건당 결과 문서 수
+    files: int = 2  # 문서 1건당 첨부파일 수
+    fileSize: int = 64 * 1024
+    pageSize: int = 10
+    maxPageSize: int = 100
+    latency: float = 0.0  # 요청마다 latency * (0.5 ~ 1.5)초 지연
+    slowRate: float = 0.0  # 이 비율의 요청은 slowLatency만큼 추가 지연
+    slowLatency: float = 2.0
+    errorRate: float = 0.0  # 목록/상세/다운로드 요청이 HTTP 500으로 실패하는 비율
+    alertRate: float = 0.0  # 다운로드가 실패 alert 페이지로 응답하는 비율
+    throttleRps: float = (
+        0.0  # 동적 요청이 초당 이 수를 넘으면 HTTP 503(다운로드는 alert)으로 응답
+    )
+    downloadLinks: str = "script"  # script: onclick 함수가 form POST, href: GET 링크
+    assets: int = 0  # 페이지마다 붙이는 이미지 수(+ 웹폰트 1개), --lean 비교용
+    assetLatency: float = 0.0  # 이미지/폰트 요청마다 추가 지연(초)
+    seed: int = 0
+
+
+class FakeStats:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.counts: Dict[str, int] = {}
+
+    def add(self, key: str) -> None:
+        with self.lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.counts)
+
+
+def docIdsOf(kwd: str, instt: str, count: int) -> List[Tuple[str, str]]:
+    base = hashlib.sha1(f"{kwd}|{instt}".encode()).hexdigest()[:6].upper()
+    return [
+        (f"DOC{base}{i:05d}", f"2025{(i % 12) + 1:02d}{(i % 28) + 1:02d}")
+        for i in range(count)
+    ]
+
+
+def page(title: str, body: str, script: str = "") -> bytes:
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{title}</title>
+<style>
+  .rnb {{ position: fixed; right: 0; top: 0; width: 80px; height: 100%; background: #eee; }}
+  #modal {{ position: fixed; inset: 40px; background: #fff; border: 1px solid #999; }}
+  #modalIfm {{ width: 100%; height: 100%; border: 0; }}
+  .hidden {{ display: none; }}
+</style></head>
+<body>
+<div class="rnb">RNB</div>
+{body}
+<script>{script}</script>
+</body></html>""".encode("utf-8")
+
+
+def mainPage() -> bytes:
+    body = """
+<div id="mainBackImg">
+  <div class="visual"></div>
+  <div>
+    <div>
+      <div>
+        <input id="m_input" type="text">
+        <button type="button" onclick="goSearch()">검색</button>
+      </div>
+    </div>
+  </div>
+</div>"""
+    script = """
+function goSearch() {
+  const kwd = document.getElementById("m_input").value;
+  location.href = "/othicInfo/infoList/orginlInfoList.do?kwd=" + encodeURIComponent(kwd);
+}"""
+    return page("메인", body, script)
+
+
+def searchPage(params: Dict[str, str], cfg: FakeConfig) -> bytes:
+    kwd = params.get("kwd", "")
+    result = ""
+    if params.get("insttCd"):
+        total = 0 if NO_RESULT in kwd else cfg.docs
+        listUrl = "/othicInfo/infoList/infoList.do?" + urlencode(params)
+        result = f"""
+<div class="result">
+  <p>검색결과 <span id="searchInfoListTotalPage">{total:,}</span>건</p>
+  <a id="infoList" href="{html.escape(listUrl)}">더보기</a>
+</div>"""
+    body = f"""
+<div id="srchBtnDiv"><a href="javascript:openDetail()">상세검색</a></div>
+<p>검색어: {html.escape(kwd)}</p>
+{result}
+<div id="modal" class="hidden"></div>"""
+    script = f"""
+function openDetail() {{
+  const modal = document.getElementById("modal");
+  modal.innerHTML = '<iframe id="modalIfm" src="/com/search/detailSearch.do?kwd={quote(kwd)}"></iframe>';
+  modal.classList.remove("hidden");
+}}"""
+    return page("검색", body, script)
+
+
+def detailSearchPage(params: Dict[str, str]) -> bytes:
+    body = f"""
+<div id="popup_wrap">
+  <div><h2>상세검색</h2></div>
+  <div>
+    <div>
+      <div>
+        <div>
+          <table><tbody>
+            <tr><td><p><label><input type="checkbox" id="schlYn">초중고등학교 포함</label></p></td></tr>
+            <tr><td><input id="startDate" type="text"> ~ <input id="endDate" type="text"></td></tr>
+            <tr><td><div>
+              <input id="insttNm" name="insttNm" type="text" readonly>
+              <input id="insttCd" name="insttCd" type="hidden">
+              <button type="button" onclick="openInstt()">기관찾기</button>
+            </div></td></tr>
+            <tr><td><input id="mustKeyword1" type="text"><input id="ignoreKeyword1" type="text"></td></tr>
+          </tbody></table>
+        </div>
+      </div>
+      <div><button type="button" class="btn_srch" onclick="doSearch()">검색</button></div>
+    </div>
+  </div>
+</div>
+<input id="kwd" type="hidden" value="{html.escape(params.get("kwd", ""))}">"""
+    script = """
+function openInstt() {
+  window.open("/com/popup/insttSearch.do", "instt", "width=600,height=600");
+}
+function doSearch() {
+  const v = (id) => document.getElementById(id).value;
+  if (!v("insttCd")) { alert("기관을 선택하세요"); return; }
+  const q = new URLSearchParams({
+    kwd: v("kwd"), insttCd: v("insttCd"), startDate: v("startDate"), endDate: v("endDate"),
+    mustKeyword: v("mustKeyword1"), ignoreKeyword: v("ignoreKeyword1"),
+  });
+  // 실제 사이트처럼 모달이 보이는 상태에서 잠시 후 부모 페이지가 바뀐다
+  setTimeout(() => { parent.location.href = "/othicInfo/infoList/orginlInfoList.do?" + q; }, 100);
+}"""
+    return page("상세검색", body, script)
+
+
+def insttPopupPage() -> bytes:
+    body = """
+<div id="popup_wrap">
+  <div><h2>기관찾기</h2></div>
+  <div>
+    <div>
+      <table><tbody><tr><td><div>
+        <input id="indvdlzInsttNm" type="text">
+        <button type="button" onclick="searchInstt()">검색</button>
+        <button type="button">초기화</button>
+      </div></td></tr></tbody></table>
+    </div>
+    <div>
+      <div id="tree"></div>
+      <div></div>
+      <div></div>
+      <div></div>
+      <div><a href="javascript:confirmInstt()">확인</a><a href="javascript:window.close()">취소</a></div>
+    </div>
+  </div>
+</div>"""
+    script = f"""
+let selected = null;
+const LOCATIONS = {json.dumps(LOCATIONS, ensure_ascii=False)};
+function searchInstt() {{
+  const name = document.getElementById("indvdlzInsttNm").value.trim();
+  fetch("/com/popup/insttSearchAjax.do?name=" + encodeURIComponent(name))
+    .then((res) => res.json())
+    .then((items) => {{
+      const ul = document.createElement("ul");
+      ul.className = "jstree-no-dots";
+      for (const item of items) {{
+        const li = document.createElement("li");
+        const a = document.createElement("a");
+        a.href = "#";
+        a.title = item.title;
+        a.textContent = item.title;
+        a.onclick = (e) => {{ e.preventDefault(); selected = item; }};
+        li.appendChild(a);
+        ul.appendChild(li);
+      }}
+      document.getElementById("tree").replaceChildren(ul);
+    }});
+}}
+function confirmInstt() {{
+  if (!selected) {{ alert("기관을 선택하세요"); return; }}
+  const doc = window.opener.document;
+  doc.getElementById("insttCd").value = selected.code;
+  doc.getElementById("insttNm").value = selected.title;
+  window.close();
+}}"""
+    return page("기관찾기", body, script)
+
+
+def insttItems(name: str) -> List[Dict[str, str]]:
+    if not name or NO_MATCH in name:
+        return []
+    return [
+        {
+            "title": f"{loc} {name}",
+            "code": hashlib.sha1(f"{loc}|{name}".encode()).hexdigest()[:10],
+        }
+        for loc in LOCATIONS
+    ]
+
+
+def listItems(params: Dict[str, str], cfg: FakeConfig) -> Tuple[int, List[Dict]]:
+    total = 0 if NO_RESULT in params.get("kwd", "") else cfg.docs
+    ids = docIdsOf(params.get("kwd", ""), params.get("insttCd", ""), total)
+    size = min(int(params.get("rowPage") or cfg.pageSize), cfg.maxPageSize)
+    index = max(1, int(params.get("pageIndex") or 1))
+    chunk = ids[(index - 1) * size : index * size]
+    return total, [
+        {
+            "prdnNstRgstNo": no,
+            "prdnDt": dt,
+            "infoSj": f"{params.get('kwd')} 관련 문서 {no}",
+        }
+        for no, dt in chunk
+    ]
+
+
+def listPage(params: Dict[str, str], cfg: FakeConfig) -> bytes:
+    query = {k: v for k, v in params.items() if k not in ("pageIndex", "rowPage")}
+    total, items = listItems({**query, "pageIndex": "1"}, cfg)
+    body = """
+<div id="infoList"><dl id="infoItems"></dl></div>
+<div id="pagingInfo"><ul id="pages"></ul></div>"""
+    script = f"""
+const QUERY = {json.dumps(query, ensure_ascii=False)};
+const TOTAL = {total};
+const PAGE_SIZE = {cfg.pageSize};
+function render(items, pageIndex) {{
+  const dl = document.getElementById("infoItems");
+  dl.innerHTML = items.map((it) =>
+    `<dt><span class="top"><a href="javascript:goDetail('${{it.prdnNstRgstNo}}','${{it.prdnDt}}')">${{it.infoSj}}</a></span></dt>`
+  ).join("");
+  const pages = Math.ceil(TOTAL / PAGE_SIZE);
+  const ul = document.getElementById("pages");
+  ul.innerHTML = "";
+  for (let p = 1; p <= pages; p++) {{
+    const li = document.createElement("li");
+    if (p === pageIndex) li.className = "on";
+    li.innerHTML = `<a href="javascript:goPage(${{p}})">${{p}}</a>`;
+    ul.appendChild(li);
+  }}
+}}
+function goPage(pageIndex) {{
+  const xhr = new XMLHttpRequest();
+  xhr.open("POST", "/othicInfo/infoList/infoListAjax.do");
+  xhr.setRequestHeader("Content-Type", "application/x-www-form-urlencoded");
+  xhr.onload = () => {{
+    if (xhr.status !== 200) {{ alert("목록 조회 실패"); return; }}
+    render(JSON.parse(xhr.responseText).list, pageIndex);
+  }};
+  xhr.send(new URLSearchParams({{ ...QUERY, pageIndex, rowPage: PAGE_SIZE }}).toString());
+}}
+function goDetail(no, dt) {{
+  location.href = "/othicInfo/infoList/infoListDetl.do?prdnNstRgstNo=" + no + "&prdnDt=" + dt;
+}}
+render({json.dumps(items, ensure_ascii=False)}, 1);"""
+    return page("목록", body, script)
+
+
+def downloadLink(no: str, idx: int, cfg: FakeConfig) -> str:
+    if cfg.downloadLinks == "href":
+        query = urlencode({"fileNo": no, "fileSn": idx})
+        return f'<a href="/util/fileDownload.do?{query}" class="btn_type05 down">다운로드</a>'
+    return (
+        f'<a href="#none" class="btn_type05 down" '
+        f"onclick=\"fileDown('{no}', {idx}); return false;\">다운로드</a>"
+    )
+
+
+def detailPage(params: Dict[str, str], cfg: FakeConfig) -> bytes:
+    no = params.get("prdnNstRgstNo", "")
+    dt = params.get("prdnDt", "")
+    rows = "".join(
+        f"""<tr><th>{'본문' if i == 0 else '붙임'}</th>
+<td headers="{'본문' if i == 0 else '붙임'}_{i}"><span>{no}_{i}.hwp</span>
+{downloadLink(no, i, cfg)}
+<a href="#none" class="btn_type05 view">바로보기</a></td></tr>"""
+        for i in range(cfg.files)
+    )
+    body = f"""
+<div id="infoSj"><p><strong>{html.escape(no)} 원문 정보</strong></p></div>
+<div id="unitJobNm"><p>정보공개 단위업무</p></div>
+<div id="prdnDtView"><p>{dt[:4]}-{dt[4:6]}-{dt[6:]}</p></div>
+<table class="file"><tbody>{rows}</tbody></table>"""
+    script = """
+function fileDown(no, idx) {
+  const form = document.createElement("form");
+  form.method = "POST";
+  form.action = "/util/fileDownload.do";
+  for (const [k, v] of Object.entries({ fileNo: no, fileSn: String(idx) })) {
+    const input = document.createElement("input");
+    input.type = "hidden";
+    input.name = k;
+    input.value = v;
+    form.appendChild(input);
+  }
+  document.body.appendChild(form);
+  form.submit();
+}"""
+    return page("상세", body, script)
+
+
+def assetTags(count: int) -> bytes:
+    tags = "".join(
+        f'<img src="/static/img{i}.png" width="1" height="1">' for i in range(count)
+    )
+    font = "<style>@font-face { font-family: fake; src: url(/static/font.woff2); } body { font-family: fake; }</style>"
+    return (font + tags).encode("utf-8")
+
+
+def alertPage() -> bytes:
+    return page(
+        "다운로드 실패",
+        "",
+        'alert("파일 다운로드 중 오류가 발생했습니다."); history.back();',
+    )
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    server: "FakeOpenGoKrServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self) -> None:
+        self.route("GET", dict(parse_qsl(urlsplit(self.path).query)))
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+        params = dict(parse_qsl(urlsplit(self.path).query))
+        if body.lstrip().startswith("{"):
+            params.update({k: str(v) for k, v in json.loads(body).items()})
+        else:
+            params.update(parse_qsl(body, keep_blank_values=True))
+        self.route("POST", params)
+
+    def route(self, method: str, params: Dict[str, str]) -> None:
+        cfg = self.server.cfg
+        path = urlsplit(self.path).path
+        self.server.stats.add(path)
+        self.delay()
+        dynamic = path in (
+            "/othicInfo/infoList/infoListAjax.do",
+            "/othicInfo/infoList/infoListDetl.do",
+            "/util/fileDownload.do",
+        )
+        if dynamic and self.server.throttled():
+            self.server.stats.add("fault:throttle")
+            if path == "/util/fileDownload.do":
+                return self.send(200, alertPage())
+            return self.send(503, b"Service Unavailable", "text/plain")
+        if dynamic and self.server.roll(cfg.errorRate):
+            self.server.stats.add("fault:500")
+            return self.send(500, b"Internal Server Error", "text/plain")
+
+        if path.startswith("/static/"):
+            return self.sendAsset(path)
+        if path in ("/", "/com/main/mainView.do"):
+            return self.send(200, mainPage())
+        if path == "/othicInfo/infoList/orginlInfoList.do":
+            return self.send(200, searchPage(params, cfg))
+        if path == "/com/search/detailSearch.do":
+            return self.send(200, detailSearchPage(params))
+        if path == "/com/popup/insttSearch.do":
+            return self.send(200, insttPopupPage())
+        if path == "/com/popup/insttSearchAjax.do":
+            items = insttItems(params.get("name", ""))
+            return self.sendJson(items)
+        if path == "/othicInfo/infoList/infoList.do":
+            return self.send(200, listPage(params, cfg))
+        if path == "/othicInfo/infoList/infoListAjax.do" and method == "POST":
+            total, items = listItems(params, cfg)
+            return self.sendJson({"total": total, "list": items})
+        if path == "/othicInfo/infoList/infoListDetl.do":
+            return self.send(200, detailPage(params, cfg))
+        if path == "/util/fileDownload.do":
+            return self.sendFile(params)
+        return self.send(404, b"Not Found", "text/plain")
+
+    def delay(self) -> None:
+        cfg = self.server.cfg
+        seconds = cfg.latency * self.server.uniform(0.5, 1.5) if cfg.latency else 0
+        if self.server.roll(cfg.slowRate):
+            self.server.stats.add("fault:slow")
+            seconds += cfg.slowLatency
+        if seconds:
+            time.sleep(seconds)
+
+    def sendFile(self, params: Dict[str, str]) -> None:
+        if self.server.roll(self.server.cfg.alertRate):
+            self.server.stats.add("fault:alert")
+            return self.send(200, alertPage())
+        name = f"{params.get('fileNo')}_{params.get('fileSn')}.hwp"
+        seed = hashlib.sha256(name.encode()).digest()
+        size = self.server.cfg.fileSize
+        data = (seed * (size // len(seed) + 1))[:size]
+        self.server.stats.add("download")
+        self.send(
+            200,
+            data,
+            "application/octet-stream",
+            {
+                "Content-Disposition": f"attachment; filename*=UTF-8''{quote('첨부_' + name)}"
+            },
+        )
+
+    def sendAsset(self, path: str) -> None:
+        cfg = self.server.cfg
+        self.server.stats.add("asset")
+        if cfg.assetLatency:
+            time.sleep(cfg.assetLatency)
+        if path.endswith(".png"):
+            return self.send(200, PNG_1PX, "image/png")
+        return self.send(200, b"\0" * 1024, "font/woff2")
+
+    def sendJson(self, value) -> None:
+        self.send(
+            200,
+            json.dumps(value, ensure_ascii=False).encode("utf-8"),
+            "application/json; charset=UTF-8",
+        )
+
+    def send(
+        self,
+        status: int,
+        body: bytes,
+        contentType: str = "text/html; charset=UTF-8",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        assets = self.server.cfg.assets
+        if assets and contentType.startswith("text/html"):
+            body = body.replace(b"</body>", assetTags(assets) + b"</body>", 1)
+        self.send_response(status)
+        self.send_header("Content-Type", contentType)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "JSESSIONID=fake-session; Path=/")
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FakeOpenGoKrServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int, cfg: FakeConfig, verbose: bool = False) -> None:
+        super().__init__(("127.0.0.1", port), FakeHandler)
+        self.cfg = cfg
+        self.verbose = verbose
+        self.stats = FakeStats()
+        self.random = random.Random(cfg.seed)
+        self.randomLock = threading.Lock()
+        # throttleRps 판정용 최근 1초간 동적 요청 시각
+        self.recent: Deque[float] = deque()
+        self.recentLock = threading.Lock()
+
+    @property
+    def baseUrl(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def roll(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self.randomLock:
+            return self.random.random() < rate
+
+    def throttled(self) -> bool:
+        if self.cfg.throttleRps <= 0:
+            return False
+        now = time.monotonic()
+        with self.recentLock:
+            while self.recent and now - self.recent[0] > 1.0:
+                self.recent.popleft()
+            self.recent.append(now)
+            return len(self.recent) > self.cfg.throttleRps
+
+    def uniform(self, low: float, high: float) -> float:
+        with self.randomLock:
+            return self.random.uniform(low, high)
+
+    def startInBackground(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+def addFakeArguments(parser: argparse.ArgumentParser) -> None:
+    defaults = FakeConfig()
+    for name, value in vars(defaults).items():
+        parser.add_argument(f"--{name}", type=type(value), default=value)
+
+
+def fakeConfigOf(args: argparse.Namespace) -> FakeConfig:
+    return FakeConfig(**{name: getattr(args, name) for name in vars(FakeConfig())})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="open.go.kr 가짜 서버")
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--verbose", action="store_true")
+    addFakeArguments(parser)
+    args = parser.parse_args()
+    server = FakeOpenGoKrServer(args.port, fakeConfigOf(args), args.verbose)
+    print(f"가짜 open.go.kr 서버 실행: {server.baseUrl}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.stats.snapshot(), ensure_ascii=False), flush=True)
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,11 @@
 # -*- mode: python ; coding: utf-8 -*-
+# 기본은 onefile 빌드, `pyinstaller script.spec -- --onedir`면 압축을 미리 풀어둔 onedir 빌드.
+# onefile은 실행할 때마다 임시 디렉토리에 전체를 풀기 때문에 시작이 느리다.
+import argparse
+
+options = argparse.ArgumentParser()
+options.add_argument("--onedir", action="store_true")
+spec = options.parse_args()
 
 
 a = Analysis(
@@ -10,29 +17,59 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # 엔진에서 쓰지 않는 표준 라이브러리 GUI/테스트 모듈
+    excludes=['tkinter', 'unittest', 'pydoc'],
     noarchive=False,
     optimize=0,
 )
 pyz = PYZ(a.pure)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='script',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=True,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
+if spec.onedir:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='script',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        # UPX로 압축된 DLL은 로드할 때마다 풀어야 하므로 onedir에서는 사용하지 않음
+        upx=False,
+        console=True,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=False,
+        upx=False,
+        upx_exclude=[],
+        name='script',
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name='script',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=True,
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=True,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
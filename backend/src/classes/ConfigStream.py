@@ -0,0 +1,93 @@
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterator, Optional, TextIO
+from classes.Logger import log
+
+REQUIRED_KEYS = ("query", "organization", "location", "startDate", "endDate")
+OPTIONAL_KEYS = ("include", "exclude")
+# follow 모드에서 이 줄을 만나면 입력 종료
+END_MARKER = {"end": True}
+
+
+class ConfigStream:
+    """
+    JSON Lines 형식의 config를 한 줄씩 읽어서 바로 넘겨준다.
+    path가 "-"면 stdin에서 읽고 EOF에서 끝난다.
+    follow면 파일 끝에서 새 줄이 추가되기를 기다리고, {"end": true} 줄에서 끝난다.
+    한 줄에 JSON 배열이 오면 배열의 각 config를 차례로 넘긴다.
+    """
+
+    def __init__(self, path: str, follow: bool = False, pollInterval: float = 0.5):
+        self.path = path
+        self.follow = follow and path != "-"
+        self.pollInterval = pollInterval
+        self.count = 0
+
+    @property
+    def source(self) -> str:
+        # 실행 기록(runKey) 구분용 식별자
+        return "stdin" if self.path == "-" else os.path.abspath(self.path)
+
+    def __iter__(self) -> Iterator[Dict]:
+        if self.path == "-":
+            yield from self.readLines(sys.stdin)
+            return
+        with open(self.path, encoding="utf-8-sig") as f:
+            yield from self.readLines(f)
+
+    def readLines(self, f: TextIO) -> Iterator[Dict]:
+        partial = ""
+        while True:
+            line = f.readline()
+            if not line:
+                if not self.follow:
+                    break
+                time.sleep(self.pollInterval)
+                continue
+            # follow 중에는 줄바꿈이 들어올 때까지 쓰다 만 줄을 모은다
+            if self.follow and not line.endswith("\n"):
+                partial += line
+                continue
+            line, partial = partial + line, ""
+            value = self.parse(line)
+            if value is END_MARKER:
+                return
+            for cfg in value:
+                self.count += 1
+                yield cfg
+        if partial:
+            for cfg in self.parse(partial):
+                self.count += 1
+                yield cfg
+
+    def parse(self, line: str):
+        line = line.strip()
+        if not line:
+            return []
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError as e:
+            log.warn(f"config 줄 파싱 실패, 건너뜀: {e}")
+            return []
+        if value == END_MARKER:
+            return END_MARKER
+        items = value if isinstance(value, list) else [value]
+        return [cfg for cfg in map(normalizeConfig, items) if cfg]
+
+
+def normalizeConfig(value) -> Optional[Dict]:
+    if not isinstance(value, dict):
+        log.warn(f"config 형식 오류, 건너뜀: {value!r}")
+        return None
+    missing = [key for key in REQUIRED_KEYS if not value.get(key)]
+    if missing:
+        log.warn(f"config 필수 값 누락({', '.join(missing)}), 건너뜀")
+        return None
+    # 날짜는 입력 형식 그대로 검색 폼에 넣는다
+    cfg = {key: str(value[key]).strip() for key in REQUIRED_KEYS}
+    # 엑셀 업로드 경로와 같이 포함/제외 검색어가 없으면 "null"
+    for key in OPTIONAL_KEYS:
+        cfg[key] = str(value.get(key) or "").strip() or "null"
+    return cfg
@@ -0,0 +1,235 @@
+import base64
+import hashlib
+import os
+import re
+import threading
+import time
+import urllib3
+from classes.Http import HttpSession
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+from urllib.parse import unquote, urljoin, urlparse
+from classes.Logger import log
+from classes.Profiler import profiler
+from classes.RateLimiter import limiter
+
+
+class DownloadRequest(TypedDict):
+    method: str
+    url: str
+    fields: List[Tuple[str, str]]
+
+
+class DownloadResult(TypedDict):
+    path: str
+    size: int
+    sha256: str
+
+
+CHUNK_SIZE = 64 * 1024
+# onclick/javascript: 코드 안의 따옴표로 감싼 URL (location.href='...', window.open('...') 등)
+URL_LITERAL = re.compile(r"""["']((?:https?:)?/[^"'\s]*)["']""")
+
+nameLock = threading.Lock()
+
+
+class Downloader:
+    """
+    첨부파일 요청을 공유 커넥션 풀로 동시에 스트리밍 다운로드한다.
+    파일별 제한 시간과 크기/체크섬 검증을 거친 파일만 결과로 돌려준다.
+    """
+
+    def __init__(
+        self,
+        http: HttpSession,
+        maxWorkers: int = 4,
+        timeout: float = 120,
+        maxAttempts: int = 3,
+    ) -> None:
+        self.http = http
+        self.timeout = timeout
+        self.maxAttempts = maxAttempts
+        self.executor = ThreadPoolExecutor(max_workers=maxWorkers)
+
+    def downloadAll(
+        self, requests: List[Optional[DownloadRequest]], destDir: str, referer: str
+    ) -> List[Optional[DownloadResult]]:
+        # 같은 요청을 보내는 버튼이 여러 개면 한 번만 받고 결과를 같이 쓴다
+        submitted = {}
+        futures = []
+        for req in requests:
+            if not req:
+                futures.append(None)
+                continue
+            key = (req["method"], req["url"], tuple(map(tuple, req["fields"])))
+            if key not in submitted:
+                submitted[key] = self.executor.submit(
+                    self.download, req, destDir, referer
+                )
+            futures.append(submitted[key])
+        # 요청 순서(= 버튼 순서)대로 결과 반환
+        return [future.result() if future else None for future in futures]
+
+    @profiler.timed("download.http")
+    def download(
+        self, req: DownloadRequest, destDir: str, referer: str
+    ) -> Optional[DownloadResult]:
+        for attempt in range(1, self.maxAttempts + 1):
+            try:
+                result = self.fetch(req, destDir, referer)
+                if result:
+                    return result
+            except (urllib3.exceptions.HTTPError, OSError, TimeoutError) as e:
+                log.warn(f"스트리밍 다운로드 오류 ({attempt}번째): {e}")
+                limiter.failure(req["url"], "timeout" if isTimeout(e) else "error")
+            if attempt < self.maxAttempts:
+                profiler.count("retry.downloadHttp")
+                time.sleep(min(2**attempt, 10))
+        log.warn(f"스트리밍 다운로드 실패: {req['url']}")
+        return None
+
+    def fetch(
+        self, req: DownloadRequest, destDir: str, referer: str
+    ) -> Optional[DownloadResult]:
+        deadline = time.monotonic() + self.timeout
+        fields = [(k, v) for k, v in req["fields"]] or None
+        # POST 폼은 브라우저와 동일하게 urlencoded로 전송
+        extra = {"encode_multipart": False} if req["method"] == "POST" else {}
+        limiter.acquire(req["url"])
+        res = self.http.pool.request(
+            req["method"],
+            req["url"],
+            fields=fields,
+            headers=self.http.headers(referer),
+            preload_content=False,
+            retries=False,
+            **extra,
+        )
+        try:
+            disposition = res.headers.get("Content-Disposition")
+            contentType = res.headers.get("Content-Type", "")
+            # 사이트가 실패 alert를 HTML로 응답하는 경우는 다운로드 실패로 취급
+            if res.status != 200 or (
+                not disposition and contentType.startswith("text/html")
+            ):
+                log.warn(f"다운로드 응답 이상 ({res.status}, {contentType})")
+                if res.status == 200:
+                    limiter.failure(req["url"], "alert")
+                else:
+                    limiter.report(req["url"], res.status)
+                return None
+
+            fileName = fileNameOf(disposition, req["url"])
+            path = reserveFilePath(destDir, fileName)
+            tmpPath = f"{path}.part"
+            digest = hashlib.sha256()
+            size = 0
+            try:
+                with open(tmpPath, "wb") as f:
+                    for chunk in res.stream(CHUNK_SIZE):
+                        if time.monotonic() > deadline:
+                            raise TimeoutError(f"{self.timeout}초 안에 완료되지 않음")
+                        f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+                verifyDownload(res.headers, size, digest)
+                os.replace(tmpPath, path)
+            except BaseException:
+                for p in (tmpPath, path):
+                    if os.path.exists(p):
+                        os.remove(p)
+                raise
+
+            limiter.success(req["url"])
+            log.debug(f"스트리밍 다운로드 완료: {path} ({size} bytes)")
+            return {"path": path, "size": size, "sha256": digest.hexdigest()}
+        finally:
+            res.release_conn()
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def downloadRequestOf(attrs: Dict[str, Any], baseUrl: str) -> Optional[DownloadRequest]:
+    """다운로드 버튼의 속성(href, onclick, 속한 form)만으로 요청을 만든다, 알 수 없으면 None"""
+    href = attrs.get("href") or ""
+    if re.match(r"(https?:|/)", href):
+        return {"method": "GET", "url": urljoin(baseUrl, href), "fields": []}
+    form = attrs.get("form")
+    if form:
+        return {
+            "method": form["method"],
+            "url": form["url"],
+            "fields": [(k, v) for k, v in form["fields"]],
+        }
+    code = attrs.get("onclick") or ""
+    if href.startswith("javascript:"):
+        code = f"{code} {href[len('javascript:'):]}"
+    m = URL_LITERAL.search(code)
+    if m:
+        return {"method": "GET", "url": urljoin(baseUrl, m.group(1)), "fields": []}
+    return None
+
+
+def isTimeout(e: BaseException) -> bool:
+    return isinstance(e, (TimeoutError, urllib3.exceptions.TimeoutError))
+
+
+def reserveFilePath(destDir: str, fileName: str) -> str:
+    # Chrome과 같은 규칙으로 "이름 (1).ext" 형태의 중복 회피
+    stem, ext = os.path.splitext(fileName)
+    with nameLock:
+        for n in range(0, 1000):
+            candidate = fileName if n == 0 else f"{stem} ({n}){ext}"
+            path = os.path.join(destDir, candidate)
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return path
+            except FileExistsError:
+                continue
+    raise OSError(f"파일명 예약 실패: {fileName}")
+
+
+def verifyDownload(headers, size: int, digest) -> None:
+    expected = headers.get("Content-Length")
+    if expected is not None and headers.get("Content-Encoding") is None:
+        if int(expected) != size:
+            raise OSError(f"파일 크기 불일치: {size} / {expected}")
+    if size == 0:
+        raise OSError("빈 파일 응답")
+    # 서버가 체크섬을 제공하는 경우에만 비교 (RFC 3230 Digest)
+    for part in (headers.get("Digest") or "").split(","):
+        algo, _, value = part.strip().partition("=")
+        if algo.lower() == "sha-256" and value:
+            if base64.b64decode(value) != digest.digest():
+                raise OSError("체크섬 불일치")
+
+
+def fileNameOf(disposition: Optional[str], url: str) -> str:
+    name = ""
+    if disposition:
+        m = re.search(r"filename\*\s*=\s*([^']*)'[^']*'([^;]+)", disposition, re.I)
+        if m:
+            name = unquote(m.group(2).strip(), encoding=m.group(1) or "utf-8")
+        else:
+            m = re.search(r'filename\s*=\s*"?([^";]+)"?', disposition, re.I)
+            if m:
+                name = decodeHeaderValue(m.group(1).strip())
+    if not name:
+        name = unquote(os.path.basename(urlparse(url).path)) or "download"
+    name = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", os.path.basename(name)).strip()
+    return name or "download"
+
+
+def decodeHeaderValue(value: str) -> str:
+    # http.client는 헤더를 latin-1로 디코딩하므로 원래 바이트로 되돌려 재해석
+    try:
+        raw = value.encode("latin-1")
+    except UnicodeEncodeError:
+        return unquote(value)
+    for encoding in ("utf-8", "cp949"):
+        try:
+            return unquote(raw.decode(encoding), encoding=encoding)
+        except UnicodeDecodeError:
+            continue
+    return unquote(value)
@@ -0,0 +1,256 @@
+from selenium import webdriver
+from selenium.common.exceptions import (
+    NoSuchDriverException,
+    SessionNotCreatedException,
+    WebDriverException,
+)
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+from typing import Dict, Optional, Tuple
+from constants.index import (
+    DRIVER_BACKOFF_BASE,
+    DRIVER_BACKOFF_MAX,
+    DRIVER_CACHE_PATH,
+    DRIVER_START_ATTEMPTS,
+)
+from classes.Logger import log
+from classes.Profiler import profiler
+import atexit
+import json
+import os
+import random
+import threading
+import time
+
+# 드라이버/브라우저 버전이 맞지 않거나 경로가 사라진 경우 -> 경로를 다시 찾으면 해결될 수 있음
+STALE_MARKERS = (
+    "only supports chrome version",
+    "cannot find chrome binary",
+    "no chrome binary",
+    "not a valid file",
+    "unable to obtain driver",
+)
+# 다시 찾아도 해결되지 않는 오류
+FATAL_MARKERS = ("permission denied", "exec format error", "bad cpu type")
+
+
+class DriverStartError(Exception):
+    """드라이버 기동 실패. fatal이면 재시도해도 소용없는 오류(버전 불일치, 실행 파일 문제 등)"""
+
+    def __init__(self, message: str, fatal: bool = False) -> None:
+        super().__init__(message)
+        self.fatal = fatal
+
+
+class SharedService(Service):
+    """
+    여러 Chrome 세션이 함께 쓰는 chromedriver 프로세스.
+    driver.quit()이 부르는 stop()은 무시하고, 프로세스 종료 시 shutdown()으로 정리한다.
+    """
+
+    def __init__(self, executablePath: str) -> None:
+        super().__init__(executable_path=executablePath)
+        self.lock = threading.Lock()
+
+    def isRunning(self) -> bool:
+        process = getattr(self, "process", None)
+        return process is not None and process.poll() is None
+
+    def start(self) -> None:
+        with self.lock:
+            if not self.isRunning():
+                super().start()
+
+    def stop(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        with self.lock:
+            super().stop()
+
+
+class DriverFactory:
+    """
+    chromedriver/Chrome 경로를 캐시하고, 공유 Service로 Chrome 세션을 띄운다.
+    기동 실패는 지터를 섞은 지수 백오프로 DRIVER_START_ATTEMPTS번까지만 재시도하고,
+    버전 불일치처럼 재시도로 해결되지 않는 오류는 바로 DriverStartError(fatal)로 올린다.
+    """
+
+    def __init__(self, cachePath: str = DRIVER_CACHE_PATH) -> None:
+        self.cachePath = cachePath
+        self.lock = threading.Lock()
+        self.paths: Optional[Dict[str, str]] = None
+        self.service: Optional[SharedService] = None
+        atexit.register(self.shutdown)
+
+    def resolve(self) -> Dict[str, str]:
+        with self.lock:
+            if self.paths:
+                return self.paths
+            cached = self.readCache()
+            if cached:
+                self.paths = cached
+                return cached
+            with profiler.span("driver.resolve"):
+                output = SeleniumManager().binary_paths(["--browser", "chrome"])
+            paths = {
+                "driverPath": output.get("driver_path", ""),
+                "browserPath": output.get("browser_path", ""),
+            }
+            if not os.path.isfile(paths["driverPath"]):
+                raise NoSuchDriverException(
+                    f"The driver path is not a valid file: {paths['driverPath']}"
+                )
+            self.writeCache(paths)
+            self.paths = paths
+            log.info(f"chromedriver 경로 확인: {paths['driverPath']}")
+            return paths
+
+    def readCache(self) -> Optional[Dict[str, str]]:
+        try:
+            with open(self.cachePath, encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Chrome/드라이버가 업데이트되어 파일이 바뀌었으면 다시 찾는다
+        for key in ("driverPath", "browserPath"):
+            path = cached.get(key) or ""
+            if path and (
+                not os.path.isfile(path) or mtimeOf(path) != cached.get(f"{key}Mtime")
+            ):
+                return None
+        if not cached.get("driverPath"):
+            return None
+        profiler.count("driver.cacheHit")
+        return {
+            "driverPath": cached["driverPath"],
+            "browserPath": cached.get("browserPath", ""),
+        }
+
+    def writeCache(self, paths: Dict[str, str]) -> None:
+        data = {**paths, "resolvedAt": time.time()}
+        for key in ("driverPath", "browserPath"):
+            if paths[key]:
+                data[f"{key}Mtime"] = mtimeOf(paths[key])
+        try:
+            os.makedirs(os.path.dirname(self.cachePath), exist_ok=True)
+            tmpPath = f"{self.cachePath}.tmp"
+            with open(tmpPath, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmpPath, self.cachePath)
+        except OSError as e:
+            log.warn(f"드라이버 경로 캐시 저장 실패: {e}")
+
+    def invalidate(self) -> None:
+        with self.lock:
+            self.paths = None
+            service, self.service = self.service, None
+        if service:
+            service.shutdown()
+        try:
+            os.remove(self.cachePath)
+        except OSError:
+            pass
+
+    def ensureService(self) -> Tuple[SharedService, str]:
+        paths = self.resolve()
+        with self.lock:
+            if self.service is None or self.service.path != paths["driverPath"]:
+                if self.service:
+                    self.service.shutdown()
+                self.service = SharedService(paths["driverPath"])
+            service = self.service
+        service.start()
+        return service, paths["browserPath"]
+
+    def prestart(self) -> None:
+        # 경로 확인과 chromedriver 기동을 미리 해두고, 실패하면 create에서 다시 시도
+        def run() -> None:
+            try:
+                with profiler.span("driver.prestart"):
+                    self.ensureService()
+            except Exception as e:
+                log.debug(f"chromedriver 사전 기동 실패: {e}")
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def create(self, options: Options) -> webdriver.Chrome:
+        refreshed = False
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                service, browserPath = self.ensureService()
+                if browserPath:
+                    options.binary_location = browserPath
+                with profiler.span("driver.start"):
+                    return webdriver.Chrome(options=options, service=service)
+            except (WebDriverException, OSError, ValueError) as e:
+                kind = classifyError(e)
+                if kind == "stale" and not refreshed:
+                    # Chrome 업데이트 등으로 캐시된 경로가 맞지 않으면 한 번만 다시 찾는다
+                    log.warn(f"드라이버 경로를 다시 확인합니다: {firstLine(e)}")
+                    profiler.count("retry.driverResolve")
+                    self.invalidate()
+                    refreshed = True
+                    continue
+                if kind != "transient":
+                    profiler.count("driver.fatal")
+                    raise DriverStartError(
+                        f"Chrome 드라이버를 시작할 수 없습니다: {firstLine(e)}",
+                        fatal=True,
+                    ) from e
+                if attempt >= DRIVER_START_ATTEMPTS:
+                    raise DriverStartError(
+                        f"Chrome 드라이버 초기화 {attempt}회 실패: {firstLine(e)}"
+                    ) from e
+                delay = backoffDelay(attempt)
+                profiler.count("retry.driverStart")
+                log.warn(
+                    f"Chrome 드라이버 초기화 실패 ({attempt}/{DRIVER_START_ATTEMPTS}), "
+                    f"{delay:.1f}초 후 재시도: {firstLine(e)}"
+                )
+                time.sleep(delay)
+
+    def shutdown(self) -> None:
+        with self.lock:
+            service, self.service = self.service, None
+        if service:
+            service.shutdown()
+
+
+def classifyError(e: BaseException) -> str:
+    # "stale": 경로를 다시 찾으면 해결될 수 있음, "fatal": 재시도 무의미, "transient": 백오프 후 재시도
+    message = str(e).lower()
+    if isinstance(e, PermissionError) or any(m in message for m in FATAL_MARKERS):
+        return "fatal"
+    if isinstance(e, (NoSuchDriverException, FileNotFoundError, ValueError)):
+        return "stale"
+    if any(m in message for m in STALE_MARKERS):
+        return "stale"
+    if isinstance(e, SessionNotCreatedException) and "version" in message:
+        return "stale"
+    return "transient"
+
+
+def backoffDelay(attempt: int) -> float:
+    # full jitter: 0 ~ min(최대, 시작 * 2^(n-1))
+    return random.uniform(
+        0, min(DRIVER_BACKOFF_MAX, DRIVER_BACKOFF_BASE * 2 ** (attempt - 1))
+    )
+
+
+def mtimeOf(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def firstLine(e: BaseException) -> str:
+    return (str(e).strip().splitlines() or [type(e).__name__])[0]
+
+
+# 프로세스 전역 드라이버 팩토리
+drivers = DriverFactory()
@@ -0,0 +1,44 @@
+from typing import Tuple
+
+
+class EngineOptions:
+    """
+    실행(작업) 단위 엔진 옵션. BrowserSession/Selenium에 넘겨서 브라우저마다 적용한다.
+    드라이버 팩토리(drivers)는 프로세스 전역이라 데몬의 작업마다 다른 값을 줄 수 없으므로 여기에 둔다.
+    """
+
+    def __init__(
+        self,
+        lean: bool = False,
+        httpDetail: bool = False,
+        downloadCapture: bool = False,
+        downloadEvents: bool = False,
+        listReplay: bool = False,
+    ) -> None:
+        # lean 프로필(리소스 차단, eager 로드)
+        self.lean = lean
+        # 상세 페이지를 HTTP로 먼저 읽을지 여부
+        self.httpDetail = httpDetail
+        # 다운로드 버튼의 요청을 읽어서 HTTP로 받을지 여부
+        self.downloadCapture = downloadCapture
+        # 클릭 다운로드 완료를 CDP 이벤트로 감지할지 여부
+        self.downloadEvents = downloadEvents
+        # 목록 다음 페이지 요청을 재현해서 페이지를 건너뛸지 여부
+        self.listReplay = listReplay
+
+    @classmethod
+    def fromArgs(cls, args) -> "EngineOptions":
+        return cls(
+            lean=args.lean == "true",
+            httpDetail=args.httpDetail == "true",
+            downloadCapture=args.downloadCapture == "true",
+            downloadEvents=args.downloadEvents == "true",
+            listReplay=args.listReplay == "true",
+        )
+
+    def launchKey(self) -> Tuple[bool, bool]:
+        # Chrome을 띄울 때 정해지는 옵션 (Chrome 인자, performance 로그), 바뀌면 브라우저를 새로 띄워야 함
+        return (self.lean, self.downloadEvents)
+
+    def __repr__(self) -> str:
+        return f"EngineOptions({vars(self)})"
@@ -1,8 +1,31 @@
 import os
+import pickle
+import sqlite3
+import time
+from copy import copy
+from io import BytesIO
+from math import ceil
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.drawing.image import Image as OpenpyxlImage
 from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.worksheet import Worksheet
-from typing import List, Optional, TypedDict, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+)
+from classes.Logger import log
+from classes.Profiler import profiler
+from classes.Screenshot import Shot
 
 
 class Data(TypedDict):
@@ -10,30 +33,63 @@ class Data(TypedDict):
     url: Optional[str]
 
 
-class ExcelHelper:
+HEADER = ["검색어", "기관명", "정보 제목", "단위 업무", "생산 일자", "파일 링크"]
+# 첨부파일 링크가 시작하는 열
+FILE_COLUMN = 6
+MISSING_TEXT = "누락된 파일이 존재합니다."
+# 검색 결과 페이지 스크린샷 썸네일 시트, 기본 행 높이(px) 기준으로 썸네일이 차지할 행 수를 계산
+SHOT_SHEET = "Images"
+SHOT_ROW_PX = 20
+
+
+class RowWriter:
+    """
+    크롤링 코드는 문서/결과 없음 기록을 addDocument/addNotFound로만 남긴다.
+    엑셀에 바로 쓰는 구현은 기존 setData/setHyperlink/notFoundData로 풀어서 기록한다.
+    """
+
+    def addDocument(self, query: str, organization: str, doc: Dict[str, Any]):
+        self.setData(
+            [
+                query,
+                organization,
+                {"text": doc["title"], "url": doc["detailUrl"]},
+                doc["workUnit"],
+                doc["prodDate"],
+            ]
+        )
+        # 다운로드한 파일 linking
+        self.setHyperlink(
+            doc["files"], col=FILE_COLUMN, hasMissingDownloads=bool(doc["hasMissing"])
+        )
+
+    def addNotFound(self, query: str, organization: str, message: str):
+        self.notFoundData(query, organization, message)
+
+
+class ExcelHelper(RowWriter):
     ws: Worksheet
     wb: Workbook
 
     def __init__(self, downloadDir: str, fileName: str, sheetName: str = "Sheet1"):
         self.path = os.path.join(downloadDir, fileName)
-        print(f"엑셀 파일명: {fileName}", flush=True)
+        self.shots: List[Shot] = []
+        log.info(f"엑셀 파일명: {fileName}")
         if os.path.exists(self.path):
             self.wb = load_workbook(self.path)
             if sheetName in self.wb.sheetnames:
                 self.ws = self.wb[sheetName]
             else:
                 self.ws = self.wb.create_sheet(sheetName)
-            print(f"Excel 데이터 로드 완료, {self.path}", flush=True)
+            log.info(f"Excel 데이터 로드 완료, {self.path}")
         else:
             self.wb = Workbook()
             activeWs = self.wb.active
             assert isinstance(activeWs, Worksheet)
             self.ws = activeWs
             self.ws.title = sheetName
-            self.setData(
-                ["검색어", "기관명", "정보 제목", "단위 업무", "생산 일자", "파일 링크"]
-            )
-            print(f"Excel 데이터 생성 완료, {self.path}", flush=True)
+            self.setData(list(HEADER))
+            log.info(f"Excel 데이터 생성 완료, {self.path}")
 
     def setData(self, datas: List[Union[Data, str]]):
         nextRow = self.ws.max_row + 1
@@ -50,13 +106,13 @@ class ExcelHelper:
                 cell.hyperlink = url  # type: ignore
                 cell.style = "Hyperlink"
 
-            print(f"{nextRow}_{idx + 1}에 {text} 삽입 완료", flush=True)
+            log.debug(f"{nextRow}_{idx + 1}에 {text} 삽입 완료")
 
     def notFoundData(self, query, organization, text):
         nextRow = self.ws.max_row + 1
         data = [query, organization, text]
         self.ws.append(data)
-        print(f"{nextRow}에 {query}-{organization}-{text} 삽입 완료", flush=True)
+        log.debug(f"{nextRow}에 {query}-{organization}-{text} 삽입 완료")
 
     def setHyperlink(
         self,
@@ -75,25 +131,60 @@ class ExcelHelper:
                 cell.value = displayText  # type: ignore
                 cell.hyperlink = path  # type: ignore
                 cell.style = "Hyperlink"
-                print(
+                log.debug(
                     f"Excel에 {os.path.abspath(link)} 파일 연결 완료",
-                    flush=True,
                 )
             else:
-                print(f"링크 대상 파일을 찾을 수 없습니다: {link}", flush=True)
+                log.warn(f"링크 대상 파일을 찾을 수 없습니다: {link}")
                 missingFile = True
 
         if hasMissingDownloads or missingFile:
             warnCell = self.ws.cell(row=row, column=col + len(fileLinks))
-            warnCell.value = "누락된 파일이 존재합니다."  # type: ignore
+            warnCell.value = MISSING_TEXT  # type: ignore
             warnCell.font = Font(color="FFFF0000")
 
+    def rowCount(self) -> int:
+        return self.ws.max_row
+
+    def truncate(self, rowCount: int):
+        # 중단된 실행이 남긴 행 제거 (기록으로 다시 채움)
+        if self.ws.max_row > rowCount:
+            self.ws.delete_rows(rowCount + 1, self.ws.max_row - rowCount)
+
+    def addScreenshot(self, shot: Shot):
+        # 썸네일은 백그라운드에서 만들어지므로 저장할 때 시트에 붙인다
+        self.shots.append(shot)
+
+    def appendScreenshots(self):
+        if SHOT_SHEET in self.wb.sheetnames:
+            ws = self.wb[SHOT_SHEET]
+            row = ws.max_row + 1 if ws.max_row > 1 else 1
+        else:
+            ws = self.wb.create_sheet(SHOT_SHEET)
+            row = 1
+        pending = []
+        for shot in self.shots:
+            if not os.path.exists(shot["thumbnail"]):
+                pending.append(shot)
+                continue
+            link = ws.cell(row=row, column=1, value="원본 보기")
+            link.hyperlink = f"file:///{os.path.abspath(shot['original'])}"
+            link.style = "Hyperlink"
+            ws.cell(row=row, column=2, value=shot["name"])
+            img = OpenpyxlImage(shot["thumbnail"])
+            ws.add_image(img, f"C{row}")
+            row += ceil(img.height / SHOT_ROW_PX) + 1
+        self.shots = pending
+
+    @profiler.timed("excel.save")
     def save(self):
         directory = os.path.dirname(self.path)
         if directory and not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
+        if self.shots:
+            self.appendScreenshots()
         self.wb.save(self.path)
-        print(f"{directory}에 Excel 저장 완료", flush=True)
+        log.info(f"{directory}에 Excel 저장 완료")
 
     def pretterColumns(self):
         ws = self.ws
@@ -108,3 +199,419 @@ class ExcelHelper:
                     pass
             adjusted_width = (max_length + 2) * 2
             ws.column_dimensions[column_letter].width = adjusted_width
+
+
+class RowBuffer:
+    """
+    워커가 수집한 결과를 순서대로 기록해 두었다가 결과 저장소/엑셀에 재생한다.
+    여러 워커가 하나의 엑셀 파일에 동시에 쓰지 않도록 하기 위함.
+    """
+
+    def __init__(self):
+        self.ops: List[Tuple[str, tuple]] = []
+
+    def addDocument(self, query: str, organization: str, doc: Dict[str, Any]):
+        self.ops.append(("addDocument", (query, organization, doc)))
+
+    def addNotFound(self, query: str, organization: str, message: str):
+        self.ops.append(("addNotFound", (query, organization, message)))
+
+    def addScreenshot(self, shot: Shot):
+        self.ops.append(("addScreenshot", (shot,)))
+
+    def replay(self, excel: Any):
+        for name, args in self.ops:
+            getattr(excel, name)(*args)
+
+
+# (값, 하이퍼링크, 스타일) 스타일은 None / "link" / "warn", 값은 엑셀에서 읽은 타입 그대로
+SpoolCell = Tuple[Any, Optional[str], Optional[str]]
+
+
+def textLength(value: Any) -> int:
+    return 0 if value is None else len(str(value))
+
+
+class RowSpool:
+    """
+    결과 시트 행을 임시 SQLite 파일에 쌓아 두는 스풀. 메모리에는 마지막 행만 두고 수정한다.
+    셀 값은 pickle로 보관해서 숫자/날짜 타입이 그대로 유지된다.
+    """
+
+    def __init__(self) -> None:
+        # 빈 경로는 연결을 닫을 때 지워지는 임시 파일 DB
+        self.conn = sqlite3.connect("", check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE rows (position INTEGER PRIMARY KEY, cells BLOB NOT NULL)"
+        )
+        self.count = 0
+        self.tail: Optional[List[SpoolCell]] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, row: List[SpoolCell]) -> None:
+        if self.tail is not None:
+            self.conn.execute(
+                "INSERT INTO rows (position, cells) VALUES (?, ?)",
+                (self.count, pickle.dumps(self.tail)),
+            )
+        self.tail = row
+        self.count += 1
+
+    def last(self) -> List[SpoolCell]:
+        if self.tail is None:
+            # truncate 뒤에는 마지막 행을 DB에서 다시 꺼내 옴
+            record = self.conn.execute(
+                "SELECT cells FROM rows WHERE position = ?", (self.count,)
+            ).fetchone()
+            self.conn.execute("DELETE FROM rows WHERE position = ?", (self.count,))
+            self.tail = pickle.loads(record[0])
+        return self.tail
+
+    def truncate(self, rowCount: int) -> None:
+        if rowCount >= self.count:
+            return
+        self.conn.execute("DELETE FROM rows WHERE position > ?", (rowCount,))
+        self.count = rowCount
+        self.tail = None
+
+    def __iter__(self) -> Iterator[List[SpoolCell]]:
+        for (cells,) in self.conn.execute("SELECT cells FROM rows ORDER BY position"):
+            yield pickle.loads(cells)
+        if self.tail is not None:
+            yield self.tail
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class StreamingExcelHelper(RowWriter):
+    """
+    실행 전체에서 하나의 결과 시트를 유지한다.
+    행은 디스크 스풀에 쌓고 열 너비는 추가될 때마다 갱신하며,
+    파일은 openpyxl write-only 모드로 마지막에 한 번(또는 체크포인트마다) 기록한다.
+    기존 파일의 다른 시트는 실행 시작 시 읽어 두었다가 저장할 때 그대로 옮겨 쓴다.
+    """
+
+    def __init__(
+        self,
+        downloadDir: str,
+        fileName: str,
+        sheetName: str = "Sheet1",
+        checkpointInterval: float = 0,
+    ):
+        self.path = os.path.join(downloadDir, fileName)
+        self.sheetName = sheetName
+        self.checkpointInterval = checkpointInterval
+        self.lastSavedAt = time.monotonic()
+        self.rows = RowSpool()
+        self.widths: Dict[int, int] = {}
+        # 결과 시트 외의 시트와 결과 시트의 원래 위치
+        self.others: List[Worksheet] = []
+        self.position = 0
+        # 같은 이름으로 다시 캡처하면 최신 것으로 교체
+        self.shots: Dict[str, Shot] = {}
+        log.info(f"엑셀 파일명: {fileName}")
+        if os.path.exists(self.path):
+            self.loadExisting()
+            log.info(f"Excel 데이터 로드 완료, {self.path}")
+        else:
+            self.setData(list(HEADER))
+            log.info(f"Excel 데이터 생성 완료, {self.path}")
+
+    def loadExisting(self):
+        # 기존 파일은 실행 시작 시 한 번만 읽어서 결과 시트는 스풀로 옮기고 나머지 시트는 보관
+        wb = load_workbook(self.path)
+        if self.sheetName in wb.sheetnames:
+            self.position = wb.sheetnames.index(self.sheetName)
+            for row in spoolRowsOf(wb[self.sheetName]):
+                self.appendRow(row)
+            del wb[self.sheetName]
+        else:
+            self.position = len(wb.sheetnames)
+        self.others = list(wb.worksheets)
+
+    def appendRow(self, row: List[SpoolCell]):
+        self.rows.append(row)
+        for idx, (value, _, _) in enumerate(row, start=1):
+            self.trackWidth(idx, value)
+
+    def rowCount(self) -> int:
+        return len(self.rows)
+
+    def truncate(self, rowCount: int):
+        # 중단된 실행이 남긴 행 제거 (기록으로 다시 채움)
+        self.rows.truncate(rowCount)
+        self.widths = {}
+        for row in self.rows:
+            for idx, (value, _, _) in enumerate(row, start=1):
+                self.trackWidth(idx, value)
+
+    def trackWidth(self, col: int, value: Any):
+        length = textLength(value)
+        if length > self.widths.get(col, 0):
+            self.widths[col] = length
+
+    def setData(self, datas: List[Union[Data, str]]):
+        row: List[SpoolCell] = []
+        for data in datas:
+            if isinstance(data, str):
+                row.append((data, None, None))
+            else:
+                url = data["url"]
+                row.append((data["text"], url, "link" if url else None))
+        self.appendRow(row)
+        log.debug(f"{len(self.rows)}행에 {len(row)}개 값 삽입 완료")
+
+    def notFoundData(self, query, organization, text):
+        self.appendRow(
+            [(query, None, None), (organization, None, None), (text, None, None)]
+        )
+        log.debug(f"{len(self.rows)}에 {query}-{organization}-{text} 삽입 완료")
+
+    def setCell(self, col: int, cell: SpoolCell):
+        row = self.rows.last()
+        while len(row) < col:
+            row.append((None, None, None))
+        row[col - 1] = cell
+        self.trackWidth(col, cell[0])
+
+    def setHyperlink(
+        self,
+        fileLinks: List,
+        col: int,
+        displayText: str = "바로가기",
+        hasMissingDownloads: bool = False,
+    ):
+        missingFile = False
+
+        for idx, link in enumerate(fileLinks, start=0):
+            if os.path.exists(link):
+                path = f"file:///{os.path.abspath(link)}"
+                self.setCell(col + idx, (displayText, path, "link"))
+                log.debug(f"Excel에 {os.path.abspath(link)} 파일 연결 완료")
+            else:
+                log.warn(f"링크 대상 파일을 찾을 수 없습니다: {link}")
+                missingFile = True
+
+        if hasMissingDownloads or missingFile:
+            self.setCell(col + len(fileLinks), (MISSING_TEXT, None, "warn"))
+
+    def addScreenshot(self, shot: Shot):
+        self.shots.pop(shot["name"], None)
+        self.shots[shot["name"]] = shot
+
+    def pretterColumns(self):
+        # 열 너비는 행이 추가될 때마다 계산되므로 별도 스캔 불필요
+        pass
+
+    def maybeCheckpoint(self):
+        if not self.checkpointInterval:
+            return
+        if time.monotonic() - self.lastSavedAt >= self.checkpointInterval:
+            log.debug("Excel 체크포인트 저장")
+            self.save()
+
+    @profiler.timed("excel.save")
+    def save(self):
+        writeWorkbook(
+            self.path,
+            self.sheetName,
+            self.rows,
+            self.widths,
+            self.shots.values(),
+            others=self.others,
+            position=self.position,
+        )
+        self.lastSavedAt = time.monotonic()
+        log.info(f"{os.path.dirname(self.path)}에 Excel 저장 완료")
+
+
+def spoolRowsOf(ws: Worksheet) -> Iterator[List[SpoolCell]]:
+    # 하이퍼링크/빨간 경고 글씨까지 (값, 링크, 스타일)로 읽음, 끝의 빈 칸은 버림
+    for row in ws.iter_rows():
+        spoolRow: List[SpoolCell] = []
+        for cell in row:
+            url = cell.hyperlink.target if cell.hyperlink else None
+            style = "link" if url else None
+            if cell.font and cell.font.color and cell.font.color.rgb == "FFFF0000":
+                style = "warn"
+            spoolRow.append((cell.value, url, style))
+        while spoolRow and spoolRow[-1] == (None, None, None):
+            spoolRow.pop()
+        yield spoolRow
+
+
+def readSpoolRows(path: str, sheetName: str) -> Iterator[List[SpoolCell]]:
+    wb = load_workbook(path)
+    try:
+        if sheetName in wb.sheetnames:
+            yield from spoolRowsOf(wb[sheetName])
+    finally:
+        wb.close()
+
+
+def readOtherSheets(
+    path: str, sheetName: str, exclude: Sequence[str] = ()
+) -> Tuple[List[Worksheet], int]:
+    """
+    결과 시트와 exclude를 뺀 나머지 시트, 그 사이에서 결과 시트의 위치를 반환.
+    옮길 시트가 없으면 시트 이름만 보고 전체 워크북은 읽지 않는다
+    """
+    wb = load_workbook(path, read_only=True)
+    names = wb.sheetnames
+    wb.close()
+    keep = [name for name in names if name != sheetName and name not in exclude]
+    if sheetName in names:
+        position = len(
+            [name for name in names[: names.index(sheetName)] if name in keep]
+        )
+    else:
+        position = len(keep)
+    if not keep:
+        return [], 0
+    wb = load_workbook(path)
+    return [wb[name] for name in keep], position
+
+
+def copySheet(src: Worksheet, dst: Any) -> None:
+    """
+    기존 시트의 값/서식/하이퍼링크/메모/병합/이미지/차트를 write-only 시트로 옮긴다.
+    write-only 시트는 행을 쓰기 전에 행/열 크기를 지정해야 함
+    """
+    for key, dim in src.column_dimensions.items():
+        if dim.width:
+            dst.column_dimensions[key].width = dim.width
+        if dim.hidden:
+            dst.column_dimensions[key].hidden = True
+    for idx, dim in src.row_dimensions.items():
+        if dim.height:
+            dst.row_dimensions[idx].height = dim.height
+    dst.freeze_panes = src.freeze_panes
+    dst.sheet_state = src.sheet_state
+    for row in src.iter_rows():
+        cells = []
+        for cell in row:
+            out = WriteOnlyCell(dst, value=cell.value)
+            if cell.has_style:
+                out.font = copy(cell.font)
+                out.fill = copy(cell.fill)
+                out.border = copy(cell.border)
+                out.alignment = copy(cell.alignment)
+                out.protection = copy(cell.protection)
+                out.number_format = cell.number_format
+            if cell.hyperlink:
+                out.hyperlink = copy(cell.hyperlink)
+            if cell.comment:
+                out.comment = copy(cell.comment)
+            cells.append(out)
+        dst.append(cells)
+    for merged in src.merged_cells.ranges:
+        dst.merged_cells.add(str(merged))
+    for img in src._images:
+        dst.add_image(cloneImage(img))
+    for chart in src._charts:
+        dst.add_chart(chart)
+
+
+def cloneImage(img: OpenpyxlImage) -> OpenpyxlImage:
+    # openpyxl은 저장하면서 이미지 스트림을 닫으므로, 원본은 바이트로 되돌려 두고 복제본을 붙인다
+    data = img._data()
+    img.ref = BytesIO(data)
+    clone = OpenpyxlImage(BytesIO(data))
+    clone.anchor = img.anchor
+    clone.width, clone.height = img.width, img.height
+    return clone
+
+
+def appendShots(sheet: Any, shots: Iterable[Shot], shotRow: int) -> None:
+    for shot in shots:
+        if not os.path.exists(shot["thumbnail"]):
+            continue
+        link = WriteOnlyCell(sheet, value="원본 보기")
+        link.hyperlink = f"file:///{os.path.abspath(shot['original'])}"
+        link.style = "Hyperlink"
+        sheet.append([link, shot["name"]])
+        img = OpenpyxlImage(shot["thumbnail"])
+        sheet.add_image(img, f"C{shotRow}")
+        # 썸네일 높이만큼 빈 행을 두고 다음 스크린샷
+        rows = ceil(img.height / SHOT_ROW_PX)
+        for _ in range(rows):
+            sheet.append([])
+        shotRow += rows + 1
+
+
+def writeWorkbook(
+    path: str,
+    sheetName: str,
+    rows: Iterable[List[SpoolCell]],
+    widths: Dict[int, int],
+    shots: Iterable[Shot] = (),
+    others: Sequence[Worksheet] = (),
+    position: int = 0,
+) -> None:
+    """
+    openpyxl write-only 모드로 한 번에 기록, widths는 열별 최대 글자 수.
+    others는 결과 시트 외에 그대로 옮길 기존 시트, position은 그 사이에서 결과 시트의 순서.
+    shots는 원본 링크와 함께 썸네일만 Images 시트에 넣는다 (아직 처리 중인 스크린샷은 건너뜀)
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+
+    wb = Workbook(write_only=True)
+    sheets: List[Optional[Worksheet]] = list(others)
+    # None 자리에 결과 시트를 씀
+    sheets.insert(min(position, len(sheets)), None)
+    shots = [shot for shot in shots if os.path.exists(shot["thumbnail"])]
+    shotsWritten = False
+    for src in sheets:
+        if src is not None:
+            dst = wb.create_sheet(src.title)
+            copySheet(src, dst)
+            if src.title == SHOT_SHEET and shots:
+                # 기존 Images 시트에서 옮긴 행 뒤에 이어서 붙임
+                appendShots(dst, shots, src.max_row + 1)
+                shotsWritten = True
+            continue
+        ws = wb.create_sheet(sheetName)
+        # write-only 시트는 행을 쓰기 전에 열 너비를 지정해야 함
+        for col, length in widths.items():
+            ws.column_dimensions[get_column_letter(col)].width = (length + 2) * 2
+        warnFont = Font(color="FFFF0000")
+        for row in rows:
+            cells = []
+            for value, url, style in row:
+                cell = WriteOnlyCell(ws, value=value)
+                if url:
+                    cell.hyperlink = url
+                if style == "link":
+                    cell.style = "Hyperlink"
+                elif style == "warn":
+                    cell.font = warnFont
+                cells.append(cell)
+            ws.append(cells)
+
+    if shots and not shotsWritten:
+        shotSheet = wb.create_sheet(SHOT_SHEET)
+        shotSheet.column_dimensions["B"].width = 40
+        appendShots(shotSheet, shots, 1)
+
+    # 저장 도중 중단되어도 기존 파일이 깨지지 않도록 임시 파일에 쓰고 교체
+    tmpPath = f"{path}.tmp"
+    wb.save(tmpPath)
+    os.replace(tmpPath, path)
+
+
+ExcelSink = Union[ExcelHelper, StreamingExcelHelper, RowBuffer]
+
+
+def createExcel(
+    mode: str, downloadDir: str, fileName: str, checkpointInterval: float = 0
+) -> Union[ExcelHelper, StreamingExcelHelper]:
+    if mode == "legacy":
+        return ExcelHelper(downloadDir, fileName)
+    return StreamingExcelHelper(
+        downloadDir, fileName, checkpointInterval=checkpointInterval
+    )
@@ -0,0 +1,152 @@
+import os
+import shutil
+import sqlite3
+import threading
+from classes.Downloader import reserveFilePath
+from classes.Journal import fileSha256
+from typing import List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    sha256 TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS attachments (
+    prdnNstRgstNo TEXT NOT NULL,
+    prdnDt TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    fileName TEXT NOT NULL,
+    PRIMARY KEY (prdnNstRgstNo, prdnDt, idx)
+);
+CREATE TABLE IF NOT EXISTS links (
+    sha256 TEXT NOT NULL,
+    dir TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (sha256, dir)
+);
+"""
+
+
+class AttachmentStore:
+    """
+    첨부파일을 내용 해시(sha256) 기준으로 한 번만 저장하는 저장소.
+    문서 id + 첨부 순번으로 이미 받은 파일인지 먼저 확인하고,
+    각 작업 폴더에는 하드링크(불가능하면 저장소 경로)를 연결한다.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.objectsDir = os.path.join(root, "objects")
+        os.makedirs(self.objectsDir, exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(
+            os.path.join(root, "index.sqlite3"), check_same_thread=False
+        )
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+
+    def lookup(
+        self, prdnNstRgstNo: str, prdnDt: str, count: int
+    ) -> Optional[List[str]]:
+        """문서의 첨부 count개가 모두 저장되어 있으면 sha256 목록을 순번대로 반환"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT a.idx, a.sha256 FROM attachments a JOIN objects o USING (sha256) "
+                "WHERE a.prdnNstRgstNo = ? AND a.prdnDt = ? ORDER BY a.idx",
+                (prdnNstRgstNo, prdnDt),
+            ).fetchall()
+        hashes = [sha for idx, sha in rows if idx < count]
+        if count == 0 or len(hashes) != count:
+            return None
+        return hashes
+
+    def ingest(
+        self,
+        path: str,
+        prdnNstRgstNo: Optional[str] = None,
+        prdnDt: Optional[str] = None,
+        idx: Optional[int] = None,
+    ) -> str:
+        """다운로드한 파일을 저장소로 옮기고, 원래 위치에는 링크를 남긴다"""
+        sha256 = fileSha256(path)
+        if sha256 is None:
+            return path
+        fileName = os.path.basename(path)
+        with self.lock, self.conn:
+            row = self.conn.execute(
+                "SELECT path FROM objects WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+            if row and os.path.exists(row[0]):
+                objectPath = row[0]
+            else:
+                objectPath = os.path.join(self.objectsDir, sha256[:2], sha256, fileName)
+                os.makedirs(os.path.dirname(objectPath), exist_ok=True)
+                shutil.copyfile(path, objectPath)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO objects VALUES (?, ?, ?)",
+                    (sha256, objectPath, os.path.getsize(objectPath)),
+                )
+            if prdnNstRgstNo is not None and prdnDt is not None and idx is not None:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO attachments VALUES (?, ?, ?, ?, ?)",
+                    (prdnNstRgstNo, prdnDt, idx, sha256, fileName),
+                )
+            dirPath = os.path.dirname(path)
+            linked = self.conn.execute(
+                "SELECT path FROM links WHERE sha256 = ? AND dir = ?", (sha256, dirPath)
+            ).fetchone()
+            if linked and linked[0] != path and os.path.exists(linked[0]):
+                # 같은 폴더에 이미 같은 내용의 파일이 있으면 중복본 제거
+                os.remove(path)
+                return linked[0]
+            if not replaceWithLink(objectPath, path):
+                # 하드링크를 지원하지 않으면 중복본을 지우고 저장소 경로를 사용
+                os.remove(path)
+                return objectPath
+            self.conn.execute(
+                "INSERT OR REPLACE INTO links VALUES (?, ?, ?)",
+                (sha256, dirPath, path),
+            )
+        return path
+
+    def materialize(self, sha256: str, destDir: str) -> Optional[str]:
+        """저장된 파일을 destDir에 연결하고 엑셀에 걸 경로를 반환"""
+        with self.lock, self.conn:
+            row = self.conn.execute(
+                "SELECT path FROM objects WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+            if row is None or not os.path.exists(row[0]):
+                return None
+            objectPath = row[0]
+            linked = self.conn.execute(
+                "SELECT path FROM links WHERE sha256 = ? AND dir = ?", (sha256, destDir)
+            ).fetchone()
+            if linked and os.path.exists(linked[0]):
+                return linked[0]
+            path = reserveFilePath(destDir, os.path.basename(objectPath))
+            if not replaceWithLink(objectPath, path):
+                # 하드링크를 지원하지 않는 파일시스템이면 저장소 경로를 직접 사용
+                os.remove(path)
+                return objectPath
+            self.conn.execute(
+                "INSERT OR REPLACE INTO links VALUES (?, ?, ?)", (sha256, destDir, path)
+            )
+            return path
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+def replaceWithLink(objectPath: str, path: str) -> bool:
+    tmpPath = f"{path}.link"
+    try:
+        os.link(objectPath, tmpPath)
+        os.replace(tmpPath, path)
+        return True
+    except OSError:
+        if os.path.exists(tmpPath):
+            os.remove(tmpPath)
+        return False
@@ -0,0 +1,101 @@
+import json
+import urllib3
+from selenium.webdriver.remote.webdriver import WebDriver
+from typing import Dict, List, Optional, Tuple
+from classes.Logger import log
+from classes.RateLimiter import limiter
+
+
+class HttpSession:
+    """
+    브라우저 세션의 쿠키를 공유하는 keep-alive HTTP 커넥션 풀.
+    JS 렌더링이 필요 없는 페이지는 탭을 열지 않고 바로 받아온다.
+    """
+
+    def __init__(self, maxsize: int = 4, timeout: float = 10) -> None:
+        self.pool = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=maxsize,
+            block=False,
+            timeout=urllib3.Timeout(connect=5, read=timeout),
+            retries=urllib3.Retry(total=2, backoff_factor=0.5),
+        )
+        self.cookies: Dict[str, str] = {}
+        self.userAgent: Optional[str] = None
+
+    def syncCookies(self, driver: WebDriver) -> None:
+        self.cookies = {c["name"]: c["value"] for c in driver.get_cookies()}
+        if self.userAgent is None:
+            self.userAgent = driver.execute_script("return navigator.userAgent")
+        log.debug(f"HTTP 세션 쿠키 동기화 완료 ({len(self.cookies)}개)")
+
+    def headers(self, referer: Optional[str] = None) -> Dict[str, str]:
+        headers = {"Accept-Language": "ko-KR,ko;q=0.9"}
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+        if self.userAgent:
+            headers["User-Agent"] = self.userAgent
+        if referer:
+            headers["Referer"] = referer
+        return headers
+
+    def getText(self, url: str, referer: Optional[str] = None) -> Optional[str]:
+        limiter.acquire(url)
+        try:
+            res = self.pool.request("GET", url, headers=self.headers(referer))
+        except urllib3.exceptions.HTTPError as e:
+            log.warn(f"HTTP 요청 실패: {url} ({e})")
+            limiter.failure(url, "error")
+            return None
+        return decodeResponse(res, url)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        fields: List[Tuple[str, str]],
+        referer: Optional[str] = None,
+        jsonBody: bool = False,
+    ) -> Optional[str]:
+        headers = self.headers(referer)
+        headers["X-Requested-With"] = "XMLHttpRequest"
+        limiter.acquire(url)
+        try:
+            if method == "GET":
+                res = self.pool.request("GET", url, fields=fields, headers=headers)
+            elif jsonBody:
+                headers["Content-Type"] = "application/json; charset=UTF-8"
+                res = self.pool.request(
+                    method, url, body=json.dumps(dict(fields)), headers=headers
+                )
+            else:
+                res = self.pool.request(
+                    method, url, fields=fields, headers=headers, encode_multipart=False
+                )
+        except urllib3.exceptions.HTTPError as e:
+            log.warn(f"HTTP 요청 실패: {url} ({e})")
+            limiter.failure(url, "error")
+            return None
+        return decodeResponse(res, url)
+
+    def close(self) -> None:
+        self.pool.clear()
+
+
+def decodeResponse(res: urllib3.BaseHTTPResponse, url: str) -> Optional[str]:
+    # 5xx/429는 서버 과부하로 보고 속도를 낮춘다
+    limiter.report(url, res.status)
+    if res.status != 200:
+        log.warn(f"HTTP 응답 코드 {res.status}: {url}")
+        return None
+    return res.data.decode(charsetOf(res.headers.get("Content-Type")), "replace")
+
+
+def charsetOf(contentType: Optional[str], default: str = "utf-8") -> str:
+    if not contentType:
+        return default
+    for part in contentType.split(";"):
+        key, _, value = part.strip().partition("=")
+        if key.lower() == "charset" and value:
+            return value.strip("\"'")
+    return default
@@ -0,0 +1,62 @@
+import json
+import os
+import threading
+from typing import Dict, Optional, TypedDict
+from classes.Logger import log
+from classes.RateLimiter import fileLock
+
+
+class Institution(TypedDict):
+    title: str
+    fields: Dict[str, str]
+
+
+class InstitutionCache:
+    """
+    (기관명, 지역) -> 기관찾기 팝업에서 선택했을 때 상세검색 폼에 채워지는 값.
+    캐시에 있으면 팝업을 열지 않고 폼에 바로 값을 넣는다.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Institution] = self.load()
+        log.info(f"기관 캐시 {len(self.entries)}건 로드")
+
+    def load(self) -> Dict[str, Institution]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            log.warn(f"기관 캐시 로드 실패, 새로 생성: {self.path}")
+            return {}
+
+    @staticmethod
+    def keyOf(organization: str, location: str) -> str:
+        return f"{location.strip()}|{organization.strip()}"
+
+    def get(self, organization: str, location: str) -> Optional[Institution]:
+        with self.lock:
+            return self.entries.get(self.keyOf(organization, location))
+
+    def put(
+        self, organization: str, location: str, title: str, fields: Dict[str, str]
+    ) -> None:
+        if not fields:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # 여러 엔진 프로세스가 같은 캐시 파일을 쓰므로 잠근 상태에서 파일 내용과 합쳐서 저장
+        with self.lock, fileLock(f"{self.path}.lock"):
+            self.entries.update(self.load())
+            self.entries[self.keyOf(organization, location)] = {
+                "title": title,
+                "fields": fields,
+            }
+            data = json.dumps(self.entries, ensure_ascii=False, indent=2)
+            tmpPath = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmpPath, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmpPath, self.path)
+        log.debug(f"기관 캐시 저장: {title}")
@@ -0,0 +1,275 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+from classes.Logger import log
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    runKey TEXT PRIMARY KEY,
+    baseRows INTEGER NOT NULL,
+    finished INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS configs (
+    configKey TEXT PRIMARY KEY,
+    runKey TEXT NOT NULL,
+    finished INTEGER NOT NULL DEFAULT 0,
+    outcome TEXT
+);
+CREATE TABLE IF NOT EXISTS documents (
+    configKey TEXT NOT NULL,
+    prdnNstRgstNo TEXT NOT NULL,
+    prdnDt TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT,
+    workUnit TEXT,
+    prodDate TEXT,
+    detailUrl TEXT,
+    hasMissing INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (configKey, prdnNstRgstNo, prdnDt)
+);
+CREATE TABLE IF NOT EXISTS files (
+    configKey TEXT NOT NULL,
+    prdnNstRgstNo TEXT NOT NULL,
+    prdnDt TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    sha256 TEXT,
+    PRIMARY KEY (configKey, prdnNstRgstNo, prdnDt, idx)
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    watermarkKey TEXT PRIMARY KEY,
+    latestPrdnDt TEXT NOT NULL,
+    updatedAt REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS seen (
+    watermarkKey TEXT NOT NULL,
+    prdnNstRgstNo TEXT NOT NULL,
+    prdnDt TEXT NOT NULL,
+    PRIMARY KEY (watermarkKey, prdnNstRgstNo, prdnDt)
+);
+"""
+
+
+class CrawlJournal:
+    """
+    크롤링 진행 상황을 SQLite에 기록해서, 중단된 실행을 이어서 진행할 수 있게 한다.
+    문서 단위로 커밋하므로 프로세스가 강제 종료되어도 완료된 문서는 남는다.
+    """
+
+    def __init__(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+        log.info(f"크롤링 기록 DB: {path}")
+
+    @staticmethod
+    def runKeyOf(excelName: str, configs: List[Dict[str, Any]]) -> str:
+        raw = json.dumps([excelName, configs], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def configKeyOf(runKey: str, index: int, cfg: Dict[str, Any]) -> str:
+        raw = json.dumps([runKey, index, cfg], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def watermarkKeyOf(
+        query: str,
+        organization: str,
+        location: str,
+        include: Optional[str],
+        exclude: Optional[str],
+    ) -> str:
+        # 날짜 범위를 뺀 검색 조건, 기간을 옮겨가며 다시 실행해도 같은 키
+        raw = json.dumps(
+            [query, organization, location, include or "null", exclude or "null"],
+            ensure_ascii=False,
+        )
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def beginRun(self, runKey: str, currentRows: int) -> Tuple[int, bool]:
+        """(실행 시작 시점의 엑셀 행 수, 이어서 진행하는지 여부)를 반환"""
+        with self.lock, self.conn:
+            row = self.conn.execute(
+                "SELECT baseRows, finished FROM runs WHERE runKey = ?", (runKey,)
+            ).fetchone()
+            if row and not row["finished"]:
+                log.info("중단된 실행 기록 발견, 이어서 진행합니다.")
+                return (row["baseRows"], True)
+            if row:
+                # 완료된 실행을 다시 돌리는 경우는 새로 크롤링
+                self.deleteRun(runKey)
+            self.conn.execute(
+                "INSERT INTO runs (runKey, baseRows) VALUES (?, ?)",
+                (runKey, currentRows),
+            )
+            return (currentRows, False)
+
+    def deleteRun(self, runKey: str) -> None:
+        keys = "SELECT configKey FROM configs WHERE runKey = ?"
+        for table in ("files", "documents"):
+            self.conn.execute(
+                f"DELETE FROM {table} WHERE configKey IN ({keys})", (runKey,)
+            )
+        self.conn.execute("DELETE FROM configs WHERE runKey = ?", (runKey,))
+        self.conn.execute("DELETE FROM runs WHERE runKey = ?", (runKey,))
+
+    def finishRun(self, runKey: str) -> None:
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE runs SET finished = 1 WHERE runKey = ?", (runKey,)
+            )
+
+    def beginConfig(self, runKey: str, configKey: str) -> Dict[str, Any]:
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO configs (configKey, runKey) VALUES (?, ?)",
+                (configKey, runKey),
+            )
+            row = self.conn.execute(
+                "SELECT finished, outcome FROM configs WHERE configKey = ?",
+                (configKey,),
+            ).fetchone()
+            return dict(row)
+
+    def finishConfig(self, configKey: str, outcome: Optional[str] = None) -> None:
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE configs SET finished = 1, outcome = ? WHERE configKey = ?",
+                (outcome, configKey),
+            )
+
+    def getDocument(
+        self, configKey: str, prdnNstRgstNo: str, prdnDt: str
+    ) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT * FROM documents WHERE configKey = ? AND prdnNstRgstNo = ? AND prdnDt = ?",
+                (configKey, prdnNstRgstNo, prdnDt),
+            ).fetchone()
+            if row is None:
+                return None
+            files = self.conn.execute(
+                """
+                SELECT path, sha256 FROM files
+                WHERE configKey = ? AND prdnNstRgstNo = ? AND prdnDt = ?
+                ORDER BY idx
+                """,
+                (configKey, prdnNstRgstNo, prdnDt),
+            ).fetchall()
+        doc = dict(row)
+        doc["files"] = [f["path"] for f in files]
+        # 기록된 파일이 지워졌다면 다시 처리
+        if not all(os.path.exists(path) for path in doc["files"]):
+            return None
+        return doc
+
+    def saveDocument(
+        self, configKey: str, prdnNstRgstNo: str, prdnDt: str, doc: Dict[str, Any]
+    ) -> None:
+        fileLinks: List[str] = doc["files"]
+        checksums = [fileSha256(path) for path in fileLinks]
+        with self.lock, self.conn:
+            position = self.conn.execute(
+                "SELECT COUNT(*) FROM documents WHERE configKey = ?", (configKey,)
+            ).fetchone()[0]
+            self.conn.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    configKey,
+                    prdnNstRgstNo,
+                    prdnDt,
+                    position,
+                    doc["title"],
+                    doc["workUnit"],
+                    doc["prodDate"],
+                    doc["detailUrl"],
+                    int(doc["hasMissing"]),
+                ),
+            )
+            self.conn.execute(
+                "DELETE FROM files WHERE configKey = ? AND prdnNstRgstNo = ? AND prdnDt = ?",
+                (configKey, prdnNstRgstNo, prdnDt),
+            )
+            self.conn.executemany(
+                "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (configKey, prdnNstRgstNo, prdnDt, idx, path, checksum)
+                    for idx, (path, checksum) in enumerate(zip(fileLinks, checksums))
+                ],
+            )
+
+    def listDocuments(self, configKey: str) -> Optional[List[Dict[str, Any]]]:
+        """기록된 순서대로 문서를 반환, 파일이 하나라도 사라졌다면 None"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT prdnNstRgstNo, prdnDt FROM documents WHERE configKey = ? ORDER BY position",
+                (configKey,),
+            ).fetchall()
+        docs = []
+        for row in rows:
+            doc = self.getDocument(configKey, row["prdnNstRgstNo"], row["prdnDt"])
+            if doc is None:
+                return None
+            docs.append(doc)
+        return docs
+
+    def getWatermark(self, watermarkKey: str) -> Optional[Dict[str, Any]]:
+        """검색 조건별로 지금까지 완료한 가장 최근 생산일자와 처리한 문서 id 집합"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT latestPrdnDt FROM watermarks WHERE watermarkKey = ?",
+                (watermarkKey,),
+            ).fetchone()
+            if row is None:
+                return None
+            rows = self.conn.execute(
+                "SELECT prdnNstRgstNo, prdnDt FROM seen WHERE watermarkKey = ?",
+                (watermarkKey,),
+            ).fetchall()
+        seen: Set[Tuple[str, str]] = {(r["prdnNstRgstNo"], r["prdnDt"]) for r in rows}
+        return {"latestPrdnDt": row["latestPrdnDt"], "seen": seen}
+
+    def advanceWatermark(self, watermarkKey: str, configKey: str) -> None:
+        # config가 끝났을 때만 올린다, 중간에 멈춘 config의 문서는 재개할 때 기록에서 복원
+        with self.lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT OR IGNORE INTO seen
+                SELECT ?, prdnNstRgstNo, prdnDt FROM documents WHERE configKey = ?
+                """,
+                (watermarkKey, configKey),
+            )
+            latest = self.conn.execute(
+                "SELECT MAX(prdnDt) FROM seen WHERE watermarkKey = ?", (watermarkKey,)
+            ).fetchone()[0]
+            self.conn.execute(
+                """
+                INSERT INTO watermarks (watermarkKey, latestPrdnDt, updatedAt) VALUES (?, ?, ?)
+                ON CONFLICT(watermarkKey) DO UPDATE SET
+                    latestPrdnDt = excluded.latestPrdnDt, updatedAt = excluded.updatedAt
+                """,
+                (watermarkKey, latest or "", time.time()),
+            )
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+def fileSha256(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
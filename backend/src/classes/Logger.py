@@ -0,0 +1,177 @@
+import atexit
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+LEVELS = {"debug": 10, "info": 20, "warn": 30, "error": 40}
+
+
+class EventLogger:
+    """
+    stdout으로 JSON Lines 이벤트를 내보내는 로거.
+    메시지마다 flush하지 않고 버퍼에 모았다가 interval마다 한 번에 쓴다.
+    """
+
+    def __init__(self, interval: float = 1.0, verbose: bool = False) -> None:
+        self.interval = interval
+        self.verbose = verbose
+        self.lock = threading.Lock()
+        self.buffer: List[str] = []
+        # 진행률은 stage별 최신 값만 남겨 전송
+        self.pending: Dict[str, str] = {}
+        self.started = time.monotonic()
+        self.stageStarted: Dict[str, float] = {}
+        self.rows = 0
+        self.stopEvent = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        # 스레드별로 모든 이벤트에 붙일 필드(데몬의 job id 등)
+        self.context = threading.local()
+        # stdout 외에 이벤트 줄을 받을 곳(데몬 소켓 클라이언트 등)
+        self.sinks: List[Callable[[str], None]] = []
+        atexit.register(self.close)
+
+    def configure(
+        self, verbose: bool = False, interval: Optional[float] = None
+    ) -> None:
+        self.verbose = verbose
+        if interval is not None:
+            self.interval = interval
+        self.start()
+
+    def start(self) -> None:
+        if self.thread is None and self.interval > 0:
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def run(self) -> None:
+        while not self.stopEvent.wait(self.interval):
+            self.flush()
+
+    @contextmanager
+    def bind(self, **fields: Any) -> Iterator[None]:
+        previous = getattr(self.context, "fields", {})
+        self.context.fields = {**previous, **fields}
+        try:
+            yield
+        finally:
+            self.context.fields = previous
+
+    def currentContext(self) -> Dict[str, Any]:
+        # 다른 스레드에서 같은 필드로 bind할 때 사용
+        return dict(getattr(self.context, "fields", {}))
+
+    def addSink(self, sink: Callable[[str], None]) -> None:
+        with self.lock:
+            self.sinks.append(sink)
+
+    def removeSink(self, sink: Callable[[str], None]) -> None:
+        with self.lock:
+            if sink in self.sinks:
+                self.sinks.remove(sink)
+
+    def emit(self, event: Dict[str, Any], immediate: bool = False) -> None:
+        event.update(getattr(self.context, "fields", {}))
+        event["ts"] = round(time.time(), 3)
+        line = json.dumps(event, ensure_ascii=False)
+        with self.lock:
+            self.buffer.append(line)
+        if immediate or self.thread is None or self.verbose:
+            self.flush()
+
+    def event(self, name: str, **fields: Any) -> None:
+        self.emit({"event": name, **fields})
+
+    def log(self, level: str, msg: str, **extra: Any) -> None:
+        if level == "debug" and not self.verbose:
+            return
+        self.emit(
+            {"event": "log", "level": level, "msg": msg, **extra},
+            immediate=LEVELS[level] >= LEVELS["error"],
+        )
+
+    def debug(self, msg: str, **extra: Any) -> None:
+        self.log("debug", msg, **extra)
+
+    def info(self, msg: str, **extra: Any) -> None:
+        self.log("info", msg, **extra)
+
+    def warn(self, msg: str, **extra: Any) -> None:
+        self.log("warn", msg, **extra)
+
+    def error(self, msg: str, **extra: Any) -> None:
+        self.log("error", msg, **extra)
+
+    def countRows(self, n: int = 1) -> None:
+        with self.lock:
+            self.rows += n
+
+    def progress(self, stage: str, done: int, total: Optional[int]) -> None:
+        # total이 None이면 전체 개수를 모르는 스트리밍 입력
+        now = time.monotonic()
+        fields = getattr(self.context, "fields", {})
+        key = json.dumps([stage, fields], sort_keys=True, default=str)
+        with self.lock:
+            begun = self.stageStarted.setdefault(key, now)
+            if done == 0:
+                self.stageStarted[key] = begun = now
+            elapsed = now - begun
+            minutes = (now - self.started) / 60
+            event = {
+                **fields,
+                "event": "progress",
+                "stage": stage,
+                "done": done,
+                "total": total,
+                "rows": self.rows,
+                "rowsPerMin": round(self.rows / minutes, 1) if minutes > 0 else 0.0,
+                "etaSec": (
+                    round(elapsed / done * (total - done))
+                    if total is not None and 0 < done <= total
+                    else None
+                ),
+                "ts": round(time.time(), 3),
+            }
+            self.pending[key] = json.dumps(event, ensure_ascii=False)
+        if self.thread is None or self.verbose:
+            self.flush()
+
+    def result(self, directory: str, **extra: Any) -> None:
+        self.emit({"event": "result", "directory": directory, **extra}, immediate=True)
+        # 이전 버전 컨트롤러 호환용 한 줄
+        self.write([f"DIRECTORY:{directory}"])
+
+    def failure(self, directory: str, **extra: Any) -> None:
+        self.emit({"event": "failure", "directory": directory, **extra}, immediate=True)
+        self.write([f"FAILDIRECTORY:{directory}"])
+
+    def flush(self) -> None:
+        with self.lock:
+            lines = self.buffer + list(self.pending.values())
+            self.buffer = []
+            self.pending = {}
+        self.write(lines)
+
+    def write(self, lines: List[str]) -> None:
+        if not lines:
+            return
+        text = "\n".join(lines) + "\n"
+        with self.lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            sinks = list(self.sinks)
+        for sink in sinks:
+            try:
+                sink(text)
+            except OSError:
+                self.removeSink(sink)
+
+    def close(self) -> None:
+        self.stopEvent.set()
+        self.flush()
+
+
+# 프로세스 전역 로거, main에서 configure()로 시작
+log = EventLogger()
@@ -0,0 +1,231 @@
+import functools
+import heapq
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# 구간별 히스토그램 경계(초)
+BUCKETS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120]
+SLOWEST_LIMIT = 20
+# 구간별로 보관하는 최대 샘플 수, 넘으면 저수지 샘플링 대신 앞부분만 유지
+MAX_SAMPLES = 10000
+
+
+class Profiler:
+    """
+    크롤링 단계별 소요 시간, 재시도/WebDriver 명령 횟수를 모아 실행 끝에 JSON으로 기록.
+    enabled가 False면 span/count는 아무것도 하지 않는다.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self.totals: Dict[str, float] = defaultdict(float)
+        self.calls: Counter = Counter()
+        self.counters: Counter = Counter()
+        self.gauges: Dict[str, List[float]] = defaultdict(list)
+        self.slowest: List[Tuple[float, str, Dict[str, Any]]] = []
+        self.sampler: Optional[StackSampler] = None
+
+    def enable(self, sampleInterval: float = 0) -> None:
+        self.enabled = True
+        self.started = time.monotonic()
+        if sampleInterval > 0:
+            self.sampler = StackSampler(sampleInterval)
+            self.sampler.start()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        begun = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - begun)
+
+    def timed(self, name: str) -> Callable:
+        # 메서드/함수 전체를 하나의 구간으로 측정하는 데코레이터
+        def decorator(fn: Callable) -> Callable:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return fn(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def record(self, name: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        with self.lock:
+            samples = self.durations[name]
+            if len(samples) < MAX_SAMPLES:
+                samples.append(seconds)
+            self.totals[name] += seconds
+            self.calls[name] += 1
+
+    def count(self, name: str, n: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] += n
+
+    def gauge(self, name: str, value: float) -> None:
+        # 시간이 아닌 측정값(탭 메모리 등), 리포트에는 평균/최대만 남긴다
+        if not self.enabled:
+            return
+        with self.lock:
+            values = self.gauges[name]
+            if len(values) < MAX_SAMPLES:
+                values.append(value)
+
+    def document(self, key: str, seconds: float, **attrs: Any) -> None:
+        # 가장 느린 문서 SLOWEST_LIMIT건만 min-heap으로 유지
+        if not self.enabled:
+            return
+        with self.lock:
+            item = (seconds, key, attrs)
+            if len(self.slowest) < SLOWEST_LIMIT:
+                heapq.heappush(self.slowest, item)
+            elif seconds > self.slowest[0][0]:
+                heapq.heapreplace(self.slowest, item)
+
+    def instrumentDriver(self, driver) -> None:
+        # WebDriver 명령(HTTP 왕복) 횟수를 명령 이름별로 집계
+        if not self.enabled:
+            return
+        execute = driver.execute
+
+        def countedExecute(command, params=None):
+            self.count(f"webdriver.{command}")
+            self.count("webdriver.total")
+            return execute(command, params)
+
+        driver.execute = countedExecute
+
+    def report(self) -> Dict[str, Any]:
+        with self.lock:
+            phases = {
+                name: summarize(samples, self.calls[name], self.totals[name])
+                for name, samples in self.durations.items()
+            }
+            slowest = [
+                {"document": key, "seconds": round(seconds, 3), **attrs}
+                for seconds, key, attrs in sorted(self.slowest, reverse=True)
+            ]
+            return {
+                "elapsedSec": round(time.monotonic() - self.started, 3),
+                "phases": dict(
+                    sorted(
+                        phases.items(), key=lambda kv: kv[1]["totalSec"], reverse=True
+                    )
+                ),
+                "counters": dict(sorted(self.counters.items())),
+                "gauges": {
+                    name: {
+                        "count": len(values),
+                        "mean": round(sum(values) / len(values), 3),
+                        "max": round(max(values), 3),
+                    }
+                    for name, values in sorted(self.gauges.items())
+                    if values
+                },
+                "slowestDocuments": slowest,
+                "samples": self.sampler.report() if self.sampler else None,
+            }
+
+    def write(self, path: str) -> None:
+        if not self.enabled:
+            return
+        if self.sampler:
+            self.sampler.stop()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+
+
+class StackSampler(threading.Thread):
+    """interval마다 모든 스레드의 스택을 찍어 자주 보이는 함수를 집계하는 샘플링 프로파일러"""
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.stopEvent = threading.Event()
+        self.leaves: Counter = Counter()
+        self.stacks: Counter = Counter()
+        self.total = 0
+
+    def run(self) -> None:
+        me = threading.get_ident()
+        while not self.stopEvent.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < 30:
+                    code = frame.f_code
+                    stack.append(
+                        f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}"
+                    )
+                    frame = frame.f_back
+                if not stack:
+                    continue
+                self.total += 1
+                self.leaves[stack[0]] += 1
+                self.stacks[" <- ".join(stack[:8])] += 1
+
+    def stop(self) -> None:
+        self.stopEvent.set()
+        self.join(timeout=self.interval * 2)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "intervalSec": self.interval,
+            "samples": self.total,
+            "topFunctions": [
+                {"frame": frame, "samples": n}
+                for frame, n in self.leaves.most_common(30)
+            ],
+            "topStacks": [
+                {"stack": stack, "samples": n}
+                for stack, n in self.stacks.most_common(15)
+            ],
+        }
+
+
+def summarize(samples: List[float], calls: int, total: float) -> Dict[str, Any]:
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))], 3)
+
+    histogram: Dict[str, int] = {}
+    lower = 0.0
+    for upper in BUCKETS + [float("inf")]:
+        label = f"<{upper}s" if upper != float("inf") else f">={lower}s"
+        histogram[label] = sum(1 for s in ordered if lower <= s < upper)
+        lower = upper
+    return {
+        "count": calls,
+        "totalSec": round(total, 3),
+        "meanSec": round(total / calls, 3) if calls else 0,
+        "p50Sec": pct(0.5),
+        "p90Sec": pct(0.9),
+        "p99Sec": pct(0.99),
+        "maxSec": round(ordered[-1], 3),
+        "histogram": histogram,
+    }
+
+
+# 프로세스 전역 프로파일러, main에서 --profile로 활성화
+profiler = Profiler()
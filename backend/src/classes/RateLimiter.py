@@ -0,0 +1,175 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+from urllib.parse import urlsplit
+from constants.index import (
+    FILE_LOCK_TIMEOUT,
+    RATE_BURST,
+    RATE_COOLDOWN,
+    RATE_DECREASE,
+    RATE_INCREASE,
+    RATE_INITIAL,
+    RATE_MAX,
+    RATE_MIN,
+    RATE_STATE_DIR,
+)
+from classes.Logger import log
+from classes.Profiler import profiler
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class HostRateLimiter:
+    """
+    호스트별 token bucket으로 페이지 로드/다운로드 요청 간격을 맞춘다.
+    성공하면 속도를 조금씩 올리고(additive), alert/타임아웃/5xx면 절반으로 줄인다(multiplicative).
+    버킷 상태는 호스트별 JSON 파일에 두고 lock file로 잠가서 워커 프로세스끼리 공유한다.
+    """
+
+    def __init__(self, stateDir: str = RATE_STATE_DIR) -> None:
+        self.stateDir = stateDir
+        # main에서 --rateLimit true일 때만 켠다
+        self.enabled = False
+        self.lock = threading.Lock()
+
+    def configure(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+
+    def acquire(self, url: str) -> None:
+        # 토큰이 생길 때까지 대기, 잠금은 토큰 계산 동안만 잡는다
+        if not self.enabled:
+            return
+        host = hostOf(url)
+        waited = 0.0
+        while True:
+            with self.state(host) as state:
+                if state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    break
+                delay = (1 - state["tokens"]) / state["rate"]
+            time.sleep(delay)
+            waited += delay
+        if waited:
+            profiler.record("rate.wait", waited)
+
+    def success(self, url: str) -> None:
+        if not self.enabled:
+            return
+        with self.state(hostOf(url)) as state:
+            state["rate"] = min(RATE_MAX, state["rate"] + RATE_INCREASE)
+
+    def failure(self, url: str, reason: str) -> None:
+        if not self.enabled:
+            return
+        host = hostOf(url)
+        with self.state(host) as state:
+            now = time.time()
+            # 동시에 실패한 요청들이 속도를 연달아 깎지 않도록 cooldown 동안은 한 번만
+            if now - state["decreasedAt"] < RATE_COOLDOWN:
+                return
+            before = state["rate"]
+            state["rate"] = max(RATE_MIN, before * RATE_DECREASE)
+            state["tokens"] = min(state["tokens"], 0.0)
+            state["decreasedAt"] = now
+        profiler.count(f"rate.backoff.{reason}")
+        log.warn(
+            f"요청 속도 낮춤 ({reason}): {host} {before:.2f} -> {state['rate']:.2f}회/초"
+        )
+
+    def report(self, url: str, status: int) -> None:
+        # HTTP 응답 코드 기준 성공/실패, 4xx(429 제외)는 속도와 무관하므로 그대로 둔다
+        if status >= 500 or status == 429:
+            self.failure(url, f"http{status}")
+        elif status < 400:
+            self.success(url)
+
+    @contextmanager
+    def state(self, host: str) -> Iterator[Dict[str, Any]]:
+        # 파일을 읽어 토큰을 채운 상태를 넘기고, 블록이 끝나면 다시 기록
+        os.makedirs(self.stateDir, exist_ok=True)
+        name = hashlib.sha1(host.encode("utf-8")).hexdigest()[:16]
+        statePath = os.path.join(self.stateDir, f"{name}.json")
+        with self.lock, fileLock(os.path.join(self.stateDir, f"{name}.lock")):
+            state = readState(statePath)
+            now = time.time()
+            elapsed = max(0.0, now - state["updatedAt"])
+            state["tokens"] = min(RATE_BURST, state["tokens"] + elapsed * state["rate"])
+            state["updatedAt"] = now
+            yield state
+            writeState(statePath, state)
+
+
+def readState(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        if all(key in state for key in ("rate", "tokens", "updatedAt", "decreasedAt")):
+            return state
+    except (OSError, ValueError):
+        pass
+    return {
+        "rate": RATE_INITIAL,
+        "tokens": RATE_BURST,
+        "updatedAt": time.time(),
+        "decreasedAt": 0.0,
+    }
+
+
+def writeState(path: str, state: Dict[str, Any]) -> None:
+    tmpPath = f"{path}.{os.getpid()}.tmp"
+    with open(tmpPath, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmpPath, path)
+
+
+@contextmanager
+def fileLock(path: str, timeout: float = FILE_LOCK_TIMEOUT) -> Iterator[None]:
+    # 다른 프로세스가 잠금을 놓지 않아도 멈추지 않도록, 시간 안에 못 잡으면 잠금 없이 진행
+    with open(path, "a+b") as f:
+        locked = acquireFileLock(f, time.monotonic() + timeout)
+        if not locked:
+            profiler.count("lock.timeout")
+            log.warn(f"lock file 대기 시간 초과, 잠금 없이 진행: {path}")
+        try:
+            yield
+        finally:
+            if locked:
+                releaseFileLock(f)
+
+
+def acquireFileLock(f, deadline: float) -> bool:
+    while True:
+        try:
+            if os.name == "nt":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+
+
+def releaseFileLock(f) -> None:
+    if os.name == "nt":
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def hostOf(url: str) -> str:
+    return urlsplit(url).netloc or url
+
+
+# 프로세스 전역 요청 속도 제어, main에서 --rateLimit으로 설정
+limiter = HostRateLimiter()
@@ -0,0 +1,419 @@
+import csv
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Union
+from openpyxl.worksheet.worksheet import Worksheet
+from classes.Excel import (
+    FILE_COLUMN,
+    HEADER,
+    MISSING_TEXT,
+    SHOT_SHEET,
+    ExcelSink,
+    SpoolCell,
+    createExcel,
+    readOtherSheets,
+    readSpoolRows,
+    textLength,
+    writeWorkbook,
+)
+from classes.Logger import log
+from classes.Profiler import profiler
+from classes.Screenshot import Shot
+from constants.index import RESULTS_SUFFIX
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rows (
+    position INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    query TEXT,
+    organization TEXT,
+    title TEXT,
+    detailUrl TEXT,
+    workUnit TEXT,
+    prodDate TEXT,
+    files TEXT,
+    hasMissing INTEGER NOT NULL DEFAULT 0,
+    message TEXT,
+    cells TEXT
+);
+CREATE TABLE IF NOT EXISTS screenshots (
+    name TEXT PRIMARY KEY,
+    original TEXT NOT NULL,
+    thumbnail TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# CSV/Parquet 내보내기 열
+EXPORT_COLUMNS = [
+    "kind",
+    "query",
+    "organization",
+    "title",
+    "detailUrl",
+    "workUnit",
+    "prodDate",
+    "files",
+    "hasMissing",
+    "message",
+]
+
+
+class ResultStore:
+    """
+    크롤링 결과를 SQLite에 행 단위로 append 하는 결과 저장소.
+    행 번호(position)는 엑셀 행 번호와 같고, 엑셀 파일은 save()에서 저장소를 읽어 한 번에 만든다.
+    kind: header / document / notFound / cells(기존 엑셀에서 가져온 행, 셀 그대로 보관)
+    """
+
+    def __init__(
+        self,
+        downloadDir: str,
+        fileName: str,
+        sheetName: str = "Sheet1",
+        checkpointInterval: float = 0,
+        export: str = "none",
+    ) -> None:
+        os.makedirs(downloadDir, exist_ok=True)
+        self.path = os.path.join(downloadDir, fileName)
+        self.storePath = os.path.join(
+            downloadDir, f"{os.path.splitext(fileName)[0]}{RESULTS_SUFFIX}"
+        )
+        self.sheetName = sheetName
+        self.checkpointInterval = checkpointInterval
+        self.export = export
+        self.lastSavedAt = time.monotonic()
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.storePath, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        # 행마다 커밋하므로 WAL + NORMAL로 fsync 횟수를 줄임 (프로세스가 죽어도 커밋된 행은 남음)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+        log.info(f"엑셀 파일명: {fileName}, 결과 저장소: {self.storePath}")
+        self.syncWithWorkbook()
+        # 결과 시트 외의 시트는 저장할 때 그대로 옮김 (Images 시트는 저장소의 스크린샷으로 다시 만듦)
+        self.others: List[Worksheet] = []
+        self.position = 0
+        if os.path.exists(self.path):
+            self.others, self.position = readOtherSheets(
+                self.path, sheetName, exclude=(SHOT_SHEET,)
+            )
+
+    def syncWithWorkbook(self) -> None:
+        # 마지막으로 만든 엑셀이 그대로면 엑셀을 읽지 않고 저장소를 그대로 사용
+        renderedMtime = self.getMeta("renderedMtime")
+        if os.path.exists(self.path):
+            if renderedMtime == str(os.path.getmtime(self.path)) and self.rowCount():
+                log.info(f"결과 저장소 사용, 엑셀 읽기 생략 ({self.rowCount()}행)")
+                return
+            # 저장소가 없거나 사용자가 엑셀을 직접 고친 경우 엑셀 내용으로 다시 채움
+            with profiler.span("excel.import"):
+                with self.lock, self.conn:
+                    self.conn.execute("DELETE FROM rows")
+                    # 첫 행은 머리글
+                    self.conn.executemany(
+                        "INSERT INTO rows (kind, cells) VALUES (?, ?)",
+                        (
+                            (
+                                "header" if idx == 0 else "cells",
+                                cellsJson(row),
+                            )
+                            for idx, row in enumerate(
+                                readSpoolRows(self.path, self.sheetName)
+                            )
+                        ),
+                    )
+            log.info(f"Excel 데이터 로드 완료, {self.path}")
+        else:
+            with self.lock, self.conn:
+                self.conn.execute("DELETE FROM rows")
+                self.conn.execute(
+                    "INSERT INTO rows (kind, cells) VALUES ('header', ?)",
+                    (cellsJson([(text, None, None) for text in HEADER]),),
+                )
+            log.info(f"Excel 데이터 생성 완료, {self.path}")
+
+    def getMeta(self, key: str) -> Optional[str]:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row["value"] if row else None
+
+    def setMeta(self, key: str, value: str) -> None:
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def addDocument(self, query: str, organization: str, doc: Dict[str, Any]) -> None:
+        with self.lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO rows (
+                    kind, query, organization, title, detailUrl, workUnit, prodDate,
+                    files, hasMissing
+                )
+                VALUES ('document', ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    query,
+                    organization,
+                    doc["title"],
+                    doc["detailUrl"],
+                    doc["workUnit"],
+                    doc["prodDate"],
+                    json.dumps(doc["files"], ensure_ascii=False),
+                    int(bool(doc["hasMissing"])),
+                ),
+            )
+        log.debug(f"결과 저장: {query}-{organization}-{doc['title']}")
+
+    def addNotFound(self, query: str, organization: str, message: str) -> None:
+        with self.lock, self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO rows (kind, query, organization, message)
+                VALUES ('notFound', ?, ?, ?)
+                """,
+                (query, organization, message),
+            )
+        log.debug(f"결과 저장: {query}-{organization}-{message}")
+
+    def addScreenshot(self, shot: Shot) -> None:
+        # 같은 이름으로 다시 캡처하면(이어서 실행 등) 최신 것으로 교체하고 순서도 뒤로
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM screenshots WHERE name = ?", (shot["name"],))
+            self.conn.execute(
+                "INSERT INTO screenshots (name, original, thumbnail) VALUES (?, ?, ?)",
+                (shot["name"], shot["original"], shot["thumbnail"]),
+            )
+
+    def screenshots(self) -> List[Shot]:
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT name, original, thumbnail FROM screenshots ORDER BY rowid"
+            ).fetchall()
+        return [
+            {"name": r["name"], "original": r["original"], "thumbnail": r["thumbnail"]}
+            for r in rows
+        ]
+
+    def rowCount(self) -> int:
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+
+    def truncate(self, rowCount: int) -> None:
+        # 중단된 실행이 남긴 행 제거 (기록으로 다시 채움)
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM rows WHERE position > ?", (rowCount,))
+
+    def records(self) -> Iterator[sqlite3.Row]:
+        # 쓰는 쪽과 커서를 공유하지 않도록 별도 연결로 순서대로 읽음
+        conn = sqlite3.connect(self.storePath)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield from conn.execute("SELECT * FROM rows ORDER BY position")
+        finally:
+            conn.close()
+
+    def cellRows(self, report: bool = True) -> Iterator[List[SpoolCell]]:
+        for record in self.records():
+            yield cellsOf(record, report)
+
+    def pretterColumns(self) -> None:
+        # 열 너비는 save()에서 저장소를 한 번 훑어서 계산
+        pass
+
+    def maybeCheckpoint(self) -> None:
+        if not self.checkpointInterval:
+            return
+        if time.monotonic() - self.lastSavedAt >= self.checkpointInterval:
+            log.debug("Excel 체크포인트 저장")
+            self.save()
+
+    @profiler.timed("excel.save")
+    def save(self) -> None:
+        # write-only 시트는 열 너비를 먼저 정해야 하므로 저장소를 두 번 읽는다
+        widths: Dict[int, int] = {}
+        for row in self.cellRows(report=False):
+            for col, (value, _, _) in enumerate(row, start=1):
+                if textLength(value) > widths.get(col, 0):
+                    widths[col] = textLength(value)
+        writeWorkbook(
+            self.path,
+            self.sheetName,
+            self.cellRows(),
+            widths,
+            self.screenshots(),
+            others=self.others,
+            position=self.position,
+        )
+        self.setMeta("renderedMtime", str(os.path.getmtime(self.path)))
+        self.lastSavedAt = time.monotonic()
+        log.info(f"{os.path.dirname(self.path)}에 Excel 저장 완료")
+        if self.export != "none":
+            self.exportRecords(self.export)
+
+    @profiler.timed("results.export")
+    def exportRecords(self, fmt: str) -> None:
+        exportPath = f"{os.path.splitext(self.path)[0]}.{fmt}"
+        rows = (
+            exportRowOf(record)
+            for record in self.records()
+            if record["kind"] != "header"
+        )
+        if fmt == "parquet":
+            try:
+                import pyarrow
+                import pyarrow.parquet
+            except ImportError:
+                log.warn("pyarrow가 없어 Parquet 내보내기를 건너뜁니다.")
+                return
+            columns: Dict[str, List[Any]] = {name: [] for name in EXPORT_COLUMNS}
+            for row in rows:
+                for name in EXPORT_COLUMNS:
+                    columns[name].append(row[name])
+            pyarrow.parquet.write_table(pyarrow.table(columns), f"{exportPath}.tmp")
+        else:
+            # 엑셀에서 바로 열 수 있도록 BOM 포함 UTF-8
+            with open(f"{exportPath}.tmp", "w", encoding="utf-8-sig", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=EXPORT_COLUMNS)
+                writer.writeheader()
+                writer.writerows(rows)
+        os.replace(f"{exportPath}.tmp", exportPath)
+        log.info(f"결과 내보내기 완료: {exportPath}")
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+def cellsOf(record: sqlite3.Row, report: bool = True) -> List[SpoolCell]:
+    # 저장된 결과 하나를 기존 엑셀 레이아웃의 한 행으로 변환, report면 없는 파일을 로그로 남김
+    kind = record["kind"]
+    if kind in ("header", "cells"):
+        return [tuple(cell) for cell in cellsFromJson(record["cells"])]  # type: ignore
+    if kind == "notFound":
+        return [
+            (record["query"], None, None),
+            (record["organization"], None, None),
+            (record["message"], None, None),
+        ]
+    row: List[SpoolCell] = [
+        (record["query"], None, None),
+        (record["organization"], None, None),
+        (record["title"], record["detailUrl"], "link" if record["detailUrl"] else None),
+        (record["workUnit"], None, None),
+        (record["prodDate"], None, None),
+    ]
+    files = json.loads(record["files"] or "[]")
+    missingFile = False
+    for idx, link in enumerate(files):
+        if os.path.exists(link):
+            setCell(
+                row,
+                FILE_COLUMN + idx,
+                ("바로가기", f"file:///{os.path.abspath(link)}", "link"),
+            )
+        else:
+            if report:
+                log.warn(f"링크 대상 파일을 찾을 수 없습니다: {link}")
+            missingFile = True
+    if record["hasMissing"] or missingFile:
+        setCell(row, FILE_COLUMN + len(files), (MISSING_TEXT, None, "warn"))
+    return row
+
+
+# 기존 엑셀에서 가져온 날짜/시간 값은 {"$타입": 값}으로 표시해서 JSON에 보관
+TEMPORAL_TYPES = {
+    "datetime": (datetime.datetime, datetime.datetime.fromisoformat),
+    "date": (datetime.date, datetime.date.fromisoformat),
+    "time": (datetime.time, datetime.time.fromisoformat),
+}
+
+
+def encodeValue(value: Any) -> Any:
+    for name, (kind, _) in TEMPORAL_TYPES.items():
+        if isinstance(value, kind):
+            return {f"${name}": value.isoformat()}
+    if isinstance(value, datetime.timedelta):
+        return {"$timedelta": value.total_seconds()}
+    return str(value)
+
+
+def decodeValue(obj: Dict[str, Any]) -> Any:
+    for name, (_, parse) in TEMPORAL_TYPES.items():
+        if f"${name}" in obj:
+            return parse(obj[f"${name}"])
+    if "$timedelta" in obj:
+        return datetime.timedelta(seconds=obj["$timedelta"])
+    return obj
+
+
+def cellsJson(row: List[SpoolCell]) -> str:
+    return json.dumps(row, ensure_ascii=False, default=encodeValue)
+
+
+def cellsFromJson(text: str) -> List[List[Any]]:
+    return json.loads(text, object_hook=decodeValue)
+
+
+def setCell(row: List[SpoolCell], col: int, cell: SpoolCell) -> None:
+    while len(row) < col:
+        row.append((None, None, None))
+    row[col - 1] = cell
+
+
+def exportRowOf(record: sqlite3.Row) -> Dict[str, Any]:
+    if record["kind"] == "cells":
+        # 기존 엑셀에서 가져온 행은 앞쪽 열만 채움
+        # 숫자/날짜 값이 섞여도 Parquet 열 타입이 하나로 유지되도록 문자열로 내보냄
+        values = [
+            None if cell[0] is None else str(cell[0])
+            for cell in cellsFromJson(record["cells"])
+        ]
+        values += [None] * (5 - len(values))
+        return {
+            "kind": "cells",
+            "query": values[0],
+            "organization": values[1],
+            "title": values[2],
+            "detailUrl": None,
+            "workUnit": values[3],
+            "prodDate": values[4],
+            "files": None,
+            "hasMissing": 0,
+            "message": None,
+        }
+    row = {name: record[name] for name in EXPORT_COLUMNS}
+    row["files"] = "\n".join(json.loads(record["files"] or "[]"))
+    return row
+
+
+ResultSink = Union[ExcelSink, ResultStore]
+
+
+def createSink(
+    mode: str,
+    downloadDir: str,
+    fileName: str,
+    checkpointInterval: float = 0,
+    export: str = "none",
+) -> ResultSink:
+    if mode == "store":
+        return ResultStore(
+            downloadDir, fileName, checkpointInterval=checkpointInterval, export=export
+        )
+    if export != "none":
+        log.warn(f"--excelMode {mode}에서는 결과 내보내기를 지원하지 않습니다.")
+    return createExcel(mode, downloadDir, fileName, checkpointInterval)
@@ -0,0 +1,131 @@
+import base64
+import io
+import os
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, TypedDict
+from constants.index import (
+    SCREENSHOT_MAX_PENDING,
+    SCREENSHOT_QUALITY,
+    SCREENSHOT_THUMB_QUALITY,
+    SCREENSHOT_THUMB_SIZE,
+    SCREENSHOT_WORKERS,
+)
+from classes.Logger import log
+from classes.Profiler import profiler
+
+# WebP로 저장할 수 있는 최대 가로/세로 픽셀
+WEBP_MAX_SIDE = 16383
+
+
+class Shot(TypedDict):
+    name: str
+    original: str
+    thumbnail: str
+
+
+class ScreenshotPipeline:
+    """
+    검색 결과 페이지 전체 스크린샷. 크롤링 스레드에서는 CDP 캡처만 하고 바로 반환하며,
+    디코딩/원본 재압축(WebP, JPEG)/썸네일 생성은 백그라운드 스레드 풀에서 처리한다.
+    처리 중인 캡처는 SCREENSHOT_MAX_PENDING개까지만 두어 메모리를 제한한다.
+    """
+
+    def __init__(self, directory: str, fmt: str = "webp") -> None:
+        self.directory = directory
+        self.thumbDirectory = os.path.join(directory, "thumbs")
+        os.makedirs(self.thumbDirectory, exist_ok=True)
+        self.fmt = fmt
+        self.executor = ThreadPoolExecutor(
+            max_workers=SCREENSHOT_WORKERS, thread_name_prefix="screenshot"
+        )
+        self.slots = threading.BoundedSemaphore(SCREENSHOT_MAX_PENDING)
+        self.lock = threading.Lock()
+        self.futures: List[Future] = []
+
+    def capture(self, driver, name: str) -> Optional[Shot]:
+        # 파일 경로를 미리 정해서 반환, 파일은 drain() 이후에 모두 존재한다
+        name = safeName(name)
+        shot: Shot = {
+            "name": name,
+            "original": os.path.join(self.directory, f"{name}.{self.fmt}"),
+            "thumbnail": os.path.join(self.thumbDirectory, f"{name}.jpg"),
+        }
+        with profiler.span("screenshot.wait"):
+            self.slots.acquire()
+        try:
+            with profiler.span("screenshot.capture"):
+                result = driver.execute_cdp_cmd(
+                    "Page.captureScreenshot",
+                    {"captureBeyondViewport": True, "fromSurface": True},
+                )
+        except Exception as e:
+            self.slots.release()
+            log.warn(f"스크린샷 캡처 실패: {name} ({e})")
+            return None
+        future = self.executor.submit(self.process, result["data"], shot)
+        with self.lock:
+            self.futures.append(future)
+        return shot
+
+    def process(self, data: str, shot: Shot) -> None:
+        try:
+            with profiler.span("screenshot.encode"):
+                encodeShot(base64.b64decode(data), shot, self.fmt)
+            log.debug(f"스크린샷 저장 완료: {shot['original']}")
+        except Exception as e:
+            log.warn(f"스크린샷 저장 실패: {shot['name']} ({e})")
+        finally:
+            self.slots.release()
+
+    def drain(self) -> None:
+        # 엑셀을 만들기 전에 처리 중인 스크린샷을 모두 기다림
+        with self.lock:
+            futures, self.futures = self.futures, []
+        for future in futures:
+            future.result()
+
+    def close(self) -> None:
+        self.drain()
+        self.executor.shutdown(wait=True)
+
+
+def encodeShot(png: bytes, shot: Shot, fmt: str) -> None:
+    try:
+        from PIL import Image
+    except ImportError:
+        # Pillow가 없으면 PNG 그대로 저장하고 썸네일은 생략
+        with open(shot["original"], "wb") as f:
+            f.write(png)
+        return
+
+    with Image.open(io.BytesIO(png)) as img:
+        img = img.convert("RGB")
+    saveOriginal(img, shot["original"], fmt)
+
+    # 긴 전체 페이지는 위쪽(2:3 비율)만 잘라서 썸네일로
+    width, height = img.size
+    top = img.crop((0, 0, width, min(height, width * 3 // 2)))
+    img.close()
+    top.thumbnail(SCREENSHOT_THUMB_SIZE)
+    tmpPath = f"{shot['thumbnail']}.tmp"
+    top.save(tmpPath, "JPEG", quality=SCREENSHOT_THUMB_QUALITY, optimize=True)
+    os.replace(tmpPath, shot["thumbnail"])
+
+
+def saveOriginal(img, path: str, fmt: str) -> None:
+    tmpPath = f"{path}.tmp"
+    if fmt == "webp":
+        if max(img.size) > WEBP_MAX_SIDE:
+            # 아주 긴 페이지는 비율을 유지한 채로 한도에 맞춰 줄임
+            img = img.copy()
+            img.thumbnail((WEBP_MAX_SIDE, WEBP_MAX_SIDE))
+        img.save(tmpPath, "WEBP", quality=SCREENSHOT_QUALITY, method=4)
+    else:
+        img.save(tmpPath, "JPEG", quality=SCREENSHOT_QUALITY, optimize=True)
+    os.replace(tmpPath, path)
+
+
+def safeName(name: str) -> str:
+    return re.sub(r'[\\/:*?"<>|\s]+', "_", name).strip("_") or "screenshot"
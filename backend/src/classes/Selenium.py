@@ -1,26 +1,80 @@
 from selenium.webdriver.remote.webelement import WebElement
-from selenium import webdriver
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import (
     TimeoutException,
     NoAlertPresentException,
     ElementClickInterceptedException,
-    SessionNotCreatedException,
     WebDriverException,
 )
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from typing import List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypedDict
 import os
-import time
 import glob
-from constants.index import TIME, ByType
+import json
+import shutil
+import time
+from constants.index import ByType
+from classes.Http import HttpSession
+from classes.Driver import drivers
+from classes.EngineOptions import EngineOptions
+from classes.RateLimiter import limiter
+from classes.Downloader import (
+    Downloader,
+    DownloadRequest,
+    downloadRequestOf,
+    reserveFilePath,
+)
+from classes.Wait import AdaptiveWait
+from classes.Logger import log
+from classes.Profiler import profiler
+
+# lean 모드에서 차단하는 URL 패턴: 이미지/폰트/미디어와 외부 분석 스크립트
+# 첨부파일은 fileDownload.do POST로 받으므로 확장자 패턴에 걸리지 않는다
+# 스타일시트는 요소 표시 여부(클릭 가능, 모달 offsetParent) 판단에 필요해서 차단하지 않음
+LEAN_BLOCKED_URLS = [
+    *(f"*.{ext}" for ext in ("png", "jpg", "jpeg", "gif", "svg", "webp", "ico", "bmp")),
+    *(f"*.{ext}" for ext in ("woff", "woff2", "ttf", "otf", "eot")),
+    *(f"*.{ext}" for ext in ("mp4", "webm", "mp3")),
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*wcs.naver.net*",
+    "*facebook.net*",
+    "*youtube.com/embed*",
+]
+# lean 모드에서 끄는 Chrome 기능
+LEAN_ARGUMENTS = [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+    "--disable-features=Translate,OptimizationHints,MediaRouter,AutofillServerCommunication",
+]
+
+
+class ExtractField(TypedDict, total=False):
+    by: ByType  # "css selector" 또는 "xpath"
+    value: str
+    attr: str  # "text"(기본값), "html" 또는 속성 이름
+    many: bool  # True면 일치하는 모든 요소의 값을 리스트로 반환
 
 
 class Selenium:
-    def __init__(self, url: str, downloadDir: str, debug: str) -> None:
-        filesDir = os.path.join(downloadDir, "files")
-        os.makedirs(filesDir, exist_ok=True)
+    def __init__(
+        self,
+        url: str,
+        downloadDir: str,
+        debug: str,
+        filesSubDir: str = "",
+        options: Optional[EngineOptions] = None,
+    ) -> None:
+        filesDir, stagingDir = prepareDownloadDirs(downloadDir, filesSubDir)
+        # 실행(작업) 단위 옵션, 데몬에서는 작업마다 BrowserSession.configure로 교체
+        self.options = options or EngineOptions()
 
         prefs = {
             "download.default_directory": filesDir,  # 다운로드 경로
@@ -30,90 +84,253 @@ class Selenium:
         }
 
         options = Options()
-        print(debug, flush=True)
+        log.debug(debug)
         if debug != '"true"':
             options.add_argument("--headless")
         options.add_experimental_option("prefs", prefs)
+        if self.options.downloadEvents:
+            # 다운로드/alert 이벤트를 performance 로그로 받기 위한 설정
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            options.add_experimental_option(
+                "perfLoggingPrefs", {"enableNetwork": False, "enablePage": True}
+            )
+        if self.options.lean:
+            # DOMContentLoaded에서 바로 반환, 이후 필요한 요소는 waitFor/waitPageReady로 기다림
+            options.page_load_strategy = "eager"
+            for argument in LEAN_ARGUMENTS:
+                options.add_argument(argument)
 
-        # Chrome 드라이버 초기화 재시도 로직
-        retry_count = 0
-        while True:
-            try:
-                self.driver = webdriver.Chrome(options=options)
-                break
-            except (SessionNotCreatedException, WebDriverException) as e:
-                retry_count += 1
-                print(
-                    f"Chrome 드라이버 초기화 실패 ({retry_count}번째 재시도): {e}",
-                    flush=True,
-                )
-                time.sleep(10)  # 재시도 전 대기
-                continue
+        # 캐시된 경로와 공유 chromedriver로 기동, 실패 시 제한된 횟수만 재시도 (DriverStartError)
+        self.driver = drivers.create(options)
 
-        print("웹드라이버 초기 설정 성공", flush=True)
-        print(f"파일 다운 경로: {filesDir}", flush=True)
-        self.driver.get(url)
-        self.wait = WebDriverWait(self.driver, 10)
+        log.info("웹드라이버 초기 설정 성공")
+        profiler.instrumentDriver(self.driver)
+        if self.options.lean:
+            self.blockResources()
+        log.info(f"파일 다운 경로: {filesDir}")
+        self.setDownloadBehavior(filesDir, stagingDir)
+        # 대기 통계는 excel_database 단위로 공유
+        self.waits = AdaptiveWait.shared(
+            os.path.join(os.path.dirname(downloadDir), ".wait_stats.json")
+        )
+        with profiler.span("driver.mainPage"):
+            self.load(url)
+            self.waitPageReady("mainPage")
         self.downloadPath = filesDir
-        time.sleep(TIME)
+        self.stagingPath = stagingDir
+        self.http = HttpSession()
+        self.downloader = Downloader(self.http)
         self.curWindowHandle = self.driver.current_window_handle
-        print(f"현재 페이지: {self.driver.current_url}", flush=True)
+        log.debug(f"현재 페이지: {self.driver.current_url}")
+
+    def setDownloadBehavior(self, filesDir: str, stagingDir: str) -> None:
+        if not self.options.downloadEvents:
+            # 클릭 다운로드는 filesDir에 바로 저장하고 새 파일이 생기는지 확인한다
+            self.driver.execute_cdp_cmd(
+                "Browser.setDownloadBehavior",
+                {"behavior": "allow", "downloadPath": filesDir},
+            )
+            return
+        self.driver.execute_cdp_cmd(
+            "Browser.setDownloadBehavior",
+            {
+                "behavior": "allowAndName",
+                "downloadPath": stagingDir,
+                "eventsEnabled": True,
+            },
+        )
+
+    def blockResources(self) -> None:
+        # CDP 세션은 탭마다 따로라서 새 탭을 열 때마다 다시 적용해야 한다
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS}
+        )
+
+    def load(self, url: str) -> None:
+        # 페이지 로드는 호스트별 요청 속도 제어를 거치고, 타임아웃이면 속도를 낮춘다
+        limiter.acquire(url)
+        try:
+            self.driver.get(url)
+        except TimeoutException:
+            limiter.failure(url, "timeout")
+            raise
+        limiter.success(url)
+
+    def openTab(self, url: str) -> None:
+        self.driver.switch_to.new_window("tab")
+        if self.options.lean:
+            self.blockResources()
+        with profiler.span("page.tab"):
+            self.load(url)
+
+    def closeTab(self) -> None:
+        self.sampleTabMemory()
+        self.driver.close()
+        self.goToDefaultWindow()
+
+    def sampleTabMemory(self) -> None:
+        # 프로파일링 중일 때만 현재 탭의 JS 힙/DOM 노드 수를 기록
+        if not profiler.enabled:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+            metrics = self.driver.execute_cdp_cmd("Performance.getMetrics", {})
+        except WebDriverException:
+            return
+        values = {m["name"]: m["value"] for m in metrics.get("metrics", [])}
+        if "JSHeapUsedSize" in values:
+            profiler.gauge("tab.jsHeapMb", values["JSHeapUsedSize"] / 1024 / 1024)
+        if "Nodes" in values:
+            profiler.gauge("tab.domNodes", values["Nodes"])
+
+    def retarget(self, downloadDir: str, filesSubDir: str = "") -> None:
+        # 살아있는 브라우저를 다른 작업에 넘길 때 다운로드 경로만 교체
+        filesDir, stagingDir = prepareDownloadDirs(downloadDir, filesSubDir)
+        self.setDownloadBehavior(filesDir, stagingDir)
+        self.downloadPath = filesDir
+        self.stagingPath = stagingDir
+        self.waits.save()
+        self.waits = AdaptiveWait.shared(
+            os.path.join(os.path.dirname(downloadDir), ".wait_stats.json")
+        )
+        log.info(f"파일 다운 경로 변경: {filesDir}")
 
     def close(self) -> None:
+        self.waits.save()
+        self.downloader.close()
+        self.http.close()
         self.driver.quit()
-        print("웹드라이버 종료 완료", flush=True)
+        log.info("웹드라이버 종료 완료")
+
+    def isAlive(self) -> bool:
+        try:
+            self.driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    @profiler.timed("session.reset")
+    def resetSession(self, url: str) -> None:
+        # 이전 config에서 남은 alert 정리
+        try:
+            self.driver.switch_to.alert.accept()
+        except NoAlertPresentException:
+            pass
+
+        # 초기 윈도우를 제외한 창/탭 모두 닫기
+        handles = self.driver.window_handles
+        if self.curWindowHandle not in handles:
+            self.curWindowHandle = handles[0]
+        for handle in handles:
+            if handle != self.curWindowHandle:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+        self.driver.switch_to.window(self.curWindowHandle)
+        self.driver.switch_to.default_content()
 
-    def getElement(self, by: ByType, value: str) -> WebElement:
-        return (
-            WebDriverWait(self.driver, 10)
-            .until(EC.presence_of_element_located((by, value)))
-            .find_element(by, value)
+        # 쿠키, 스토리지 초기화 후 메인 페이지로 이동
+        self.driver.execute_script("""
+                try { window.localStorage.clear(); } catch (e) {}
+                try { window.sessionStorage.clear(); } catch (e) {}
+            """)
+        self.driver.delete_all_cookies()
+        if self.options.downloadEvents:
+            # 쌓여있는 performance 로그 비우기
+            self.driver.get_log("performance")
+        self.sampleTabMemory()
+        with profiler.span("page.main"):
+            self.load(url)
+            self.waitPageReady("mainPage")
+        log.info(f"세션 초기화 완료: {self.driver.current_url}")
+
+    def waitFor(
+        self,
+        point: str,
+        condition: Callable[[Any], Any],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        return self.waits.until(self.driver, point, condition, timeout)
+
+    def waitPageReady(self, point: str) -> None:
+        # 문서 로드 완료 + 진행 중인 jQuery ajax 없음
+        self.waitFor(
+            f"ready:{point}",
+            lambda d: d.execute_script("""
+                return document.readyState === "complete"
+                    && (!window.jQuery || window.jQuery.active === 0);
+                """),
         )
 
-    def clickElement(self, by: ByType, value: str) -> None:
-        self.driver.execute_script(
-            """
+    # 대기 지점(point)은 selector 대신 고정된 이름으로 넘긴다
+    # 검색어/기관명이 들어간 selector를 그대로 쓰면 지점마다 표본이 쌓이지 않는다
+
+    def getElement(
+        self, by: ByType, value: str, point: Optional[str] = None
+    ) -> WebElement:
+        return self.waitFor(
+            f"presence:{point or value}", EC.presence_of_element_located((by, value))
+        ).find_element(by, value)
+
+    def clickElement(
+        self,
+        by: ByType,
+        value: str,
+        point: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.driver.execute_script("""
                 const el = document.querySelector('.rnb');
                 if (el) el.style.display = 'none';
-            """
-        )
-        print(".rnb 요소 숨김 완료", flush=True)
+            """)
+        log.debug(".rnb 요소 숨김 완료")
 
-        el = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((by, value))
+        el = self.waitFor(
+            f"clickable:{point or value}",
+            EC.element_to_be_clickable((by, value)),
+            timeout,
         )
         self.driver.execute_script("arguments[0].click();", el)
-        print("요소 클릭 완료", flush=True)
+        log.debug("요소 클릭 완료")
 
     def typingInputElement(
-        self, by: ByType, value: str, input: str, replace: bool = False
+        self,
+        by: ByType,
+        value: str,
+        input: str,
+        replace: bool = False,
+        point: Optional[str] = None,
     ) -> None:
-        element = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable((by, value))
+        element = self.waitFor(
+            f"clickable:{point or value}", EC.element_to_be_clickable((by, value))
         )
         if replace:
             element.clear()
             element.send_keys(input)
-            return print("대체 완료", flush=True)
+            return log.debug("대체 완료")
         element.send_keys(input)
-        return print("입력 완료", flush=True)
+        return log.debug("입력 완료")
 
-    def focusIframe(self, by: ByType, value: str) -> None:
-        WebDriverWait(self.driver, 10).until(
-            EC.frame_to_be_available_and_switch_to_it((by, value))
+    def focusIframe(self, by: ByType, value: str, point: Optional[str] = None) -> None:
+        self.waitFor(
+            f"iframe:{point or value}",
+            EC.frame_to_be_available_and_switch_to_it((by, value)),
         )
-        print("iframe 전환 완료", flush=True)
+        log.debug("iframe 전환 완료")
 
     def unfocusIframe(self) -> None:
         self.driver.switch_to.default_content()
-        print("기본 컨텐츠로 전환 완료", flush=True)
+        log.debug("기본 컨텐츠로 전환 완료")
 
-    def goToNewWindow(self, by: ByType, value: str) -> None:
+    def goToNewWindow(
+        self, by: ByType, value: str, point: Optional[str] = None
+    ) -> None:
         originalHandles = set(self.driver.window_handles)
 
-        self.clickElement(by, value)
-        WebDriverWait(self.driver, 10).until(
-            lambda d: len(d.window_handles) > len(originalHandles)
+        self.clickElement(by, value, point)
+        self.waitFor(
+            f"newWindow:{point or value}",
+            lambda d: len(d.window_handles) > len(originalHandles),
         )
 
         curHandles = set(self.driver.window_handles)
@@ -122,42 +339,149 @@ class Selenium:
             raise RuntimeError("새 창 전환 실패: 새로운 윈도우를 찾을 수 없습니다")
 
         self.driver.switch_to.window(newHandle.pop())
-        print("새 윈도우로 전환 완료", flush=True)
+        if self.options.lean:
+            # 팝업은 이미 로드를 시작했으므로 이후 요청(ajax 등)부터 적용
+            self.blockResources()
+        log.debug("새 윈도우로 전환 완료")
 
     def goToDefaultWindow(self) -> None:
         self.driver.switch_to.window(self.curWindowHandle)
-        print("초기 윈도우로 이동 완료", flush=True)
+        log.debug("초기 윈도우로 이동 완료")
 
-    def getAllChild(self, by: ByType, value: str) -> List[WebElement]:
-        elements = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_all_elements_located((by, value))
+    def snapshotInputs(self) -> dict:
+        # 현재 문서(iframe)의 입력 요소 값을 id 또는 name 기준으로 수집
+        return self.driver.execute_script("""
+            const values = {};
+            for (const el of document.querySelectorAll("input, select, textarea")) {
+                if (el.type === "checkbox" || el.type === "radio") continue;
+                const key = el.id ? "#" + el.id : el.name ? "@" + el.name : null;
+                if (key) values[key] = el.value;
+            }
+            return values;
+            """)
+
+    def applyInputs(self, fields: dict) -> bool:
+        # snapshotInputs와 같은 키 형식의 값을 주입, 대상이 하나라도 없으면 False
+        applied = self.driver.execute_script(
+            """
+            const fields = arguments[0];
+            const targets = [];
+            for (const key of Object.keys(fields)) {
+                const el = key.startsWith("#")
+                    ? document.getElementById(key.slice(1))
+                    : document.getElementsByName(key.slice(1))[0];
+                if (!el) return false;
+                targets.push([el, fields[key]]);
+            }
+            for (const [el, value] of targets) {
+                el.value = value;
+                el.dispatchEvent(new Event("change", { bubbles: true }));
+            }
+            return true;
+            """,
+            fields,
+        )
+        log.debug(f"입력값 직접 주입 {'완료' if applied else '실패'}")
+        return bool(applied)
+
+    def extract(self, spec: Dict[str, ExtractField]) -> Dict[str, Any]:
+        # 이름 붙인 선택자들의 텍스트/속성을 execute_script 한 번으로 모두 읽는다
+        for name, field in spec.items():
+            if field["by"] not in ("css selector", "xpath"):
+                raise ValueError(f"지원하지 않는 선택자 종류: {name} ({field['by']})")
+        return self.driver.execute_script(
+            """
+            const read = (el, attr) => {
+                if (attr === "text") return (el.innerText || el.textContent || "").trim();
+                if (attr === "html") return el.innerHTML;
+                return el.getAttribute(attr);
+            };
+            const find = (field) => {
+                if (field.by === "css selector") {
+                    return Array.from(document.querySelectorAll(field.value));
+                }
+                const snap = document.evaluate(
+                    field.value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+                );
+                return Array.from({ length: snap.snapshotLength }, (_, i) => snap.snapshotItem(i));
+            };
+            const out = {};
+            for (const [name, field] of Object.entries(arguments[0])) {
+                const attr = field.attr || "text";
+                const els = find(field);
+                out[name] = field.many
+                    ? els.map((el) => read(el, attr))
+                    : els.length ? read(els[0], attr) : null;
+            }
+            return out;
+            """,
+            spec,
+        )
+
+    def waitExtract(
+        self, point: str, spec: Dict[str, ExtractField], timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        # 단일 값 필드가 모두 나타날 때까지 extract를 반복, 마지막 결과를 반환
+        result: Dict[str, Any] = {}
+
+        def ready(_) -> bool:
+            result.update(self.extract(spec))
+            return all(
+                result[name] is not None
+                for name, field in spec.items()
+                if not field.get("many")
+            )
+
+        self.waitFor(point, ready, timeout)
+        return result
+
+    def getAllChild(
+        self, by: ByType, value: str, point: Optional[str] = None
+    ) -> List[WebElement]:
+        elements = self.waitFor(
+            f"presenceAll:{point or value}",
+            EC.presence_of_all_elements_located((by, value)),
         )
         return elements
 
-    def waitStaleness(self, el: WebElement) -> None:
-        self.wait.until(EC.staleness_of(el))
+    def waitStaleness(self, el: WebElement, point: str = "staleness") -> None:
+        self.waitFor(point, EC.staleness_of(el))
+
+    def countElements(
+        self, by: ByType, value: str, point: str, timeout: float = 5
+    ) -> int:
+        # 없을 수도 있는 요소는 고정 시간만 기다리고 0개로 본다
+        try:
+            return len(
+                self.waitFor(
+                    point, EC.presence_of_all_elements_located((by, value)), timeout
+                )
+            )
+        except TimeoutException:
+            return 0
 
+    @profiler.timed("downloads")
     def downloadOpenGoKr(
         self, by: ByType, value: str, timeout: int = 60
     ) -> Tuple[List, bool]:
         # element가 모두 로드될 때까지 대기
-        print(f"현재 페이지: {self.driver.current_url}", flush=True)
+        log.debug(f"현재 페이지: {self.driver.current_url}")
         try:
-            WebDriverWait(self.driver, 5).until(
-                EC.presence_of_all_elements_located((by, value))
+            self.waitFor(
+                "downloadButtons",
+                EC.presence_of_all_elements_located((by, value)),
+                timeout=5,
             )
         except TimeoutException:
-            print("매칭되는 다운로드 버튼이 없습니다.", flush=True)
+            log.info("매칭되는 다운로드 버튼이 없습니다.")
             return ([], False)
 
         # RNB 제거!
-        self.driver.execute_script(
-            """
+        self.driver.execute_script("""
             const el = document.querySelector('.rnb');
             if (el) el.style.display = 'none';
-        """
-        )
-        print("RNB 제거 완료", flush=True)
+        """)
+        log.debug("RNB 제거 완료")
 
         # 다운로드 버튼 elements 추출
         elements = self.driver.find_elements(by, value)
@@ -167,70 +491,207 @@ class Selenium:
         downloadedFiles = []
         hasMissingDownloads = False
 
+        # --downloadCapture면 버튼이 보내는 실제 요청을 가로채서 HTTP로 동시에 스트리밍 다운로드
+        results = []
+        if self.options.downloadCapture:
+            try:
+                requests = self.resolveDownloadRequests(elements)
+                self.http.syncCookies(self.driver)
+                results = self.downloader.downloadAll(
+                    requests, self.downloadPath, self.driver.current_url
+                )
+            except WebDriverException as e:
+                log.warn(f"다운로드 요청 분석 실패, 클릭 방식으로 진행: {e}")
+
         # 각 버튼들에 대해서 순회 시작
         for idx, el in enumerate(elements, start=1):
-            # 버튼 클릭 전에 존재하는 파일 경로 집합 저장
-            existFiles = set(glob.glob(os.path.join(self.downloadPath, "*")))
-            # 파일 하나 다운 성공했는지를 체크하는 flag
-            downloaded = False
-            # 파일 하나 다운 재시도 횟수
-            attempts = 0
-
-            # 다운로드를 최대 10번 시도하는 반복문
-            while attempts < 10 and not downloaded:
-                try:
-                    el.click()
-                    print(
-                        f"[{idx}/{len(elements)}] 다운로드 버튼 클릭 ({attempts}번째)",
-                        flush=True,
-                    )
-                except ElementClickInterceptedException:
-                    print(f"[{idx}/{len(elements)}] 클릭 차단됨", flush=True)
-                    pass
-                # 버튼 하나 클릭 후 기다린 시간
-                elapsed = 0
-                while elapsed < timeout:
-                    curFiles = set(glob.glob(os.path.join(self.downloadPath, "*")))
-                    newFiles = [
-                        f for f in curFiles - existFiles if isDownloadFinished(f)
-                    ]
-                    if len(newFiles) > 0:
-                        newFiles.sort(key=os.path.getctime, reverse=True)
-                        downloadedFiles.append(newFiles[0])
-                        print(
-                            f"[{idx}/{len(elements)}] 다운로드 완료: {newFiles[0]}",
-                            flush=True,
-                        )
-                        downloaded = True
-                        break
-                    # 다운되지 않았다면, alert 창이 뜨지는 않았는지 체크
-                    try:
-                        alert = self.driver.switch_to.alert
-                        alert.accept()
-                        print(
-                            f"[{idx}/{len(elements)}] 다운로드 실패 alert 확인, 재시도 예정",
-                            flush=True,
-                        )
-                        break
-                    except NoAlertPresentException:
-                        pass
-
-                    time.sleep(1)
-                    elapsed += 1
-
-                if not downloaded:
-                    attempts += 1
-                    time.sleep(1)
-            if not downloaded:
-                print(
-                    f"[{idx}/{len(elements)}] 다운로드 실패: {attempts}회 재시도 후에도 완료되지 않음",
-                    flush=True,
-                )
+            result = results[idx - 1] if idx <= len(results) else None
+            if result:
+                downloadedFiles.append(result["path"])
+                continue
+            # 클릭 방식으로 받기 (스트리밍을 썼다면 실패한 파일만 재시도)
+            filePath = self.clickDownload(el, idx, len(elements), timeout)
+            if filePath:
+                downloadedFiles.append(filePath)
+            else:
                 hasMissingDownloads = True
 
         return (downloadedFiles, hasMissingDownloads)
 
+    def resolveDownloadRequests(
+        self, elements: List[WebElement]
+    ) -> List[Optional[DownloadRequest]]:
+        # 페이지 코드는 실행하지 않고 href, 버튼이 속한 form, onclick 안의 URL만 읽는다
+        # 함수 호출로만 요청을 만드는 버튼은 None으로 남겨 클릭 방식으로 받는다
+        attrs = self.driver.execute_script(
+            """
+            return arguments[0].map((el) => {
+                // 페이지 전체를 감싼 form이 흔하므로 submit 버튼일 때만 form을 본다
+                const form = el.form && ["submit", "image"].includes(el.type) ? el.form : null;
+                return {
+                    href: el.getAttribute("href"),
+                    onclick: el.getAttribute("onclick"),
+                    form: form && form.getAttribute("action") ? {
+                        method: (form.method || "GET").toUpperCase(),
+                        url: new URL(form.getAttribute("action"), location.href).href,
+                        fields: Array.from(new FormData(form).entries())
+                            .filter(([, v]) => typeof v === "string"),
+                    } : null,
+                };
+            });
+            """,
+            elements,
+        )
+        referer = self.driver.current_url
+        requests = [downloadRequestOf(item, referer) for item in attrs]
+        resolved = sum(1 for req in requests if req)
+        log.debug(f"다운로드 요청 {resolved}/{len(elements)}건 확인")
+        return requests
+
+    @profiler.timed("download.click")
+    def clickDownload(
+        self, el: WebElement, idx: int, total: int, timeout: int
+    ) -> Optional[str]:
+        # 파일 하나 다운 재시도 횟수
+        attempts = 0
+        # 버튼 클릭 전에 존재하는 파일 경로 집합 저장 (이벤트를 쓰지 않을 때)
+        existFiles = set() if self.options.downloadEvents else self.listDownloads()
+
+        # 다운로드를 최대 10번 시도하는 반복문
+        while attempts < 10:
+            if self.options.downloadEvents:
+                # 이전 클릭에서 남은 이벤트 비우기
+                self.pollDownloadEvents()
+            # 클릭 다운로드도 현재 페이지 호스트 기준으로 속도 제어
+            pageUrl = self.driver.current_url
+            limiter.acquire(pageUrl)
+            try:
+                el.click()
+                log.debug(
+                    f"[{idx}/{total}] 다운로드 버튼 클릭 ({attempts}번째)",
+                )
+            except ElementClickInterceptedException:
+                log.warn(f"[{idx}/{total}] 클릭 차단됨")
+                pass
+
+            if self.options.downloadEvents:
+                filePath, failed = self.waitDownloadEvent(idx, total, timeout)
+            else:
+                filePath, failed = self.waitDownloadFile(
+                    existFiles, idx, total, timeout
+                )
+            if filePath:
+                limiter.success(pageUrl)
+                log.debug(f"[{idx}/{total}] 다운로드 완료: {filePath}")
+                return filePath
+            if failed:
+                log.warn(
+                    f"[{idx}/{total}] 다운로드 실패 alert 확인, 재시도 예정",
+                )
+                limiter.failure(pageUrl, "alert")
+            else:
+                limiter.failure(pageUrl, "timeout")
+
+            attempts += 1
+            profiler.count("retry.downloadClick")
+            # 고정 1초 대기 대신 다음 acquire가 낮아진 속도만큼 기다린다
+
+        log.warn(
+            f"[{idx}/{total}] 다운로드 실패: {attempts}회 재시도 후에도 완료되지 않음",
+        )
+        return None
+
+    def waitDownloadEvent(
+        self, idx: int, total: int, timeout: int
+    ) -> Tuple[Optional[str], bool]:
+        # 클릭으로 시작된 다운로드의 guid와 파일명을 이벤트로 추적, (파일 경로, alert 여부)
+        guid, fileName = None, None
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            for method, params in self.pollDownloadEvents():
+                if method == "Page.downloadWillBegin" and guid is None:
+                    guid = params["guid"]
+                    fileName = params.get("suggestedFilename") or guid
+                elif method == "Page.downloadProgress" and params["guid"] == guid:
+                    if params["state"] == "completed":
+                        return (self.moveStagedDownload(guid, fileName or guid), False)
+                    if params["state"] == "canceled":
+                        log.warn(f"[{idx}/{total}] 다운로드 취소됨")
+                        return (None, False)
+                elif method == "Page.javascriptDialogOpening":
+                    # 다운로드 실패 alert
+                    self.acceptAlert()
+                    return (None, True)
+            time.sleep(0.2)
+        return (None, False)
+
+    def waitDownloadFile(
+        self, existFiles: Set[str], idx: int, total: int, timeout: int
+    ) -> Tuple[Optional[str], bool]:
+        # 클릭 전에 없던 파일 중 다운로드가 끝난 파일을 찾음, (파일 경로, alert 여부)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            newFiles = [
+                f for f in self.listDownloads() - existFiles if isDownloadFinished(f)
+            ]
+            if newFiles:
+                newFiles.sort(key=os.path.getctime, reverse=True)
+                return (newFiles[0], False)
+            # 다운되지 않았다면, alert 창이 뜨지는 않았는지 체크
+            if self.acceptAlert():
+                return (None, True)
+            time.sleep(0.5)
+        return (None, False)
+
+    def acceptAlert(self) -> bool:
+        try:
+            self.driver.switch_to.alert.accept()
+            return True
+        except NoAlertPresentException:
+            return False
+
+    def listDownloads(self) -> Set[str]:
+        return {
+            f
+            for f in glob.glob(os.path.join(self.downloadPath, "*"))
+            if os.path.isfile(f)
+        }
+
+    def pollDownloadEvents(self) -> List[Tuple[str, dict]]:
+        # chromedriver의 performance 로그는 Network/Page/Tracing 도메인 이벤트만 넘겨주므로
+        # Browser.downloadWillBegin/downloadProgress는 여기서 받을 수 없다.
+        # Browser.setDownloadBehavior(eventsEnabled)는 staging에 GUID 이름으로 저장하는 데 쓰고,
+        # 완료는 같은 guid로 오는 Page.downloadWillBegin/downloadProgress로 판단한다.
+        events = []
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method", "")
+            if method in (
+                "Page.downloadWillBegin",
+                "Page.downloadProgress",
+                "Page.javascriptDialogOpening",
+            ):
+                events.append((method, message.get("params", {})))
+        return events
+
+    def moveStagedDownload(self, guid: str, fileName: str) -> str:
+        filePath = reserveFilePath(self.downloadPath, os.path.basename(fileName))
+        shutil.move(os.path.join(self.stagingPath, guid), filePath)
+        return filePath
+
 
 def isDownloadFinished(filePath: str) -> bool:
     unstableExts = [".tmp", ".crdownload", ".part"]
     return not any(filePath.endswith(ext) for ext in unstableExts)
+
+
+def prepareDownloadDirs(downloadDir: str, filesSubDir: str = "") -> Tuple[str, str]:
+    # 워커별로 다운로드 디렉토리를 분리해야 파일이 서로 섞이지 않음
+    filesDir = os.path.join(downloadDir, "files")
+    if filesSubDir:
+        filesDir = os.path.join(filesDir, filesSubDir)
+    os.makedirs(filesDir, exist_ok=True)
+    # Chrome은 GUID 이름으로 staging에 저장하고, 완료 이벤트 후 filesDir로 옮긴다
+    stagingDir = os.path.join(filesDir, ".staging")
+    os.makedirs(stagingDir, exist_ok=True)
+    return (filesDir, stagingDir)
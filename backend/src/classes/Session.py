@@ -0,0 +1,140 @@
+from classes.Selenium import Selenium
+from classes.EngineOptions import EngineOptions
+from selenium.common.exceptions import WebDriverException
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from classes.Logger import log
+from classes.Profiler import profiler
+import re
+
+# 검색 결과 페이지 URL의 검색어 파라미터, 다시 열 때 이 값만 바꾼다
+KEYWORD_PARAM = "kwd"
+# URL에 반드시 있어야 하는 검색 조건 파라미터 (기관 코드, 기간)
+CONDITION_PARAMS = ("insttCd", "startDate", "endDate")
+# 포함/제외어 파라미터, condition의 include/exclude 순서
+FILTER_PARAMS = ("mustKeyword", "ignoreKeyword")
+
+
+class BrowserSession:
+    """
+    여러 config에 걸쳐 하나의 Chrome 세션을 재사용한다.
+    config 사이에는 메인 페이지로 리셋하고, 세션이 죽은 경우에만 새로 띄운다.
+    """
+
+    browser: Optional[Selenium]
+
+    def __init__(
+        self,
+        url: str,
+        downloadDir: str,
+        debug: str,
+        filesSubDir: str = "",
+        options: Optional[EngineOptions] = None,
+    ) -> None:
+        self.url = url
+        self.downloadDir = downloadDir
+        self.debug = debug
+        self.filesSubDir = filesSubDir
+        self.options = options or EngineOptions()
+        self.browser = None
+        # 마지막 검색 결과 페이지 (url, 검색어, 검색 조건)
+        self.lastSearch: Optional[Tuple[str, str, Tuple]] = None
+
+    def acquire(self, url: Optional[str] = None) -> Selenium:
+        """url이 있으면 메인 페이지 대신 그 페이지로 초기화 (새로 띄운 브라우저는 항상 메인 페이지)"""
+        if self.browser is None:
+            self.browser = Selenium(
+                self.url, self.downloadDir, self.debug, self.filesSubDir, self.options
+            )
+            return self.browser
+
+        if not self.browser.isAlive():
+            log.warn("브라우저 세션이 종료되어 재생성합니다.")
+            return self.rebuild()
+
+        try:
+            self.browser.resetSession(url or self.url)
+        except WebDriverException as e:
+            log.warn(f"세션 초기화 실패, 브라우저 재생성: {e}")
+            return self.rebuild()
+        return self.browser
+
+    def rememberSearch(self, url: str, query: str, condition: Tuple) -> None:
+        self.lastSearch = (url, query, condition)
+
+    def revisitUrl(self, query: str, condition: Tuple) -> Optional[str]:
+        """
+        검색 조건이 같으면 마지막 결과 페이지 URL에서 검색어 파라미터만 바꾼 URL.
+        기관 코드와 기간(포함/제외어가 있으면 그것도)이 URL에 없으면 조건이 서버나 POST에
+        있다는 뜻이므로 None
+        """
+        if self.lastSearch is None:
+            return None
+        url, lastQuery, lastCondition = self.lastSearch
+        if lastCondition != condition or lastQuery == query:
+            return None
+        parts = urlsplit(url)
+        fields = parse_qsl(parts.query, keep_blank_values=True)
+        if not conditionInUrl(dict(fields), lastQuery, condition):
+            return None
+        fields = [
+            (key, query if key == KEYWORD_PARAM else value) for key, value in fields
+        ]
+        return parts._replace(query=urlencode(fields)).geturl()
+
+    def configure(self, options: EngineOptions) -> None:
+        # 데몬의 warm 세션을 다른 옵션의 작업에 넘길 때 사용
+        launchChanged = options.launchKey() != self.options.launchKey()
+        self.options = options
+        if self.browser is None:
+            return
+        if launchChanged:
+            # Chrome 인자로 정해지는 옵션이 바뀌면 다음 acquire에서 새로 띄움
+            log.info("엔진 옵션이 바뀌어 브라우저를 다시 띄웁니다.")
+            self.close()
+        else:
+            self.browser.options = options
+
+    def retarget(self, downloadDir: str) -> None:
+        # 데몬의 warm 세션을 다른 작업 디렉토리로 넘길 때 사용
+        self.downloadDir = downloadDir
+        if self.browser is not None and self.browser.isAlive():
+            self.browser.retarget(downloadDir, self.filesSubDir)
+
+    def rebuild(self) -> Selenium:
+        profiler.count("retry.sessionRebuild")
+        self.close()
+        self.browser = Selenium(
+            self.url, self.downloadDir, self.debug, self.filesSubDir, self.options
+        )
+        return self.browser
+
+    def close(self) -> None:
+        self.lastSearch = None
+        if self.browser is None:
+            return
+        try:
+            self.browser.close()
+        except WebDriverException:
+            pass
+        self.browser = None
+
+
+def conditionInUrl(params: Dict[str, str], query: str, condition: Tuple) -> bool:
+    # condition: (기관명, 지역명, 시작일, 종료일, 포함어, 제외어)
+    _, _, startDate, endDate, include, exclude = condition
+    if params.get(KEYWORD_PARAM) != query or not params.get("insttCd"):
+        return False
+    if digitsOf(params.get("startDate")) != digitsOf(startDate):
+        return False
+    if digitsOf(params.get("endDate")) != digitsOf(endDate):
+        return False
+    for key, value in zip(FILTER_PARAMS, (include, exclude)):
+        expected = "" if value in (None, "null") else value
+        if params.get(key, "") != expected:
+            return False
+    return True
+
+
+def digitsOf(value: Optional[str]) -> str:
+    return re.sub(r"[^0-9]", "", value or "")
@@ -0,0 +1,116 @@
+import json
+import os
+import threading
+import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from typing import Any, Callable, Dict, List, Optional
+from classes.Logger import log
+from classes.Profiler import profiler
+
+MIN_SAMPLES = 20
+MAX_SAMPLES = 200
+
+
+class AdaptiveWait:
+    """
+    대기 지점별로 실제 걸린 시간을 기록하고, 측정된 p99를 기준으로 타임아웃을 정한다.
+    타임아웃은 걸린 시간 표본에 섞지 않고 지점별 연속 횟수로 따로 세어, 연속될 때마다 한도를 늘린다.
+    기록은 파일로 남겨서 다음 실행에도 이어서 사용한다.
+    """
+
+    instances: Dict[str, "AdaptiveWait"] = {}
+    instancesLock = threading.Lock()
+
+    def __init__(
+        self,
+        statsPath: Optional[str] = None,
+        defaultTimeout: float = 10,
+        minTimeout: float = 3,
+        maxTimeout: float = 60,
+        factor: float = 2.0,
+    ) -> None:
+        self.statsPath = statsPath
+        self.defaultTimeout = defaultTimeout
+        self.minTimeout = minTimeout
+        self.maxTimeout = maxTimeout
+        self.factor = factor
+        self.lock = threading.Lock()
+        self.samples: Dict[str, List[float]] = {}
+        # 지점별 연속 타임아웃 횟수, 조건이 한 번 충족되면 0으로 돌아간다
+        self.timeouts: Dict[str, int] = {}
+        if statsPath and os.path.exists(statsPath):
+            try:
+                with open(statsPath, encoding="utf-8") as f:
+                    stats = json.load(f)
+                self.samples = stats.get("samples", {})
+                self.timeouts = stats.get("timeouts", {})
+            except (OSError, ValueError, AttributeError):
+                log.warn(f"대기 통계 로드 실패, 기본값 사용: {statsPath}")
+
+    @classmethod
+    def shared(cls, statsPath: str) -> "AdaptiveWait":
+        # 워커들이 같은 통계 파일을 공유하도록 경로별로 하나만 생성
+        with cls.instancesLock:
+            if statsPath not in cls.instances:
+                cls.instances[statsPath] = cls(statsPath)
+            return cls.instances[statsPath]
+
+    def timeoutFor(self, point: str) -> float:
+        with self.lock:
+            samples = sorted(self.samples.get(point, []))
+            timeouts = self.timeouts.get(point, 0)
+        if len(samples) < MIN_SAMPLES:
+            timeout = self.defaultTimeout
+        else:
+            p99 = samples[int(0.99 * (len(samples) - 1))]
+            timeout = max(p99 * self.factor, self.minTimeout)
+        return min(timeout * self.factor**timeouts, self.maxTimeout)
+
+    def record(self, point: str, elapsed: float) -> None:
+        with self.lock:
+            samples = self.samples.setdefault(point, [])
+            samples.append(round(elapsed, 3))
+            del samples[:-MAX_SAMPLES]
+            self.timeouts.pop(point, None)
+
+    def recordTimeout(self, point: str) -> None:
+        with self.lock:
+            self.timeouts[point] = self.timeouts.get(point, 0) + 1
+
+    def until(
+        self,
+        driver: WebDriver,
+        point: str,
+        condition: Callable[[Any], Any],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        limit = timeout if timeout is not None else self.timeoutFor(point)
+        start = time.monotonic()
+        try:
+            result = WebDriverWait(driver, limit, poll_frequency=0.1).until(condition)
+        except TimeoutException:
+            # 걸린 시간 표본(p99)은 그대로 두고, 연속 타임아웃 횟수만큼 다음 한도를 늘림
+            # timeout을 직접 넘긴 대기는 "없음"이 정상 결과일 수 있으므로 한도에 반영하지 않는다
+            if timeout is None:
+                self.recordTimeout(point)
+            profiler.count(f"waitTimeout.{point.split(':')[0]}")
+            raise
+        self.record(point, time.monotonic() - start)
+        return result
+
+    def save(self) -> None:
+        if not self.statsPath:
+            return
+        with self.lock:
+            data = json.dumps(
+                {"samples": self.samples, "timeouts": self.timeouts},
+                ensure_ascii=False,
+            )
+        os.makedirs(os.path.dirname(self.statsPath), exist_ok=True)
+        # 쓰다가 죽어도 이전 통계가 남도록 임시 파일에 쓰고 교체
+        tmpPath = f"{self.statsPath}.{os.getpid()}.tmp"
+        with open(tmpPath, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmpPath, self.statsPath)
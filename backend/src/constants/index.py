@@ -1,7 +1,57 @@
+import os
 from typing import Literal
 
+# 벤치마크/오프라인 테스트에서는 로컬 가짜 서버 주소로 교체
+OPEN_GO_KR_BASE_URL = os.environ.get(
+    "OPEN_GO_KR_BASE_URL", "https://www.open.go.kr"
+).rstrip("/")
+OPEN_GO_KR_MAIN_URL = f"{OPEN_GO_KR_BASE_URL}/com/main/mainView.do"
+OPEN_GO_KR_DETAIL_URL = f"{OPEN_GO_KR_BASE_URL}/othicInfo/infoList/infoListDetl.do"
 
-TIME = 3
+# --daemon socket의 공유 비밀을 넘기는 환경변수 (--token 대신, 프로세스 목록에 노출되지 않음)
+DAEMON_TOKEN_ENV = "OPEN_GO_KR_ENGINE_TOKEN"
+
+# baseDir 아래 결과 디렉토리와 실행 간 공유 파일 이름
+DIR_NAME = "excel_database"
+JOURNAL_NAME = "crawl_state.sqlite3"
+# 엑셀 파일별 결과 저장소(<엑셀 이름>.results.sqlite3), 엑셀은 여기서 만든다
+RESULTS_SUFFIX = ".results.sqlite3"
+STORE_NAME = ".attachments"
+INSTITUTION_CACHE_NAME = ".institutions.json"
+
+# Selenium Manager로 찾은 chromedriver/Chrome 경로를 실행 간에 공유하는 캐시
+CACHE_DIR = os.path.join(
+    os.environ.get("LOCALAPPDATA")
+    or os.environ.get("XDG_CACHE_HOME")
+    or os.path.join(os.path.expanduser("~"), ".cache"),
+    "opengokr",
+)
+DRIVER_CACHE_PATH = os.path.join(CACHE_DIR, "driver_paths.json")
+# 드라이버 기동 재시도: 최대 횟수, 지수 백오프 시작/최대 대기(초)
+DRIVER_START_ATTEMPTS = 5
+DRIVER_BACKOFF_BASE = 1.0
+DRIVER_BACKOFF_MAX = 30.0
+# 기관찾기 검색 결과 대기(초), 결과가 없는 경우도 흔해서 측정값으로 늘리지 않는다
+INSTITUTION_RESULT_TIMEOUT = 10.0
+
+# 검색 결과 페이지 스크린샷: 처리 스레드 수, 동시에 처리 중인 캡처 수 상한(메모리 제한), 품질, 썸네일 크기(px)
+SCREENSHOT_DIR_NAME = "screenshots"
+SCREENSHOT_WORKERS = 2
+SCREENSHOT_MAX_PENDING = 4
+SCREENSHOT_QUALITY = 80
+SCREENSHOT_THUMB_QUALITY = 70
+SCREENSHOT_THUMB_SIZE = (360, 540)
+
+# 호스트별 요청 속도 제어(token bucket + AIMD), 상태는 프로세스 간에 파일로 공유
+RATE_STATE_DIR = os.path.join(CACHE_DIR, "rate")
+RATE_INITIAL = 5.0  # 초당 요청 수
+RATE_MIN = 0.2
+RATE_MAX = 20.0
+RATE_BURST = 5.0  # 쉬고 있던 호스트에 한 번에 보낼 수 있는 요청 수
+RATE_INCREASE = 0.1  # 성공할 때마다 더하는 초당 요청 수
+RATE_DECREASE = 0.5  # 실패(alert, 타임아웃, 5xx) 시 곱하는 비율
+RATE_COOLDOWN = 2.0  # 연달아 실패해도 이 시간(초) 안에는 한 번만 줄인다
+FILE_LOCK_TIMEOUT = 10.0  # lock file을 이 시간(초) 안에 못 잡으면 잠금 없이 진행
 
 ByType = Literal[
     "id",
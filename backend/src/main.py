@@ -1,44 +1,202 @@
+import time
+
+# --startup-benchmark 기준 시각, 다른 import보다 먼저 기록
+MAIN_STARTED = time.perf_counter()
+
 import argparse
 import sys, json
 import os
-from services.openGoKr import crawlOpenGoKr
+from classes.ConfigStream import ConfigStream
+from classes.Logger import log
+from classes.Profiler import profiler
+from constants.index import DAEMON_TOKEN_ENV
 import io
 
+# selenium/openpyxl을 끌어오는 크롤링 모듈(services.runner, services.daemon)은
+# 인자 검증이 끝나고 실제로 크롤링을 시작할 때 import 한다
+
 if sys.stdout.encoding.lower() != "utf-8":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
 
-DIR_NAME = "excel_database"
+
+def buildParser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser()
+    # 데몬 모드에서는 작업(submit)마다 받으므로 필수가 아님
+    parser.add_argument("--baseDir")
+    parser.add_argument("--excelName")
+    parser.add_argument("--data", type=str)
+    # JSON Lines config 파일 경로("-"면 stdin), 첫 줄이 들어오는 즉시 크롤링 시작
+    parser.add_argument("--dataFile", "--data-file", dest="dataFile", type=str)
+    # dataFile 끝에서 추가되는 줄을 기다림, {"end": true} 줄에서 종료
+    parser.add_argument(
+        "--follow", type=str, default="false", choices=["true", "false"]
+    )
+    # 스트리밍 입력의 전체 config 수(알고 있는 경우), 진행률과 남은 시간 계산에만 사용
+    parser.add_argument("--total", type=int, default=0)
+    # 스트리밍 입력의 실행 구분용 id, 같은 id로 다시 실행하면 중단된 실행을 이어서 진행
+    parser.add_argument("--runId", type=str, default="")
+    parser.add_argument("--debug", type=str)
+    parser.add_argument(
+        "--reuseSession", type=str, default="true", choices=["true", "false"]
+    )
+    parser.add_argument("--workers", type=int, default=1)
+    # store: 결과를 SQLite 저장소에 쌓고 엑셀은 마지막(체크포인트)에 한 번에 생성
+    # stream: 메모리에 행을 모아 마지막에 생성, legacy: 문서마다 openpyxl 워크북에 직접 기록
+    parser.add_argument(
+        "--excelMode", type=str, default="legacy", choices=["store", "stream", "legacy"]
+    )
+    # store 모드에서 엑셀과 함께 결과를 CSV/Parquet(pyarrow 필요)로도 내보냄
+    parser.add_argument(
+        "--resultExport", type=str, default="none", choices=["none", "csv", "parquet"]
+    )
+    # 브라우저에 그려진 검색 결과 페이지마다 전체 스크린샷, 엑셀 Images 시트에는 원본 링크와 썸네일만
+    parser.add_argument(
+        "--screenshots", type=str, default="false", choices=["true", "false"]
+    )
+    parser.add_argument(
+        "--screenshotFormat", type=str, default="webp", choices=["webp", "jpeg"]
+    )
+    # store/stream 모드에서 중간 저장 주기(초), 0이면 마지막에 한 번만 저장
+    parser.add_argument("--checkpointInterval", type=float, default=0)
+    # 중단된 실행을 이어서 진행하기 위한 SQLite 기록 사용 여부
+    parser.add_argument(
+        "--journal", type=str, default="false", choices=["true", "false"]
+    )
+    # 검색 조건별 워터마크(최근 생산일자, 처리한 문서)로 기간을 줄이고 새 문서만 추가 (journal 필요)
+    parser.add_argument(
+        "--incremental", type=str, default="false", choices=["true", "false"]
+    )
+    # excel_database 전체에서 첨부파일을 내용 해시 기준으로 공유
+    parser.add_argument(
+        "--attachmentStore", type=str, default="false", choices=["true", "false"]
+    )
+    # 기관찾기 결과 캐시 사용 여부, prewarm은 크롤링 전에 기관을 일괄 조회 (only면 조회만)
+    parser.add_argument(
+        "--institutionCache", type=str, default="false", choices=["true", "false"]
+    )
+    parser.add_argument(
+        "--prewarm", type=str, default="false", choices=["true", "false", "only"]
+    )
+    # debug 레벨 로그까지 메시지마다 바로 출력
+    parser.add_argument(
+        "--verbose", type=str, default="false", choices=["true", "false"]
+    )
+    # 단계별 소요 시간 리포트(profile_*.json), sample이면 스택 샘플링도 함께 기록
+    parser.add_argument(
+        "--profile", type=str, default="false", choices=["true", "false", "sample"]
+    )
+    parser.add_argument("--profileInterval", type=float, default=0.01)
+    # 상주 모드: stdin 또는 로컬 TCP 소켓으로 작업을 받고 warm 브라우저를 재사용
+    parser.add_argument(
+        "--daemon", type=str, default="false", choices=["false", "stdin", "socket"]
+    )
+    parser.add_argument("--port", type=int, default=0)
+    # socket 모드의 공유 비밀, 명령마다 "token" 필드로 보내야 함 (환경변수 OPEN_GO_KR_ENGINE_TOKEN도 가능)
+    parser.add_argument("--token", type=str, default="")
+    parser.add_argument("--warm", type=int, default=1)
+    # 이미지/폰트/분석 스크립트 차단, eager 페이지 로드, 불필요한 Chrome 기능 끄기
+    parser.add_argument("--lean", type=str, default="false", choices=["true", "false"])
+    # 상세 페이지를 탭 대신 HTTP로 먼저 읽음, 실패하거나 첨부파일이 있으면 탭으로 처리
+    parser.add_argument(
+        "--httpDetail", type=str, default="false", choices=["true", "false"]
+    )
+    # 다운로드 버튼이 보내는 요청을 클릭 없이 읽어서 HTTP로 동시에 받음, 실패한 파일만 클릭으로 재시도
+    parser.add_argument(
+        "--downloadCapture", type=str, default="false", choices=["true", "false"]
+    )
+    # 클릭 다운로드 완료를 폴더 감시 대신 Chrome 다운로드 이벤트(CDP)로 감지
+    parser.add_argument(
+        "--downloadEvents", type=str, default="false", choices=["true", "false"]
+    )
+    # 검색 결과 목록을 다음 페이지 요청(XHR) 재현으로 모음, 재현 결과가 실제 2페이지와 다르면 클릭으로 순회
+    parser.add_argument(
+        "--listReplay", type=str, default="false", choices=["true", "false"]
+    )
+    # 호스트별 요청 속도 자동 조절(alert/타임아웃/5xx면 낮추고 성공하면 올림), 프로세스 간 공유
+    parser.add_argument(
+        "--rateLimit", type=str, default="false", choices=["true", "false"]
+    )
+    # 실행부터 첫 동작(메인 페이지 로드)까지 구간별 시간만 재고 종료, imports면 브라우저 없이 모듈 로드까지
+    parser.add_argument(
+        "--startup-benchmark",
+        "--startupBenchmark",
+        dest="startupBenchmark",
+        type=str,
+        default="false",
+        choices=["true", "false", "imports"],
+    )
+    return parser
+
+
+def configureEngine(args) -> None:
+    # 프로세스 전역 설정만 여기서 적용, 브라우저 옵션(--lean 등)은 실행마다 EngineOptions로 넘김
+    from classes.RateLimiter import limiter
+
+    limiter.configure(enabled=args.rateLimit == "true")
 
 
 def main():
     if len(sys.argv) < 2:
-        print("사용법: '<JSON 배열 또는 객체>'", flush=True)
+        log.error("사용법: '<JSON 배열 또는 객체>'")
         sys.exit(1)
 
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--baseDir", required=True)
-    parser.add_argument("--excelName", required=True)
-    parser.add_argument("--data", type=str, required=True)
-    parser.add_argument("--debug", type=str, required=True)
-    args = parser.parse_args()
+    args = buildParser().parse_args()
+    log.configure(verbose=args.verbose == "true")
 
-    try:
-        configs = json.loads(args.data)
-    except json.JSONDecodeError:
-        print("--data 파라미터 이슈", flush=True)
+    if args.startupBenchmark != "false":
+        from services.startup import runStartupBenchmark
+
+        runStartupBenchmark(args, MAIN_STARTED, time.perf_counter())
+        return
+    if args.daemon != "false":
+        from services.daemon import serveDaemon
+
+        token = args.token or os.environ.get(DAEMON_TOKEN_ENV, "")
+        if args.daemon == "socket" and not token:
+            log.error(
+                f"--daemon socket에는 --token 또는 {DAEMON_TOKEN_ENV}가 필요합니다."
+            )
+            sys.exit(1)
+        configureEngine(args)
+        serveDaemon(args, buildParser, token)
+        return
+    if not (args.baseDir and args.excelName and args.debug):
+        log.error("--baseDir, --excelName, --debug가 필요합니다.")
         sys.exit(1)
-    if not isinstance(configs, list):
-        print("--data 파라미터 이슈", flush=True)
+
+    if args.dataFile:
+        stream = ConfigStream(args.dataFile, follow=args.follow == "true")
+        # follow가 아니면 입력 끝(EOF)까지 모아서 --data와 같이 정규화/묶기/기관 사전 조회를 적용
+        configs = stream if stream.follow else list(stream)
+    elif args.data is not None:
+        try:
+            configs = json.loads(args.data)
+        except json.JSONDecodeError:
+            log.error("--data 파라미터 이슈")
+            sys.exit(1)
+        if not isinstance(configs, list):
+            log.error("--data 파라미터 이슈")
+            sys.exit(1)
+    else:
+        log.error("--data 또는 --dataFile이 필요합니다.")
         sys.exit(1)
 
-    debug = args.debug
-    excelName = args.excelName
-    downloadDir = os.path.join(args.baseDir, DIR_NAME, excelName.split(".")[0])
+    from services.runner import runCrawl, downloadDirOf
 
-    for cfg in configs:
-        crawlOpenGoKr(downloadDir, excelName, debug, **cfg)
-    print(f"DIRECTORY:{downloadDir}", flush=True)
+    configureEngine(args)
+    downloadDir = downloadDirOf(args.baseDir, args.excelName)
+    if args.profile != "false":
+        profiler.enable(args.profileInterval if args.profile == "sample" else 0)
+    try:
+        runCrawl(args, configs)
+    finally:
+        if args.profile != "false":
+            reportPath = os.path.join(
+                downloadDir, f"profile_{time.strftime('%Y%m%d_%H%M%S')}.json"
+            )
+            profiler.write(reportPath)
+            log.event("profile", path=reportPath)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,379 @@
+from classes.ConfigStream import normalizeConfig
+from classes.EngineOptions import EngineOptions
+from classes.Logger import log
+from classes.Session import BrowserSession
+from constants.index import DIR_NAME, OPEN_GO_KR_MAIN_URL
+from services.runner import runCrawl
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+import hmac
+import json
+import os
+import queue
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+# 데몬 프로세스 전체에 적용되는 옵션이라 작업(submit)마다 바꿀 수 없음
+PROCESS_OPTIONS = (
+    "rateLimit",
+    "verbose",
+    "profile",
+    "profileInterval",
+    "daemon",
+    "port",
+    "warm",
+    "token",
+    "startupBenchmark",
+    "startup-benchmark",
+)
+# submit 명령의 필드(baseDir/excelName/debug/configs)로 받는 값
+COMMAND_OPTIONS = (
+    "baseDir",
+    "excelName",
+    "debug",
+    "data",
+    "dataFile",
+    "data-file",
+    "follow",
+)
+
+
+class JobConfigs:
+    """stream 작업의 config를 append로 받아 순서대로 넘겨주는 iterable"""
+
+    def __init__(self, jobId: str, configs: List[Dict]) -> None:
+        # 실행 기록(runKey) 구분용, ConfigStream.source와 같은 역할
+        self.source = f"daemon:{jobId}"
+        self.queue: "queue.Queue[Optional[Dict]]" = queue.Queue()
+        for cfg in configs:
+            self.queue.put(cfg)
+
+    def append(self, configs: List[Dict]) -> None:
+        for cfg in configs:
+            self.queue.put(cfg)
+
+    def end(self) -> None:
+        self.queue.put(None)
+
+    def __iter__(self) -> Iterator[Dict]:
+        while True:
+            cfg = self.queue.get()
+            if cfg is None:
+                return
+            yield cfg
+
+
+class Job:
+    def __init__(self, jobId: str, args, configs: Union[List[Dict], JobConfigs]):
+        self.id = jobId
+        self.args = args
+        self.configs = configs
+        self.status = "queued"  # queued, running, done, cancelled, failed
+        self.error: Optional[str] = None
+        self.cancelEvent = threading.Event()
+        self.submittedAt = time.time()
+        self.startedAt: Optional[float] = None
+        self.finishedAt: Optional[float] = None
+
+    def toDict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "excelName": self.args.excelName,
+            "error": self.error,
+            "submittedAt": self.submittedAt,
+            "startedAt": self.startedAt,
+            "finishedAt": self.finishedAt,
+        }
+
+
+class EngineDaemon:
+    """
+    작업(job)을 받아 warm 브라우저 세션으로 처리하는 상주 엔진.
+    세션 수만큼 작업을 동시에 처리하고, 나머지는 받은 순서대로 대기한다.
+    명령과 이벤트는 모두 JSON Lines로 주고받으며, 작업 중 이벤트에는 job 필드가 붙는다.
+    """
+
+    def __init__(self, args, buildParser: Callable) -> None:
+        self.args = args
+        self.buildParser = buildParser
+        self.lock = threading.Lock()
+        self.jobs: Dict[str, Job] = {}
+        self.pending: "queue.Queue[Optional[Job]]" = queue.Queue()
+        self.stopped = threading.Event()
+        # 작업 전 다운로드 경로는 임시 위치, 작업마다 retarget으로 교체
+        warmDir = os.path.join(
+            args.baseDir or tempfile.gettempdir(), DIR_NAME, ".daemon"
+        )
+        debug = args.debug or '"false"'
+        # warm 브라우저는 데몬 실행 옵션으로 띄우고, 작업 옵션이 다르면 runCrawl에서 교체
+        options = EngineOptions.fromArgs(args)
+        self.sessions = [
+            BrowserSession(OPEN_GO_KR_MAIN_URL, warmDir, debug, options=options)
+            for _ in range(max(1, args.warm))
+        ]
+        self.runners = [
+            threading.Thread(target=self.runLoop, args=(session,), daemon=True)
+            for session in self.sessions
+        ]
+
+    def start(self) -> None:
+        for runner in self.runners:
+            runner.start()
+
+    def runLoop(self, session: BrowserSession) -> None:
+        # 첫 작업 전에 Chrome을 띄워서 메인 페이지까지 열어둔다
+        try:
+            session.acquire()
+            log.info("warm 브라우저 준비 완료")
+        except Exception as e:
+            log.warn(f"warm 브라우저 준비 실패, 작업 시작 시 다시 시도: {e}")
+        while True:
+            job = self.pending.get()
+            if job is None:
+                break
+            if job.cancelEvent.is_set():
+                continue
+            self.runJob(job, session)
+        session.close()
+
+    def runJob(self, job: Job, session: BrowserSession) -> None:
+        with log.bind(job=job.id):
+            job.status = "running"
+            job.startedAt = time.time()
+            self.emitJob(job)
+            try:
+                completed = runCrawl(
+                    job.args, job.configs, session, job.cancelEvent.is_set
+                )
+                job.status = "done" if completed else "cancelled"
+            except Exception as e:
+                job.status = "failed"
+                job.error = str(e)
+                log.error(f"작업 실패: {e}")
+            job.finishedAt = time.time()
+            self.emitJob(job)
+
+    def emitJob(self, job: Job) -> None:
+        log.event("job", **job.toDict())
+        log.flush()
+
+    def handleLine(self, line: str) -> None:
+        line = line.strip()
+        if not line:
+            return
+        try:
+            command = json.loads(line)
+            if not isinstance(command, dict):
+                raise ValueError("명령은 JSON 객체여야 합니다.")
+            self.handle(command)
+        except (ValueError, KeyError) as e:
+            log.error(f"명령 처리 실패: {e}")
+        except Exception as e:
+            # 잘못된 명령 한 줄 때문에 데몬 입력 루프가 멈추지 않도록
+            log.error(f"명령 처리 중 예외: {type(e).__name__}: {e}")
+        log.flush()
+
+    def handle(self, command: Dict[str, Any]) -> None:
+        cmd = command.get("cmd")
+        if cmd == "submit":
+            self.submit(command)
+        elif cmd == "append":
+            self.streamOf(command["id"]).append(configsOf(command))
+        elif cmd == "end":
+            self.streamOf(command["id"]).end()
+        elif cmd == "cancel":
+            self.cancel(command["id"])
+        elif cmd == "status":
+            self.status(command.get("id"))
+        elif cmd == "shutdown":
+            self.shutdown()
+        else:
+            raise ValueError(f"알 수 없는 명령: {cmd}")
+
+    def submit(self, command: Dict[str, Any]) -> None:
+        for key in ("baseDir", "excelName"):
+            if not isinstance(command.get(key), str) or not command[key]:
+                raise ValueError(f"{key}는 비어있지 않은 문자열이어야 합니다.")
+        options = command.get("options") or {}
+        if not isinstance(options, dict):
+            raise ValueError("options는 JSON 객체여야 합니다.")
+        for key in options:
+            if key in PROCESS_OPTIONS:
+                raise ValueError(
+                    f"{key}는 데몬 실행 옵션이라 작업마다 바꿀 수 없습니다."
+                )
+            if key in COMMAND_OPTIONS:
+                raise ValueError(f"{key}는 작업 옵션(options)으로 줄 수 없습니다.")
+        debug = command.get("debug") or self.args.debug or '"false"'
+        if not isinstance(debug, str):
+            raise ValueError("debug는 문자열이어야 합니다.")
+        jobId = str(command.get("id") or uuid.uuid4().hex[:12])
+        with self.lock:
+            if jobId in self.jobs and self.jobs[jobId].status in ("queued", "running"):
+                raise ValueError(f"이미 진행 중인 작업 id: {jobId}")
+        argv = [
+            "--baseDir", command["baseDir"],
+            "--excelName", command["excelName"],
+            "--debug", debug,
+        ]  # fmt: skip
+        for key, value in options.items():
+            argv += [f"--{key}", str(value)]
+        try:
+            args = self.buildParser().parse_args(argv)
+        except SystemExit:
+            raise ValueError(f"잘못된 작업 옵션: {command.get('options')}")
+        configs = configsOf(command)
+        job = Job(
+            jobId,
+            args,
+            JobConfigs(jobId, configs) if command.get("stream") else configs,
+        )
+        with self.lock:
+            self.jobs[jobId] = job
+        self.emitJob(job)
+        self.pending.put(job)
+
+    def streamOf(self, jobId: str) -> JobConfigs:
+        job = self.jobs.get(str(jobId))
+        if job is None or not isinstance(job.configs, JobConfigs):
+            raise ValueError(f"stream 작업이 아닙니다: {jobId}")
+        return job.configs
+
+    def cancel(self, jobId: str) -> None:
+        job = self.jobs.get(str(jobId))
+        if job is None:
+            raise ValueError(f"없는 작업 id: {jobId}")
+        job.cancelEvent.set()
+        if isinstance(job.configs, JobConfigs):
+            # config를 기다리는 중이면 바로 빠져나오도록
+            job.configs.end()
+        if job.status == "queued":
+            job.status = "cancelled"
+            job.finishedAt = time.time()
+            self.emitJob(job)
+
+    def status(self, jobId: Optional[str] = None) -> None:
+        with self.lock:
+            jobs = [
+                job.toDict()
+                for job in self.jobs.values()
+                if jobId is None or job.id == jobId
+            ]
+        log.event("status", jobs=jobs)
+        log.flush()
+
+    def shutdown(self) -> None:
+        if self.stopped.is_set():
+            return
+        self.stopped.set()
+        for job in list(self.jobs.values()):
+            if job.status in ("queued", "running"):
+                self.cancel(job.id)
+        for _ in self.runners:
+            self.pending.put(None)
+
+    def drain(self) -> None:
+        # 입력이 끝나면 대기 중인 작업까지 마친 뒤 종료
+        for _ in self.runners:
+            self.pending.put(None)
+        for runner in self.runners:
+            runner.join()
+        self.stopped.set()
+
+
+def configsOf(command: Dict[str, Any]) -> List[Dict]:
+    raw = command.get("configs") or []
+    if not isinstance(raw, list):
+        raise ValueError("configs는 배열이어야 합니다.")
+    return [cfg for cfg in map(normalizeConfig, raw) if cfg]
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    server: "DaemonSocketServer"
+
+    def handle(self) -> None:
+        def send(text: str) -> None:
+            self.wfile.write(text.encode("utf-8"))
+            self.wfile.flush()
+
+        authorized = False
+        try:
+            for raw in self.rfile:
+                line = raw.decode("utf-8")
+                if not line.strip():
+                    continue
+                if not tokenMatches(line, self.server.token):
+                    # 같은 PC의 다른 프로세스가 작업을 넣거나 이벤트를 엿보지 못하도록 명령마다 확인
+                    send(
+                        json.dumps(
+                            {
+                                "event": "log",
+                                "level": "error",
+                                "msg": "인증 토큰이 맞지 않는 명령을 무시합니다.",
+                                "ts": round(time.time(), 3),
+                            },
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                    )
+                    continue
+                if not authorized:
+                    # 인증된 연결에만 작업 이벤트를 보냄
+                    log.addSink(send)
+                    authorized = True
+                self.server.engine.handleLine(line)
+                if self.server.engine.stopped.is_set():
+                    break
+        finally:
+            if authorized:
+                log.removeSink(send)
+
+
+class DaemonSocketServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port: int, engine: EngineDaemon, token: str) -> None:
+        super().__init__(("127.0.0.1", port), DaemonRequestHandler)
+        self.engine = engine
+        self.token = token
+
+
+def tokenMatches(line: str, token: str) -> bool:
+    try:
+        command = json.loads(line)
+    except ValueError:
+        return False
+    if not isinstance(command, dict):
+        return False
+    return hmac.compare_digest(str(command.get("token") or ""), token)
+
+
+def serveDaemon(args, buildParser: Callable, token: str = "") -> None:
+    engine = EngineDaemon(args, buildParser)
+    engine.start()
+    if args.daemon == "socket":
+        server = DaemonSocketServer(args.port, engine, token)
+        log.event("listening", port=server.server_address[1])
+        log.flush()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        engine.stopped.wait()
+        server.shutdown()
+        server.server_close()
+    else:
+        log.event("listening", stdin=True)
+        log.flush()
+        for line in sys.stdin:
+            engine.handleLine(line)
+            if engine.stopped.is_set():
+                break
+    if not engine.stopped.is_set():
+        engine.drain()
+    for runner in engine.runners:
+        runner.join()
+    log.info("엔진 데몬 종료")
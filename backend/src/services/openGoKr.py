@@ -1,21 +1,96 @@
-from classes.Selenium import Selenium
-from selenium.webdriver.common.keys import Keys
+from classes.Selenium import ExtractField, Selenium
+from classes.Session import (
+    CONDITION_PARAMS,
+    FILTER_PARAMS,
+    KEYWORD_PARAM,
+    BrowserSession,
+    digitsOf,
+)
+from classes.EngineOptions import EngineOptions
+from classes.Journal import CrawlJournal
+from classes.FileStore import AttachmentStore
+from classes.InstitutionCache import InstitutionCache
 from classes.Excel import ExcelHelper
-import time
+from classes.ResultStore import ResultSink
+from classes.Screenshot import ScreenshotPipeline
+from services.openGoKrDetail import fetchOpenGoKrDetail
+from services.openGoKrList import collectDetailIds
+from classes.Logger import log
+from classes.Profiler import profiler
+import copy
 import re
-from typing import Optional
-from constants.index import TIME
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from typing import Callable, Dict, List, Optional
+from constants.index import (
+    INSTITUTION_RESULT_TIMEOUT,
+    OPEN_GO_KR_DETAIL_URL,
+    OPEN_GO_KR_MAIN_URL,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.common.exceptions import TimeoutException
+import time
 import traceback
 
+DETAIL_EXTRACT: Dict[str, ExtractField] = {
+    "title": {"by": "xpath", "value": '//*[@id="infoSj"]/p/strong'},
+    "workUnit": {"by": "xpath", "value": '//*[@id="unitJobNm"]/p'},
+    "prodDate": {"by": "xpath", "value": '//*[@id="prdnDtView"]/p'},
+}
+# 본문/붙임 칸마다 첫 번째 다운로드 버튼
+DOWNLOAD_BUTTONS = (
+    "//td[starts-with(@headers,'본문_') or starts-with(@headers,'붙임_')]"
+    "//a[contains(@class,'btn_type05') and contains(@class,'down')][1]"
+)
+
+
+class CrawlContext:
+    """
+    한 번의 실행에서 config마다 똑같이 넘기는 값 (결과 위치, 세션, 기록, 캐시, 실행 옵션).
+    세션과 결과 기록 대상은 워커마다 다르므로 bind로 바꾼 사본을 넘긴다.
+    """
+
+    def __init__(
+        self,
+        downloadDir: str,
+        excelName: str,
+        debug: str,
+        session: Optional[BrowserSession] = None,
+        excel: Optional[ResultSink] = None,
+        journal: Optional[CrawlJournal] = None,
+        runKey: str = "",
+        store: Optional[AttachmentStore] = None,
+        institutions: Optional[InstitutionCache] = None,
+        shouldStop: Optional[Callable[[], bool]] = None,
+        incremental: bool = False,
+        screenshots: Optional[ScreenshotPipeline] = None,
+        options: Optional[EngineOptions] = None,
+    ) -> None:
+        self.downloadDir = downloadDir
+        self.excelName = excelName
+        self.debug = debug
+        self.session = session
+        self.excel = excel
+        self.journal = journal
+        self.runKey = runKey
+        self.store = store
+        self.institutions = institutions
+        self.shouldStop = shouldStop
+        self.incremental = incremental
+        self.screenshots = screenshots
+        self.options = options
+
+    def bind(
+        self, session: Optional[BrowserSession], excel: Optional[ResultSink]
+    ) -> "CrawlContext":
+        worker = copy.copy(self)
+        worker.session = session
+        worker.excel = excel
+        return worker
+
 
 def crawlOpenGoKr(
-    downloadDir: str,
-    excelName: str,
-    debug: str,
+    context: CrawlContext,
     query: str,
     organization: str,
     location: str,
@@ -23,178 +98,555 @@ def crawlOpenGoKr(
     endDate: str,
     include: Optional[str] = None,
     exclude: Optional[str] = None,
+    configKey: str = "",
 ) -> None:
+    # 외부에서 주입받은 세션/엑셀은 호출한 쪽에서 종료, 저장한다
+    session, journal, screenshots = (
+        context.session,
+        context.journal,
+        context.screenshots,
+    )
+    ownsBrowser = session is None
+    ownsExcel = context.excel is None
     try:
-        browser = Selenium(
-            "https://www.open.go.kr/com/main/mainView.do", downloadDir, debug
+        excel = (
+            ExcelHelper(context.downloadDir, context.excelName)
+            if context.excel is None
+            else context.excel
         )
-        excel = ExcelHelper(downloadDir, excelName)
-        # 검색어 입력
-        browser.typingInputElement("xpath", '//*[@id="m_input"]', query)
-        # 검색 버튼 클릭
-        browser.clickElement("xpath", '//*[@id="mainBackImg"]/div[2]/div[1]/div/button')
-        # 상세 검색 클릭
-        browser.clickElement("xpath", '//*[@id="srchBtnDiv"]/a')
-        # iframe에 focus
-        browser.focusIframe("id", "modalIfm")
-        # 초중고등학교 포함 클릭
-        browser.clickElement(
-            "xpath",
-            '//*[@id="popup_wrap"]/div[2]/div/div[1]/div/table/tbody/tr[1]/td/p/label',
+        state = journal.beginConfig(context.runKey, configKey) if journal else None
+        # 검색 조건별 워터마크는 항상 기록하고, 증분 모드에서만 기간 축소/중복 생략에 사용
+        watermarkKey = CrawlJournal.watermarkKeyOf(
+            query, organization, location, include, exclude
         )
-        # 기관찾기 클릭
-        browser.goToNewWindow(
-            "xpath",
-            '//*[@id="popup_wrap"]/div[2]/div/div[1]/div/table/tbody/tr[3]/td/div/button',
+        watermark = (
+            journal.getWatermark(watermarkKey)
+            if journal and context.incremental
+            else None
         )
-        # 기관명 입력
-        browser.typingInputElement("xpath", '//*[@id="indvdlzInsttNm"]', organization)
-        # 검색 클릭
-        browser.clickElement(
-            "xpath",
-            '//*[@id="popup_wrap"]/div[2]/div[1]/table/tbody/tr/td/div/button[1]',
+        if watermark:
+            narrowed = narrowStartDate(startDate, watermark["latestPrdnDt"])
+            if narrowed != startDate:
+                log.info(f"증분 크롤링: 시작일 {startDate} -> {narrowed}")
+                startDate = narrowed
+        # 이전 실행에서 끝난 config는 브라우저 없이 기록으로 행만 복원
+        if journal and state and state["finished"]:
+            if restoreFinished(excel, journal, configKey, state, query, organization):
+                saveIfOwned(excel, ownsExcel, screenshots)
+                return
+        if watermark and digitsOf(startDate) > digitsOf(endDate):
+            log.info(f"증분 크롤링: 새로 조회할 기간 없음 {query}-{organization}")
+            finishSearch(journal, configKey, watermarkKey)
+            saveIfOwned(excel, ownsExcel, screenshots)
+            return
+        # 같은 세션에서 바로 전 config와 검색어만 다르면 검색 결과 페이지를 검색어만 바꿔서 연다
+        condition = (organization, location, startDate, endDate, include, exclude)
+        revisitUrl = session.revisitUrl(query, condition) if session else None
+        if session is None:
+            browser = Selenium(
+                OPEN_GO_KR_MAIN_URL,
+                context.downloadDir,
+                context.debug,
+                options=context.options,
+            )
+        else:
+            browser = session.acquire(revisitUrl)
+        found = openSearchResults(
+            browser, session, revisitUrl, query, condition, context.institutions
         )
-        # 검색 결과에 organization과 location이 모두 포함된 요소 클릭
-        try:
-            browser.clickElement(
-                "xpath",
-                f"//ul[contains(@class,'jstree-no-dots')]/li/a"
-                f"[contains(@title,'{location}') and "
-                f"contains(@title,'{organization}')]",
+        count = (
+            parseCount(
+                browser.getElement(
+                    "xpath", '//*[@id="searchInfoListTotalPage"]', "resultCount"
+                ).text
             )
-        except TimeoutException:
-            print(
+            if found
+            else 0
+        )
+        if not found:
+            log.info(
                 f"기관+지역에 매칭되는 요소 없음. 다음 config로 진행. {location}-{organization}",
-                flush=True,
             )
-            excel.notFoundData(
-                query, organization, "기관명-지역명에 매칭되는 요소가 없습니다."
+            message = "기관명-지역명에 매칭되는 요소가 없습니다."
+            writeNotFoundRow(excel, query, organization, message)
+            if journal:
+                journal.finishConfig(configKey, message)
+        elif count == 0 and watermark:
+            # 이전 실행에서 이미 결과를 남겼으므로 새 행을 추가하지 않음
+            log.info(f"증분 크롤링: 새 문서 없음 {query}-{organization}")
+            finishSearch(journal, configKey, watermarkKey)
+        elif count == 0:
+            log.info("검색 결과가 없습니다.")
+            message = "검색 결과가 0건입니다."
+            writeNotFoundRow(excel, query, organization, message)
+            finishSearch(journal, configKey, watermarkKey, message)
+        else:
+            # 검색 결과가 하나라도 있으면, 더보기 버튼 클릭
+            browser.clickElement("xpath", '//*[@id="infoList"]', "moreResults")
+            # 상세 페이지 HTTP 요청에 검색 세션 쿠키 사용
+            browser.http.syncCookies(browser.driver)
+            listUrl = browser.driver.current_url
+            # 상세 작업 전에 전체 결과 id를 먼저 수집
+            shotPrefix = f"{query}_{organization}_{location}_{startDate}_{endDate}"
+            ids = collectDetailIds(
+                browser,
+                count,
+                watermark["seen"] if watermark else None,
+                screenshotHook(browser, excel, screenshots, shotPrefix),
             )
-            excel.pretterColumns()
-            excel.save()
-            browser.close()
-            return
-        # 확인 버튼 클릭 (새 창 자동으로 닫힘)
-        browser.clickElement("xpath", '//*[@id="popup_wrap"]/div[2]/div[2]/div[5]/a[1]')
-        # 초기 윈도우로 이동 (리셋)
-        browser.goToDefaultWindow()
-        # iframe에 focus
-        browser.focusIframe("id", "modalIfm")
-        # 시작 날짜 종료 날짜 지정
-        print("시작 날짜 주입 시작", flush=True)
-        browser.typingInputElement("xpath", '//*[@id="startDate"]', startDate, True)
-        print("종료 날짜 주입 시작", flush=True)
-        browser.typingInputElement("xpath", '//*[@id="endDate"]', endDate, True)
-        # 검색어 포함/제한 존재하면 적용
-        if include != "null":
-            browser.typingInputElement(
-                "xpath", '//*[@id="mustKeyword1"]', include, True
-            )
-        if exclude != "null":
-            browser.typingInputElement(
-                "xpath", '//*[@id="ignoreKeyword1"]', exclude, True
+            if watermark:
+                # 이전 실행에서 끝낸 문서는 건너뜀, 이번 실행에서 기록한 문서는 아래에서 복원
+                newIds = [i for i in ids if i not in watermark["seen"]]
+                log.info(
+                    f"증분 크롤링: 새 문서 {len(newIds)}건"
+                    f" (이미 처리한 {len(ids) - len(newIds)}건 생략)"
+                )
+                ids = newIds
+            completed = crawlDocuments(
+                browser, ids, excel, context, query, organization, configKey, listUrl
             )
-        # 검색 버튼 클릭 (여기선 JS 클릭하면 안 됨)
-        WebDriverWait(browser.driver, 10).until(
-            EC.element_to_be_clickable((By.CLASS_NAME, "btn_srch"))
-        ).click()
-        # iframe에서 나가기
-        browser.unfocusIframe()
-        time.sleep(TIME)
-        # 검색 결과가 하나라도 있으면, 더보기 버튼 클릭
-        count = browser.getElement("xpath", '//*[@id="searchInfoListTotalPage"]').text
-        if count == "0":
-            print("검색 결과가 없습니다.", flush=True)
-            excel.notFoundData(query, organization, "검색 결과가 0건입니다.")
-            excel.pretterColumns()
-            excel.save()
+            if completed:
+                finishSearch(journal, configKey, watermarkKey)
+        if ownsBrowser:
             browser.close()
-            return
-        browser.clickElement("xpath", '//*[@id="infoList"]')
-        curPageIdx = 1
-        while True:
-            # 정보 목록 리스트로 가는 a태그 개수 확인
-            length = len(browser.getAllChild("css selector", "#infoList dt span.top a"))
-            # 리스트 순회
-            for i in range(length):
-                href = (
-                    browser.getAllChild("css selector", "#infoList dt span.top a")[
-                        i
-                    ].get_attribute("href")
-                    or ""
-                )
-                # JS 함수를 역 파싱해서 쿼리파라미터 획득
-                m = re.search(r"goDetail\('([^']+)','([^']+)'", href)
-                if not m:
-                    continue
-                detail_url = (
-                    "https://www.open.go.kr/othicInfo/infoList/infoListDetl.do"
-                    f"?prdnNstRgstNo={m.group(1)}"
-                    f"&prdnDt={m.group(2)}"
-                )
-                browser.driver.switch_to.new_window("tab")
-                browser.driver.get(detail_url)
-                # 문서 제목 저장
-                title = browser.getElement("xpath", '//*[@id="infoSj"]/p/strong').text
-                # 단위업무 저장
-                workUnit = browser.getElement("xpath", '//*[@id="unitJobNm"]/p').text
-                # 생산일자 저장
-                prodDate = browser.getElement("xpath", '//*[@id="prdnDtView"]/p').text
-                # 다운로드 로직 실행
-                (fileLinks, hasMissingDownloads) = browser.downloadOpenGoKr(
-                    "xpath",
-                    (
-                        "//td[starts-with(@headers,'본문_') or starts-with(@headers,'붙임_')]"
-                        "//a[contains(@class,'btn_type05') and contains(@class,'down')][1]"
-                    ),
-                )
-                # 엑셀에 값 추가
-                excel.setData(
-                    [
-                        query,
-                        organization,
-                        {"text": title, "url": detail_url},
-                        workUnit,
-                        prodDate,
-                    ]
-                )
-                # 다운로드한 파일 linking
-                excel.setHyperlink(
-                    fileLinks, col=6, hasMissingDownloads=hasMissingDownloads
-                )
-                browser.driver.close()
-                browser.goToDefaultWindow()
-            # 여기서도 RNB 제거...
-            browser.driver.execute_script(
-                """
-            const el = document.querySelector('.rnb');
-            if (el) el.style.display = 'none';
-            """
+        saveIfOwned(excel, ownsExcel, screenshots)
+
+    except Exception as e:
+        log.error(f"에러 발생: {e}", trace=traceback.format_exc())
+        log.failure(f"{context.downloadDir}/logs")
+        raise RuntimeError("크롤링 도중 오류 발생")
+
+
+def restoreFinished(
+    excel: ResultSink,
+    journal: CrawlJournal,
+    configKey: str,
+    state,
+    query: str,
+    organization: str,
+) -> bool:
+    """끝난 config의 행을 기록에서 복원, 첨부파일이 사라져 복원할 수 없으면 False"""
+    docs = journal.listDocuments(configKey)
+    if docs is None:
+        return False
+    log.info(f"기록에서 복원: {query}-{organization}")
+    if state["outcome"]:
+        writeNotFoundRow(excel, query, organization, state["outcome"])
+    for doc in docs:
+        writeDocumentRow(excel, query, organization, doc)
+    return True
+
+
+def openSearchResults(
+    browser: Selenium,
+    session: Optional[BrowserSession],
+    revisitUrl: Optional[str],
+    query: str,
+    condition: tuple,
+    institutions: Optional[InstitutionCache],
+) -> bool:
+    """검색 결과 페이지를 연다, 기관+지역에 매칭되는 요소가 없으면 False"""
+    organization, location, startDate, endDate, include, exclude = condition
+    if revisitUrl is not None and revisitApplied(browser, revisitUrl):
+        profiler.count("search.revisit")
+        log.info(f"검색어만 바꿔서 검색 결과 열기: {query}")
+        return True
+    if revisitUrl:
+        # 결과 페이지가 아니면 처음부터 다시 검색
+        browser.load(OPEN_GO_KR_MAIN_URL)
+        browser.waitPageReady("mainPage")
+    openAdvancedSearch(browser, query)
+    if not selectInstitution(browser, organization, location, institutions):
+        return False
+    submitSearch(browser, startDate, endDate, include, exclude)
+    if session:
+        session.rememberSearch(browser.driver.current_url, query, condition)
+    return True
+
+
+def screenshotHook(
+    browser: Selenium,
+    excel: ResultSink,
+    screenshots: Optional[ScreenshotPipeline],
+    prefix: str,
+) -> Optional[Callable[[int], None]]:
+    if not screenshots:
+        return None
+
+    # 브라우저에 그려지는 결과 페이지마다 캡처, 인코딩은 백그라운드에서
+    def onPage(page: int) -> None:
+        shot = screenshots.capture(browser.driver, f"{prefix}_{page}")
+        if shot:
+            excel.addScreenshot(shot)
+
+    return onPage
+
+
+def crawlDocuments(
+    browser: Selenium,
+    ids: List,
+    excel: ResultSink,
+    context: CrawlContext,
+    query: str,
+    organization: str,
+    configKey: str,
+    listUrl: str,
+) -> bool:
+    """수집한 상세 id를 차례로 처리, 취소되면 False"""
+    journal, shouldStop = context.journal, context.shouldStop
+    for position, (prdnNstRgstNo, prdnDt) in enumerate(ids):
+        # 취소되면 config를 끝내지 않은 상태로 남겨 다음 실행에서 이어서 진행
+        if shouldStop and shouldStop():
+            log.info(f"작업 취소 요청으로 중단: {query}-{organization}")
+            return False
+        # 이전 실행에서 처리한 문서는 기록으로 행만 복원
+        doc = journal.getDocument(configKey, prdnNstRgstNo, prdnDt) if journal else None
+        if doc is None:
+            begun = time.perf_counter()
+            doc = crawlDocument(browser, prdnNstRgstNo, prdnDt, listUrl, context.store)
+            profiler.document(
+                f"{prdnNstRgstNo}/{prdnDt}",
+                time.perf_counter() - begun,
+                title=doc["title"],
+                files=len(doc["files"]),
             )
-            print("RNB 제거 완료", flush=True)
-            # 페이지네이션 순회
-            buttons = browser.driver.find_elements(
-                "xpath",
-                "//div[@id='pagingInfo']//li[@class='on']/following-sibling::li[1]/a",
+            if journal:
+                journal.saveDocument(configKey, prdnNstRgstNo, prdnDt, doc)
+        writeDocumentRow(excel, query, organization, doc)
+        log.progress("documents", position + 1, len(ids))
+    return True
+
+
+def finishSearch(
+    journal: Optional[CrawlJournal],
+    configKey: str,
+    watermarkKey: str,
+    message: Optional[str] = None,
+) -> None:
+    # 검색을 끝까지 마친 config만 워터마크를 올린다
+    if journal:
+        journal.finishConfig(configKey, message)
+        journal.advanceWatermark(watermarkKey, configKey)
+
+
+def writeNotFoundRow(
+    excel: ResultSink, query: str, organization: str, message: str
+) -> None:
+    excel.addNotFound(query, organization, message)
+    log.countRows()
+
+
+def writeDocumentRow(excel: ResultSink, query: str, organization: str, doc) -> None:
+    # 결과 저장소(또는 엑셀)에 문서 한 건 기록, 파일 링크/누락 경고는 엑셀을 만들 때 붙는다
+    excel.addDocument(query, organization, doc)
+    log.countRows()
+
+
+@profiler.timed("document")
+def crawlDocument(
+    browser: Selenium,
+    prdnNstRgstNo: str,
+    prdnDt: str,
+    listUrl: str,
+    store: Optional[AttachmentStore] = None,
+) -> Dict:
+    query = urlencode({"prdnNstRgstNo": prdnNstRgstNo, "prdnDt": prdnDt})
+    detail_url = f"{OPEN_GO_KR_DETAIL_URL}?{query}"
+    # --httpDetail이면 정적 HTML로 먼저 읽고, 첨부파일이 있거나 표가 없거나 JS가 필요할 때만 탭을 연다
+    detail = (
+        fetchOpenGoKrDetail(browser.http, detail_url, listUrl)
+        if browser.options.httpDetail
+        else None
+    )
+    fileLinks, hasMissingDownloads = [], False
+    # 이미 받은 첨부파일은 저장소에서 연결하고 다운로드 생략
+    if store and detail and detail["attachments"] > 0:
+        fileLinks = linkStoredFiles(
+            store, prdnNstRgstNo, prdnDt, detail["attachments"], browser
+        )
+    openedTab = (
+        detail is None
+        or not detail["fileTable"]
+        or (detail["attachments"] > 0 and not fileLinks)
+    )
+    if openedTab:
+        browser.openTab(detail_url)
+    if detail is None:
+        # 문서 제목, 단위업무, 생산일자를 한 번에 읽기
+        if browser.options.httpDetail:
+            profiler.count("detail.browserFallback")
+        fields = browser.waitExtract("detailFields", DETAIL_EXTRACT)
+        title = fields["title"]
+        workUnit = fields["workUnit"]
+        prodDate = fields["prodDate"]
+    else:
+        title = detail["title"]
+        workUnit = detail["workUnit"]
+        prodDate = detail["prodDate"]
+        log.debug(f"HTTP로 상세 정보 획득: {title}")
+    if openedTab and store:
+        # 탭의 다운로드 버튼 수로 저장소를 확인, 모두 있으면 다운로드 생략
+        count = browser.countElements("xpath", DOWNLOAD_BUTTONS, "downloadButtons")
+        if count:
+            fileLinks = linkStoredFiles(store, prdnNstRgstNo, prdnDt, count, browser)
+    if openedTab and not fileLinks:
+        # 다운로드 로직 실행
+        fileLinks, hasMissingDownloads = browser.downloadOpenGoKr(
+            "xpath", DOWNLOAD_BUTTONS
+        )
+        if store:
+            # 누락 없이 받은 경우에만 문서 id + 순번으로 등록
+            fileLinks = [
+                store.ingest(
+                    path,
+                    prdnNstRgstNo,
+                    prdnDt,
+                    None if hasMissingDownloads else idx,
+                )
+                for idx, path in enumerate(fileLinks)
+            ]
+    if openedTab:
+        browser.closeTab()
+    return {
+        "title": title,
+        "workUnit": workUnit,
+        "prodDate": prodDate,
+        "detailUrl": detail_url,
+        "files": fileLinks,
+        "hasMissing": hasMissingDownloads,
+    }
+
+
+@profiler.timed("search")
+def submitSearch(
+    browser: Selenium,
+    startDate: str,
+    endDate: str,
+    include: Optional[str],
+    exclude: Optional[str],
+) -> None:
+    # 시작 날짜 종료 날짜 지정
+    log.debug("시작 날짜 주입 시작")
+    browser.typingInputElement(
+        "xpath", '//*[@id="startDate"]', startDate, True, "startDate"
+    )
+    log.debug("종료 날짜 주입 시작")
+    browser.typingInputElement("xpath", '//*[@id="endDate"]', endDate, True, "endDate")
+    # 검색어 포함/제한 존재하면 적용
+    if include != "null":
+        browser.typingInputElement(
+            "xpath", '//*[@id="mustKeyword1"]', include, True, "mustKeyword"
+        )
+    if exclude != "null":
+        browser.typingInputElement(
+            "xpath", '//*[@id="ignoreKeyword1"]', exclude, True, "ignoreKeyword"
+        )
+    # 검색 버튼 클릭 (여기선 JS 클릭하면 안 됨)
+    browser.waitFor(
+        "clickable:searchButton",
+        EC.element_to_be_clickable((By.CLASS_NAME, "btn_srch")),
+    ).click()
+    # iframe에서 나가기
+    browser.unfocusIframe()
+    # 상세검색 모달이 닫히고 결과 건수가 표시될 때까지 대기
+    browser.waitFor("searchResults", searchSettled)
+
+
+def searchSettled(driver) -> bool:
+    return driver.execute_script("""
+        const ifm = document.getElementById("modalIfm");
+        return document.readyState === "complete"
+            && (!window.jQuery || window.jQuery.active === 0)
+            && (!ifm || ifm.offsetParent === null)
+            && !!document.getElementById("searchInfoListTotalPage");
+        """)
+
+
+def revisitApplied(browser: Selenium, url: str) -> bool:
+    """
+    다시 연 결과 페이지가 URL의 검색 조건을 실제로 적용했는지 확인.
+    결과 건수 요소뿐 아니라 페이지가 가진 조건(더보기 링크, 폼 값)이 검색어/기관/기간과 맞아야 한다.
+    """
+    if not browser.driver.find_elements("xpath", '//*[@id="searchInfoListTotalPage"]'):
+        return False
+    shown = browser.driver.execute_script("""
+        const out = {};
+        const link = document.getElementById("infoList");
+        if (link && link.href && !link.href.startsWith("javascript:")) {
+            new URL(link.href, location.href).searchParams.forEach((v, k) => { out[k] = v; });
+        }
+        document.querySelectorAll("input[name]").forEach((el) => {
+            if (el.value && !(el.name in out)) out[el.name] = el.value;
+        });
+        return out;
+        """) or {}
+    expected = dict(parse_qsl(urlsplit(url).query, keep_blank_values=True))
+    for key in (KEYWORD_PARAM,) + CONDITION_PARAMS + FILTER_PARAMS:
+        if expected.get(key, "") != shown.get(key, ""):
+            log.info(f"다시 연 결과 페이지의 검색 조건이 달라 처음부터 검색: {key}")
+            return False
+    return True
+
+
+def narrowStartDate(startDate: str, latestPrdnDt: str) -> str:
+    # 생산일자(YYYYMMDD...) 당일부터 다시 조회, 같은 날 늦게 등록된 문서는 seen으로 걸러낸다
+    latest = digitsOf(latestPrdnDt)[:8]
+    if len(latest) != 8 or len(digitsOf(startDate)) != 8:
+        return startDate
+    if latest <= digitsOf(startDate):
+        return startDate
+    # 날짜는 입력 형식 그대로 검색 폼에 넣으므로 입력의 구분자를 따른다
+    sep = re.sub(r"[0-9]", "", startDate)[:1]
+    return f"{latest[:4]}{sep}{latest[4:6]}{sep}{latest[6:]}"
+
+
+def parseCount(text: str) -> int:
+    digits = re.sub(r"[^0-9]", "", text)
+    return int(digits) if digits else 0
+
+
+@profiler.timed("search.open")
+def openAdvancedSearch(browser: Selenium, query: str) -> None:
+    # 검색어 입력
+    browser.typingInputElement("xpath", '//*[@id="m_input"]', query, point="mainQuery")
+    # 검색 버튼 클릭
+    browser.clickElement(
+        "xpath", '//*[@id="mainBackImg"]/div[2]/div[1]/div/button', "mainSearch"
+    )
+    # 상세 검색 클릭
+    browser.clickElement("xpath", '//*[@id="srchBtnDiv"]/a', "advancedSearch")
+    # iframe에 focus
+    browser.focusIframe("id", "modalIfm", "searchModal")
+    # 초중고등학교 포함 클릭
+    browser.clickElement(
+        "xpath",
+        '//*[@id="popup_wrap"]/div[2]/div/div[1]/div/table/tbody/tr[1]/td/p/label',
+        "includeSchools",
+    )
+
+
+@profiler.timed("institution")
+def selectInstitution(
+    browser: Selenium,
+    organization: str,
+    location: str,
+    institutions: Optional[InstitutionCache] = None,
+) -> bool:
+    """상세검색 iframe에 기관을 지정, 매칭되는 기관이 없으면 False"""
+    # 캐시에 있으면 기관찾기 팝업 없이 폼에 바로 주입
+    cached = institutions.get(organization, location) if institutions else None
+    if cached and browser.applyInputs(cached["fields"]):
+        log.info(f"기관 캐시 사용: {cached['title']}")
+        return True
+
+    before = browser.snapshotInputs() if institutions else {}
+    # 기관찾기 클릭
+    browser.goToNewWindow(
+        "xpath",
+        '//*[@id="popup_wrap"]/div[2]/div/div[1]/div/table/tbody/tr[3]/td/div/button',
+        "institutionPopup",
+    )
+    # 기관명 입력
+    browser.typingInputElement(
+        "xpath", '//*[@id="indvdlzInsttNm"]', organization, point="institutionName"
+    )
+    # 검색 클릭
+    browser.clickElement(
+        "xpath",
+        '//*[@id="popup_wrap"]/div[2]/div[1]/table/tbody/tr/td/div/button[1]',
+        "institutionSearch",
+    )
+    # 검색 결과에 organization과 location이 모두 포함된 요소 클릭
+    itemXpath = (
+        f"//ul[contains(@class,'jstree-no-dots')]/li/a"
+        f"[contains(@title,'{location}') and "
+        f"contains(@title,'{organization}')]"
+    )
+    try:
+        # 매칭되는 기관이 없는 것도 정상 결과이므로 고정 시간만 기다린다
+        browser.clickElement(
+            "xpath", itemXpath, "institutionResult", INSTITUTION_RESULT_TIMEOUT
+        )
+    except TimeoutException:
+        return False
+    item = browser.getElement("xpath", itemXpath, "institutionResult")
+    title = item.get_attribute("title") or ""
+    # 확인 버튼 클릭 (새 창 자동으로 닫힘)
+    browser.clickElement(
+        "xpath", '//*[@id="popup_wrap"]/div[2]/div[2]/div[5]/a[1]', "institutionConfirm"
+    )
+    # 초기 윈도우로 이동 (리셋)
+    browser.goToDefaultWindow()
+    # iframe에 focus
+    browser.focusIframe("id", "modalIfm", "searchModal")
+
+    if institutions:
+        # 팝업 선택으로 바뀐 폼 값만 캐시에 저장
+        after = browser.snapshotInputs()
+        changed: Dict[str, str] = {
+            key: value for key, value in after.items() if before.get(key) != value
+        }
+        institutions.put(organization, location, title, changed)
+    return True
+
+
+def prewarmInstitutions(
+    session: BrowserSession, configs: List[Dict], institutions: InstitutionCache
+) -> List[Dict]:
+    """config 파일의 기관들을 미리 조회해서 캐시에 넣고, 매칭 실패한 기관 목록을 반환"""
+    unmatched = []
+    seen = set()
+    for cfg in configs:
+        key = InstitutionCache.keyOf(cfg["organization"], cfg["location"])
+        if key in seen or institutions.get(cfg["organization"], cfg["location"]):
+            continue
+        seen.add(key)
+        browser = session.acquire()
+        openAdvancedSearch(browser, cfg["query"])
+        if not selectInstitution(
+            browser, cfg["organization"], cfg["location"], institutions
+        ):
+            log.warn(f"기관 매칭 실패: {cfg['location']}-{cfg['organization']}")
+            unmatched.append(
+                {"organization": cfg["organization"], "location": cfg["location"]}
             )
-            if not buttons:
-                print("다음 페이지 없음, 순회 종료", flush=True)
-                break
-            prevEl = browser.getAllChild("css selector", "#infoList dt span.top a")[0]
-            curPageIdx += 1
-            try:
-                buttons[0].click()
-                browser.waitStaleness(prevEl)
-            except TimeoutException:
-                print("페이지 전환 없음, 순회 종료", flush=True)
-                break
-        browser.close()
+    log.info(
+        f"기관 캐시 사전 조회 완료: {len(seen)}건 조회, {len(unmatched)}건 매칭 실패",
+    )
+    return unmatched
+
+
+def linkStoredFiles(
+    store: AttachmentStore,
+    prdnNstRgstNo: str,
+    prdnDt: str,
+    count: int,
+    browser: Selenium,
+) -> List[str]:
+    hashes = store.lookup(prdnNstRgstNo, prdnDt, count)
+    if not hashes:
+        return []
+    paths = [store.materialize(sha256, browser.downloadPath) for sha256 in hashes]
+    if not all(paths):
+        return []
+    log.debug(f"저장소의 첨부파일 {count}개 재사용")
+    return [path for path in paths if path]
+
+
+def saveIfOwned(
+    excel: ResultSink, ownsExcel: bool, screenshots: Optional[ScreenshotPipeline] = None
+) -> None:
+    if ownsExcel and isinstance(excel, ExcelHelper):
+        # legacy 모드는 config마다 저장하므로 썸네일이 만들어질 때까지 기다림
+        if screenshots:
+            screenshots.drain()
         excel.pretterColumns()
         excel.save()
-        time.sleep(TIME)
 
-    except Exception as e:
-        print(f"에러 발생: {e}", flush=True)
-        print(traceback.format_exc(), flush=True)
-        print(f"FAILDIRECTORY:{downloadDir}/logs", flush=True)
-        raise RuntimeError("크롤링 도중 오류 발생")
+
+def beginJournalRun(journal: CrawlJournal, runKey: str, excel) -> bool:
+    # 이어서 진행하는 경우, 이전 시도가 엑셀에 남긴 행은 지우고 기록으로 다시 채움
+    baseRows, resumed = journal.beginRun(runKey, excel.rowCount())
+    if resumed:
+        excel.truncate(baseRows)
+    return resumed
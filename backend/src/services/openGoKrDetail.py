@@ -0,0 +1,108 @@
+from classes.Http import HttpSession
+from classes.Profiler import profiler
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple, TypedDict
+
+
+class DetailInfo(TypedDict):
+    title: str
+    workUnit: str
+    prodDate: str
+    attachments: int
+    fileTable: bool
+
+
+# 필드명: (기준 요소 id, 직계 자식 태그 경로) -> //*[@id=...]/p/strong 과 동일
+DETAIL_FIELDS: Dict[str, Tuple[str, List[str]]] = {
+    "title": ("infoSj", ["p", "strong"]),
+    "workUnit": ("unitJobNm", ["p"]),
+    "prodDate": ("prdnDtView", ["p"]),
+}
+
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "source", "track", "wbr",
+}  # fmt: skip
+
+
+class DetailParser(HTMLParser):
+    """infoListDetl.do 상세 페이지의 정적 HTML에서 필요한 값만 추출"""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.stack: List[Tuple[str, Optional[str], Optional[str]]] = []
+        self.texts: Dict[str, List[str]] = {name: [] for name in DETAIL_FIELDS}
+        self.done: Dict[str, bool] = {name: False for name in DETAIL_FIELDS}
+        self.attachments = 0
+        self.fileTable = False
+
+    def handle_starttag(self, tag, attrs):
+        attr = dict(attrs)
+        if tag == "td" and (attr.get("headers") or "").startswith(("본문_", "붙임_")):
+            self.fileTable = True
+        if tag == "a" and self.inAttachmentCell():
+            classes = (attr.get("class") or "").split()
+            if "btn_type05" in classes and "down" in classes:
+                self.attachments += 1
+        if tag in VOID_TAGS:
+            return
+        self.stack.append((tag, attr.get("id"), attr.get("headers")))
+
+    def handle_endtag(self, tag):
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i][0] == tag:
+                for name in DETAIL_FIELDS:
+                    if self.matchDepth(name) == i + 1 and self.texts[name]:
+                        self.done[name] = True
+                del self.stack[i:]
+                return
+
+    def handle_data(self, data):
+        for name in DETAIL_FIELDS:
+            if not self.done[name] and self.matchDepth(name) is not None:
+                self.texts[name].append(data)
+
+    def matchDepth(self, name: str) -> Optional[int]:
+        targetId, path = DETAIL_FIELDS[name]
+        for i, (_, elId, _) in enumerate(self.stack):
+            if elId != targetId:
+                continue
+            tags = [t for t, _, _ in self.stack[i + 1 : i + 1 + len(path)]]
+            if tags == path:
+                return i + 1 + len(path)
+        return None
+
+    def inAttachmentCell(self) -> bool:
+        return any(
+            tag == "td" and headers and headers.startswith(("본문_", "붙임_"))
+            for tag, _, headers in self.stack
+        )
+
+    def result(self) -> Optional[DetailInfo]:
+        values = {
+            name: " ".join("".join(parts).split()) for name, parts in self.texts.items()
+        }
+        # 값이 비어있으면 JS 렌더링이 필요한 페이지로 보고 브라우저로 처리
+        if not all(values.values()):
+            return None
+        return {
+            "title": values["title"],
+            "workUnit": values["workUnit"],
+            "prodDate": values["prodDate"],
+            "attachments": self.attachments,
+            # 첨부파일 표가 정적 HTML에 없으면(JS 렌더링 등) 다운로드는 브라우저로
+            "fileTable": self.fileTable,
+        }
+
+
+@profiler.timed("detail.http")
+def fetchOpenGoKrDetail(
+    http: HttpSession, detailUrl: str, referer: Optional[str] = None
+) -> Optional[DetailInfo]:
+    html = http.getText(detailUrl, referer)
+    if html is None:
+        return None
+    parser = DetailParser()
+    parser.feed(html)
+    parser.close()
+    return parser.result()
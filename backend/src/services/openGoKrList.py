@@ -0,0 +1,338 @@
+from classes.Selenium import Selenium
+from selenium.common.exceptions import TimeoutException
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypedDict
+from urllib.parse import parse_qsl
+import json
+import math
+import re
+from classes.Logger import log
+from classes.Profiler import profiler
+
+DetailId = Tuple[str, str]
+
+LIST_ANCHORS = "#infoList dt span.top a"
+NEXT_PAGE_XPATH = "//div[@id='pagingInfo']//li[@class='on']/following-sibling::li[1]/a"
+PAGE_SIZE_PATTERN = re.compile(
+    r"(rowPage|pageUnit|pageSize|recordCountPerPage|rowCnt|listCnt|viewCnt|rows)",
+    re.I,
+)
+MAX_PAGE_SIZE = 100
+
+
+class ListRequest(TypedDict):
+    method: str
+    url: str
+    body: Optional[str]
+    fields: List[Tuple[str, str]]
+
+
+class ListingFetcher:
+    """
+    검색 결과 목록 요청을 한 번 가로채서 그대로 재현한다.
+    페이지 번호/페이지 크기 파라미터를 바꿔가며 HTTP로 직접 요청하므로
+    임의의 페이지로 바로 이동할 수 있고, 한 번에 더 많은 결과를 받을 수 있다.
+    """
+
+    def __init__(
+        self, browser: Selenium, request: ListRequest, pageField: str, referer: str
+    ) -> None:
+        self.browser = browser
+        self.request = request
+        self.pageField = pageField
+        self.referer = referer
+        self.sizeField: Optional[str] = None
+        self.pageSize = 10
+
+    @profiler.timed("list.page")
+    def fetchPage(
+        self, page: int, size: Optional[int] = None
+    ) -> Optional[List[DetailId]]:
+        overrides = {self.pageField: str(page)}
+        if self.sizeField and size:
+            overrides[self.sizeField] = str(size)
+        url = self.request["url"]
+        if self.request["method"] == "GET":
+            # GET 요청은 URL의 쿼리를 fields로 다시 구성
+            url = url.partition("?")[0]
+        text = self.browser.http.request(
+            self.request["method"],
+            url,
+            withOverrides(self.request, overrides),
+            self.referer,
+            jsonBody=isJsonBody(self.request["body"]),
+        )
+        if text is None:
+            return None
+        return extractDetailIds(text)
+
+    def tunePageSize(self, firstPage: List[DetailId], total: int) -> None:
+        # 사이트가 허용하는 가장 큰 페이지 크기 사용, 결과가 어긋나면 기본 크기 유지
+        self.sizeField = findSizeField(self.request["fields"])
+        if not self.sizeField:
+            return
+        size = min(MAX_PAGE_SIZE, max(total, len(firstPage)))
+        ids = self.fetchPage(1, size)
+        if ids and ids[: len(firstPage)] == firstPage and len(ids) == min(size, total):
+            self.pageSize = size
+            log.info(f"목록 페이지 크기 {size}건으로 조회")
+        else:
+            self.sizeField = None
+
+    def fetchAll(
+        self, total: int, startPage: int = 1, known: Optional[Set[DetailId]] = None
+    ) -> Optional[List[DetailId]]:
+        ids: List[DetailId] = []
+        pages = max(1, math.ceil(total / self.pageSize))
+        for page in range(startPage, pages + 1):
+            pageIds = self.fetchPage(page, self.pageSize)
+            if pageIds is None:
+                return None
+            if not pageIds:
+                break
+            ids.extend(pageIds)
+            log.debug(f"목록 {page}/{pages} 페이지 조회 ({len(ids)}/{total})")
+            if allKnown(pageIds, known):
+                log.info(f"목록 {page}페이지가 모두 이전에 처리한 문서, 조회 중단")
+                profiler.count("list.stopAtKnown")
+                break
+        return dedupe(ids)
+
+
+@profiler.timed("list")
+def collectDetailIds(
+    browser: Selenium,
+    total: int,
+    known: Optional[Set[DetailId]] = None,
+    onPage: Optional[Callable[[int], None]] = None,
+) -> List[DetailId]:
+    """
+    상세 작업 전에 검색 결과 전체의 goDetail id를 목록 순서대로 수집.
+    known이 있으면 목록이 최신순이라고 보고, 한 페이지가 모두 known이면 거기서 멈춘다.
+    onPage는 브라우저에 결과 페이지가 그려질 때마다 페이지 번호로 호출 (스크린샷)
+    """
+    # 더보기 클릭 후 목록이 그려질 때까지 대기
+    browser.getAllChild("css selector", LIST_ANCHORS, "listAnchors")
+    referer = browser.driver.current_url
+    firstPage = readPageIds(browser)
+    if onPage:
+        onPage(1)
+    if len(firstPage) >= total or allKnown(firstPage, known):
+        return firstPage
+    if not browser.options.listReplay:
+        return clickThroughPages(browser, firstPage, known, onPage)
+
+    request = recordNextPageRequest(browser)
+    secondPage = waitNextPage(browser, firstPage)
+    if onPage and secondPage:
+        onPage(2)
+    if request and secondPage:
+        pageField = findPageField(request["fields"])
+        if pageField:
+            fetcher = ListingFetcher(browser, request, pageField, referer)
+            # 가로챈 요청을 재현한 결과가 실제 2페이지와 같을 때만 신뢰
+            if fetcher.fetchPage(2) == secondPage:
+                fetcher.tunePageSize(firstPage, total)
+                ids = fetcher.fetchAll(total, known=known)
+                if ids is not None:
+                    log.info(f"목록 요청 재현으로 {len(ids)}건 수집")
+                    return ids
+    log.info("목록 요청 재현 불가, 페이지 이동으로 수집")
+    profiler.count("list.clickThrough")
+    return clickThroughPages(
+        browser, firstPage + (secondPage or []), known, onPage, 2 if secondPage else 1
+    )
+
+
+def readPageIds(browser: Selenium) -> List[DetailId]:
+    hrefs = browser.extract(
+        {
+            "hrefs": {
+                "by": "css selector",
+                "value": LIST_ANCHORS,
+                "attr": "href",
+                "many": True,
+            }
+        }
+    )["hrefs"]
+    return extractDetailIds(" ".join(h for h in hrefs if h))
+
+
+def recordNextPageRequest(browser: Selenium) -> Optional[ListRequest]:
+    # 다음 페이지 클릭이 보내는 요청(XHR/fetch/form)을 기록, 요청 자체는 그대로 진행
+    buttons = browser.driver.find_elements("xpath", NEXT_PAGE_XPATH)
+    if not buttons:
+        return None
+    request = browser.driver.execute_script(
+        """
+        const link = arguments[0];
+        let recorded = null;
+        const record = (req) => { if (!recorded) recorded = req; };
+        const origOpen = XMLHttpRequest.prototype.open;
+        const origSend = XMLHttpRequest.prototype.send;
+        const origSubmit = HTMLFormElement.prototype.submit;
+        const origFetch = window.fetch;
+        const fromForm = (form) => ({
+            method: (form.method || "GET").toUpperCase(),
+            url: new URL(form.getAttribute("action") || location.href, location.href).href,
+            body: null,
+            fields: Array.from(new FormData(form).entries())
+                .filter(([, v]) => typeof v === "string"),
+        });
+        const onSubmit = (e) => record(fromForm(e.target));
+        XMLHttpRequest.prototype.open = function (method, url) {
+            this.__req = { method: method.toUpperCase(), url: new URL(url, location.href).href };
+            return origOpen.apply(this, arguments);
+        };
+        XMLHttpRequest.prototype.send = function (body) {
+            if (this.__req) {
+                const text = typeof body === "string" ? body : null;
+                record({ ...this.__req, body: text, fields: [] });
+            }
+            return origSend.apply(this, arguments);
+        };
+        HTMLFormElement.prototype.submit = function () {
+            record(fromForm(this));
+            return origSubmit.apply(this, arguments);
+        };
+        if (origFetch) {
+            window.fetch = function (input, init) {
+                const url = typeof input === "string" ? input : input.url;
+                record({
+                    method: ((init && init.method) || "GET").toUpperCase(),
+                    url: new URL(url, location.href).href,
+                    body: init && typeof init.body === "string" ? init.body : null,
+                    fields: [],
+                });
+                return origFetch.apply(this, arguments);
+            };
+        }
+        document.addEventListener("submit", onSubmit, true);
+        try {
+            link.click();
+        } finally {
+            XMLHttpRequest.prototype.open = origOpen;
+            XMLHttpRequest.prototype.send = origSend;
+            HTMLFormElement.prototype.submit = origSubmit;
+            if (origFetch) window.fetch = origFetch;
+            document.removeEventListener("submit", onSubmit, true);
+        }
+        return recorded;
+        """,
+        buttons[0],
+    )
+    if not request:
+        return None
+    if not request["fields"]:
+        request["fields"] = fieldsOf(request["url"], request["body"])
+    return request
+
+
+def waitNextPage(
+    browser: Selenium, prevIds: List[DetailId]
+) -> Optional[List[DetailId]]:
+    try:
+        browser.waitFor(
+            "pageChange", lambda _: readPageIds(browser) not in ([], prevIds)
+        )
+    except TimeoutException:
+        return None
+    return readPageIds(browser)
+
+
+def clickThroughPages(
+    browser: Selenium,
+    ids: List[DetailId],
+    known: Optional[Set[DetailId]] = None,
+    onPage: Optional[Callable[[int], None]] = None,
+    page: int = 1,
+) -> List[DetailId]:
+    # 페이지네이션을 한 페이지씩 클릭하며 id만 수집, page는 현재 보고 있는 페이지 번호
+    lastIds = ids
+    while not allKnown(lastIds, known):
+        browser.driver.execute_script("""
+            const el = document.querySelector('.rnb');
+            if (el) el.style.display = 'none';
+            """)
+        buttons = browser.driver.find_elements("xpath", NEXT_PAGE_XPATH)
+        if not buttons:
+            log.info("다음 페이지 없음, 순회 종료")
+            break
+        prevIds = readPageIds(browser)
+        buttons[0].click()
+        pageIds = waitNextPage(browser, prevIds)
+        if not pageIds:
+            log.info("페이지 전환 없음, 순회 종료")
+            break
+        ids.extend(pageIds)
+        lastIds = pageIds
+        page += 1
+        if onPage:
+            onPage(page)
+    return dedupe(ids)
+
+
+def extractDetailIds(text: str) -> List[DetailId]:
+    ids = re.findall(r"goDetail\(\s*'([^']+)'\s*,\s*'([^']+)'", text)
+    if ids:
+        return dedupe(ids)
+    # JSON 응답이면 prdnNstRgstNo/prdnDt 필드를 가진 객체를 수집
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return []
+    found: List[DetailId] = []
+
+    def walk(node: Any) -> None:
+        if isinstance(node, dict):
+            if "prdnNstRgstNo" in node and "prdnDt" in node:
+                found.append((str(node["prdnNstRgstNo"]), str(node["prdnDt"])))
+            for value in node.values():
+                walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    walk(data)
+    return dedupe(found)
+
+
+def allKnown(ids: List[DetailId], known: Optional[Set[DetailId]]) -> bool:
+    return bool(known) and bool(ids) and all(i in known for i in ids)  # type: ignore
+
+
+def dedupe(ids) -> List[DetailId]:
+    return list(dict.fromkeys((a, b) for a, b in ids))
+
+
+def isJsonBody(body: Optional[str]) -> bool:
+    return bool(body) and body.lstrip().startswith("{")  # type: ignore
+
+
+def fieldsOf(url: str, body: Optional[str]) -> List[Tuple[str, str]]:
+    if isJsonBody(body):
+        return [(k, str(v)) for k, v in json.loads(body or "{}").items()]
+    if body:
+        return parse_qsl(body, keep_blank_values=True)
+    return parse_qsl(url.partition("?")[2], keep_blank_values=True)
+
+
+def withOverrides(
+    request: ListRequest, overrides: Dict[str, str]
+) -> List[Tuple[str, str]]:
+    return [(k, overrides.get(k, v)) for k, v in request["fields"]]
+
+
+def findPageField(fields: List[Tuple[str, str]]) -> Optional[str]:
+    # 2페이지 요청에서 값이 "2"인 페이지 관련 필드
+    candidates = [k for k, v in fields if v == "2"]
+    for key in candidates:
+        if re.search(r"page|index|no", key, re.I) and not PAGE_SIZE_PATTERN.search(key):
+            return key
+    return candidates[0] if len(candidates) == 1 else None
+
+
+def findSizeField(fields: List[Tuple[str, str]]) -> Optional[str]:
+    for key, value in fields:
+        if PAGE_SIZE_PATTERN.search(key) and value.isdigit():
+            return key
+    return None
@@ -0,0 +1,51 @@
+from classes.ConfigStream import normalizeConfig
+from classes.Logger import log
+from typing import Dict, List, Tuple
+
+# (입력 순서, config), 실행 기록의 configKey는 입력 순서를 기준으로 만든다
+PlannedConfig = Tuple[int, Dict]
+
+# 검색어만 다르면 같은 그룹, 그룹 안에서는 검색 결과 페이지를 검색어만 바꿔서 다시 연다
+GROUP_KEYS = ("organization", "location", "startDate", "endDate", "include", "exclude")
+
+
+def planConfigs(
+    configs: List[Dict], parallel: bool = False
+) -> List[List[PlannedConfig]]:
+    """
+    config를 정규화하고 중복을 제거한 뒤 (기관, 지역, 기간, 포함/제외어) 기준으로 묶는다.
+    parallel이면 같은 조건을 모두 한 그룹으로 모으고 큰 그룹부터 배치한다.
+    아니면 입력 순서를 그대로 유지하고, 연속해서 나온 같은 조건만 한 그룹으로 묶는다.
+    """
+    groups: Dict[Tuple, List[PlannedConfig]] = {}
+    runs: List[List[PlannedConfig]] = []
+    lastKey = None
+    seen = set()
+    duplicates = 0
+    for idx, raw in enumerate(configs):
+        cfg = normalizeConfig(raw)
+        if cfg is None:
+            continue
+        key = tuple(sorted(cfg.items()))
+        if key in seen:
+            duplicates += 1
+            continue
+        seen.add(key)
+        groupKey = tuple(cfg[k] for k in GROUP_KEYS)
+        groups.setdefault(groupKey, []).append((idx, cfg))
+        if groupKey == lastKey:
+            runs[-1].append((idx, cfg))
+        else:
+            runs.append([(idx, cfg)])
+            lastKey = groupKey
+
+    if parallel:
+        # 정렬이 안정적이므로 같은 크기는 처음 나온 순서 유지
+        planned = sorted(groups.values(), key=len, reverse=True)
+    else:
+        planned = runs
+    log.info(
+        f"config {len(configs)}건 -> 중복 {duplicates}건 제거, "
+        f"{sum(len(g) for g in planned)}건 / {len(planned)}개 그룹으로 실행"
+    )
+    return planned
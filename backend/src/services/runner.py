@@ -0,0 +1,220 @@
+from services.openGoKr import (
+    CrawlContext,
+    crawlOpenGoKr,
+    beginJournalRun,
+    prewarmInstitutions,
+)
+from services.workerPool import crawlOpenGoKrParallel
+from services.planner import PlannedConfig, planConfigs
+from classes.Session import BrowserSession
+from classes.Driver import drivers
+from classes.EngineOptions import EngineOptions
+from classes.Excel import ExcelHelper
+from classes.ResultStore import ResultStore, createSink
+from classes.Screenshot import ScreenshotPipeline
+from classes.Journal import CrawlJournal
+from classes.FileStore import AttachmentStore
+from classes.InstitutionCache import InstitutionCache
+from classes.Logger import log
+from constants.index import (
+    DIR_NAME,
+    INSTITUTION_CACHE_NAME,
+    JOURNAL_NAME,
+    OPEN_GO_KR_MAIN_URL,
+    SCREENSHOT_DIR_NAME,
+    STORE_NAME,
+)
+from typing import Callable, Dict, Iterable, List, Optional, Union
+import os
+
+
+def runCrawl(
+    args,
+    configs: Union[List[Dict], Iterable[Dict]],
+    session: Optional[BrowserSession] = None,
+    shouldStop: Optional[Callable[[], bool]] = None,
+) -> bool:
+    """
+    한 번의 크롤링 실행. 데몬은 warm 세션(session)과 취소 여부(shouldStop)를 넘긴다.
+    취소되면 실행 기록을 끝내지 않고 False를 반환한다.
+    """
+    debug = args.debug
+    excelName = args.excelName
+    options = EngineOptions.fromArgs(args)
+    if session is None:
+        # 실행 기록/엑셀 준비와 겹치도록 chromedriver를 먼저 띄워둔다
+        drivers.prestart()
+    downloadDir = downloadDirOf(args.baseDir, excelName)
+    journal = (
+        CrawlJournal(os.path.join(downloadDir, JOURNAL_NAME))
+        if args.journal == "true"
+        else None
+    )
+    # 스트리밍 입력은 전체 목록을 미리 알 수 없으므로 입력 경로로 실행을 구분
+    runKey = CrawlJournal.runKeyOf(
+        excelName,
+        (
+            configs
+            if isinstance(configs, list)
+            else [{"dataFile": configs.source, "runId": args.runId}]
+        ),
+    )
+    # 목록 입력은 정규화/중복 제거 후 검색 조건별로 묶고, 스트리밍 입력은 들어온 순서 그대로 처리
+    groups: Iterable[List[PlannedConfig]]
+    if isinstance(configs, list):
+        groups = planConfigs(configs, parallel=args.workers > 1)
+        plannedList = [item for group in groups for item in group]
+        planned: Iterable[PlannedConfig] = plannedList
+        total: Optional[int] = len(plannedList)
+    else:
+        planned = enumerate(configs)
+        groups = ([item] for item in planned)
+        # 스트리밍 입력은 호출한 쪽이 알려준 개수(--total)로만 진행률을 계산
+        total = args.total if args.total > 0 else None
+    # 증분 모드의 워터마크는 실행 기록 DB에 있으므로 --journal true가 필요하다
+    incremental = args.incremental == "true"
+    if incremental and journal is None:
+        log.warn("증분 크롤링은 --journal true가 필요해서 전체 기간을 조회합니다.")
+        incremental = False
+    store = (
+        AttachmentStore(os.path.join(args.baseDir, DIR_NAME, STORE_NAME))
+        if args.attachmentStore == "true"
+        else None
+    )
+    screenshots = (
+        ScreenshotPipeline(
+            os.path.join(downloadDir, SCREENSHOT_DIR_NAME), args.screenshotFormat
+        )
+        if args.screenshots == "true"
+        else None
+    )
+
+    # 데몬에서는 작업마다 열고 닫아야 sqlite 연결이 쌓이지 않는다
+    try:
+        institutions = (
+            InstitutionCache(
+                os.path.join(args.baseDir, DIR_NAME, INSTITUTION_CACHE_NAME)
+            )
+            if args.institutionCache == "true" or args.prewarm != "false"
+            else None
+        )
+        if institutions and args.prewarm != "false" and not isinstance(configs, list):
+            log.warn("스트리밍 입력에서는 기관 사전 조회를 건너뜁니다.")
+            if args.prewarm == "only":
+                return True
+        elif institutions and args.prewarm != "false":
+            prewarmSession = BrowserSession(
+                OPEN_GO_KR_MAIN_URL, downloadDir, debug, options=options
+            )
+            try:
+                unmatched = prewarmInstitutions(
+                    prewarmSession, [cfg for _, cfg in planned], institutions
+                )
+            finally:
+                prewarmSession.close()
+            for item in unmatched:
+                log.event("unmatched", **item)
+            if args.prewarm == "only":
+                return True
+
+        context = CrawlContext(
+            downloadDir,
+            excelName,
+            debug,
+            journal=journal,
+            runKey=runKey,
+            store=store,
+            institutions=institutions,
+            shouldStop=shouldStop,
+            incremental=incremental,
+            screenshots=screenshots,
+            options=options,
+        )
+        if args.workers > 1:
+            completed = crawlOpenGoKrParallel(
+                context, groups, args.workers, args.excelMode, args.resultExport, total
+            )
+            if not completed:
+                log.info(
+                    "작업이 취소되었습니다. 같은 설정으로 다시 실행하면 이어서 진행합니다."
+                )
+                return False
+            if journal:
+                journal.finishRun(runKey)
+            log.result(downloadDir)
+            return True
+
+        # 세션 재사용 모드에서는 하나의 Chrome으로 모든 config를 처리
+        ownsSession = session is None
+        if session is not None:
+            session.configure(options)
+            session.retarget(downloadDir)
+        elif args.reuseSession == "true":
+            session = BrowserSession(
+                OPEN_GO_KR_MAIN_URL, downloadDir, debug, options=options
+            )
+        # store/stream 모드에서는 실행 전체에서 하나의 결과 저장소를 두고 엑셀은 마지막에 한 번 만든다
+        excel = (
+            createSink(
+                args.excelMode,
+                downloadDir,
+                excelName,
+                checkpointInterval=args.checkpointInterval,
+                export=args.resultExport,
+            )
+            if args.excelMode != "legacy"
+            else None
+        )
+        if journal:
+            if excel:
+                beginJournalRun(journal, runKey, excel)
+            else:
+                legacyExcel = ExcelHelper(downloadDir, excelName)
+                if beginJournalRun(journal, runKey, legacyExcel):
+                    legacyExcel.save()
+        done = 0
+        stopped = False
+        try:
+            for position, (idx, cfg) in enumerate(planned):
+                if shouldStop and shouldStop():
+                    stopped = True
+                    break
+                log.progress("configs", position, total)
+                crawlOpenGoKr(
+                    context.bind(session, excel),
+                    configKey=CrawlJournal.configKeyOf(runKey, idx, cfg),
+                    **cfg,
+                )
+                done = position + 1
+                if excel:
+                    excel.maybeCheckpoint()
+            log.progress("configs", done, total)
+        finally:
+            if session and ownsSession:
+                session.close()
+            if excel:
+                if screenshots:
+                    screenshots.drain()
+                excel.save()
+                if isinstance(excel, ResultStore):
+                    excel.close()
+        if stopped or (shouldStop and shouldStop()):
+            log.info(
+                "작업이 취소되었습니다. 같은 설정으로 다시 실행하면 이어서 진행합니다."
+            )
+            return False
+        if journal:
+            journal.finishRun(runKey)
+        log.result(downloadDir)
+        return True
+    finally:
+        if journal:
+            journal.close()
+        if store:
+            store.close()
+        if screenshots:
+            screenshots.close()
+
+
+def downloadDirOf(baseDir: str, excelName: str) -> str:
+    return os.path.join(baseDir, DIR_NAME, excelName.split(".")[0])
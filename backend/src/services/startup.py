@@ -0,0 +1,94 @@
+from classes.Logger import log
+from constants.index import DIR_NAME
+from typing import Dict, Optional
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+
+def processStartedAt() -> Optional[float]:
+    """
+    프로세스 시작 시각(epoch). onefile 빌드는 부트로더(부모)가 압축을 푼 뒤 Python을 띄우므로
+    부모 프로세스 시작 시각을 기준으로 한다. psutil이 없으면 None.
+    """
+    try:
+        import psutil
+    except ImportError:
+        return None
+    proc = psutil.Process()
+    if isOneFile():
+        parent = proc.parent()
+        if parent is not None:
+            proc = parent
+    return proc.create_time()
+
+
+def isOneFile() -> bool:
+    # onefile은 실행 때마다 임시 디렉토리(_MEIxxxx)에 풀리고, onedir은 실행 파일 옆에 풀려 있다
+    bundleDir = getattr(sys, "_MEIPASS", None)
+    if not getattr(sys, "frozen", False) or bundleDir is None:
+        return False
+    return os.path.dirname(os.path.abspath(sys.executable)) != os.path.abspath(
+        bundleDir
+    )
+
+
+def runStartupBenchmark(args, mainStarted: float, argsParsed: float) -> Dict:
+    """
+    실행부터 첫 동작(메인 페이지 로드)까지의 구간별 시간을 startup 이벤트로 내보낸다.
+    mode가 imports면 브라우저는 띄우지 않고 크롤링 모듈 로드까지만 측정.
+    """
+    startedAt = processStartedAt()
+    mainStartedAt = time.time() - (time.perf_counter() - mainStarted)
+    phases: Dict[str, Optional[float]] = {
+        # 인터프리터 기동(+ onefile 압축 해제)부터 main.py 실행까지
+        "bootSec": round(mainStartedAt - startedAt, 3) if startedAt else None,
+        "argsSec": round(argsParsed - mainStarted, 3),
+    }
+
+    begun = time.perf_counter()
+    # 크롤링 모듈(selenium, openpyxl) 로드 시간만 잰다
+    importlib.import_module("services.runner")
+    from classes.EngineOptions import EngineOptions
+    from classes.Session import BrowserSession
+    from constants.index import OPEN_GO_KR_MAIN_URL
+
+    phases["importsSec"] = round(time.perf_counter() - begun, 3)
+
+    if args.startupBenchmark == "true":
+        baseDir = args.baseDir or tempfile.mkdtemp(prefix="opengokr_startup_")
+        downloadDir = os.path.join(baseDir, DIR_NAME, ".startup")
+        begun = time.perf_counter()
+        session = BrowserSession(
+            OPEN_GO_KR_MAIN_URL,
+            downloadDir,
+            args.debug or '"false"',
+            options=EngineOptions(lean=args.lean == "true"),
+        )
+        try:
+            session.acquire()
+            phases["browserSec"] = round(time.perf_counter() - begun, 3)
+        finally:
+            session.close()
+            shutil.rmtree(downloadDir, ignore_errors=True)
+            if not args.baseDir:
+                shutil.rmtree(baseDir, ignore_errors=True)
+
+    firstAction = time.perf_counter() - mainStarted
+    report = {
+        **phases,
+        "sinceMainSec": round(firstAction, 3),
+        "firstActionSec": (
+            round(firstAction + phases["bootSec"], 3)
+            if phases["bootSec"] is not None
+            else None
+        ),
+        "frozen": bool(getattr(sys, "frozen", False)),
+        "oneFile": isOneFile(),
+    }
+    log.event("startup", **report)
+    log.flush()
+    return report
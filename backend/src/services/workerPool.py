@@ -0,0 +1,128 @@
+from classes.Excel import RowBuffer
+from classes.ResultStore import ResultStore, createSink
+from classes.Session import BrowserSession
+from classes.Journal import CrawlJournal
+from constants.index import OPEN_GO_KR_MAIN_URL
+from services.openGoKr import CrawlContext, crawlOpenGoKr, beginJournalRun
+from services.planner import PlannedConfig
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+import queue
+from classes.Logger import log
+
+# (config, 결과 행 버퍼, 실패 원인), 실패하면 버퍼 대신 예외
+ConfigResult = Tuple[Dict, Optional[RowBuffer], Optional[Exception]]
+
+
+def crawlOpenGoKrParallel(
+    context: CrawlContext,
+    groups: Iterable[List[PlannedConfig]],
+    workers: int,
+    excelMode: str = "legacy",
+    resultExport: str = "none",
+    total: Optional[int] = None,
+) -> bool:
+    """
+    그룹 단위로 워커에 배정한다. 한 그룹은 한 세션에서 이어서 처리해서
+    검색어만 바꿔 검색 결과를 다시 여는 경로를 탈 수 있게 한다.
+    total은 전체 config 수, 스트리밍 입력이면 None
+    취소(shouldStop)되면 새 config를 시작하지 않고 False를 반환한다.
+    """
+    # 워커마다 독립된 headless 세션과 다운로드 디렉토리를 가진다
+    sessions: "queue.Queue[BrowserSession]" = queue.Queue()
+    for n in range(workers):
+        sessions.put(
+            BrowserSession(
+                OPEN_GO_KR_MAIN_URL,
+                context.downloadDir,
+                '"false"',
+                f"worker{n + 1}",
+                context.options,
+            )
+        )
+
+    excel = createSink(
+        excelMode, context.downloadDir, context.excelName, export=resultExport
+    )
+    if context.journal:
+        beginJournalRun(context.journal, context.runKey, excel)
+    shouldStop = context.shouldStop
+
+    # 워커 스레드의 이벤트에도 호출한 쪽의 job id 등을 그대로 붙인다
+    logContext = log.currentContext()
+
+    def runGroup(group: List[PlannedConfig]) -> List[ConfigResult]:
+        # config마다 결과를 따로 모아서, 한 config가 실패해도 앞뒤 config의 행은 그대로 병합
+        session = sessions.get()
+        results: List[ConfigResult] = []
+        try:
+            with log.bind(**logContext):
+                for idx, cfg in group:
+                    if shouldStop and shouldStop():
+                        break
+                    buffer = RowBuffer()
+                    try:
+                        crawlOpenGoKr(
+                            context.bind(session, buffer),
+                            configKey=CrawlJournal.configKeyOf(
+                                context.runKey, idx, cfg
+                            ),
+                            **cfg,
+                        )
+                        results.append((cfg, buffer, None))
+                    except Exception as e:
+                        results.append((cfg, None, e))
+        finally:
+            sessions.put(session)
+        return results
+
+    # 스트리밍 입력이면 전체 개수를 모른 채로 들어오는 대로 제출
+    pending: Deque[Tuple[Future, List[PlannedConfig]]] = deque()
+    merged = 0
+    error = None
+
+    def mergeReady(block: bool) -> None:
+        nonlocal merged, error
+        # 결과는 완료 순서와 무관하게 제출 순서대로 config 단위로 엑셀에 병합
+        while pending and (block or pending[0][0].done()):
+            future, group = pending.popleft()
+            try:
+                results = future.result()
+            except Exception as e:
+                results = [(cfg, None, e) for _, cfg in group]
+            for cfg, buffer, failure in results:
+                merged += 1
+                label = f"[{merged}/{total if total is not None else '?'}]"
+                if buffer is not None:
+                    buffer.replay(excel)
+                    log.info(f"{label} config 결과 병합 완료")
+                else:
+                    log.error(
+                        f"{label} config 실패 ({cfg['query']}-{cfg['organization']}): "
+                        f"{failure}"
+                    )
+                    error = error or failure
+                log.progress("configs", merged, total)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for group in groups:
+                if shouldStop and shouldStop():
+                    break
+                pending.append((pool.submit(runGroup, group), group))
+                mergeReady(block=False)
+            mergeReady(block=True)
+            if context.screenshots:
+                context.screenshots.drain()
+            excel.pretterColumns()
+            excel.save()
+    finally:
+        while not sessions.empty():
+            sessions.get().close()
+        if isinstance(excel, ResultStore):
+            excel.close()
+
+    if error:
+        raise RuntimeError("크롤링 도중 오류 발생") from error
+    return not (shouldStop and shouldStop())
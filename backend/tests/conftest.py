@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+# 백엔드 모듈은 src 기준으로 import (main.py와 동일), 가짜 서버는 bench에서
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "bench"))
+
+
+@pytest.fixture
+def fakeServer():
+    # bench의 가짜 open.go.kr 서버를 임의 포트로 띄운다
+    from fakeOpenGoKr import FakeConfig, FakeOpenGoKrServer
+
+    server = FakeOpenGoKrServer(0, FakeConfig(fileSize=4096))
+    server.startInBackground()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,69 @@
+import json
+import threading
+import time
+
+from classes.ConfigStream import ConfigStream
+
+CONFIG = {
+    "query": "예산",
+    "organization": "교육청",
+    "location": "서울",
+    "startDate": "2024-01-01",
+    "endDate": "2024-12-31",
+}
+
+
+def write(path, lines):
+    path.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+
+
+def test_reads_lines_arrays_and_skips_bad_entries(tmp_path):
+    path = tmp_path / "configs.jsonl"
+    write(
+        path,
+        [
+            json.dumps(CONFIG, ensure_ascii=False),
+            "",
+            "{not json",
+            json.dumps({"query": "누락"}),
+            json.dumps(
+                [{**CONFIG, "query": "도로"}, {**CONFIG, "include": "교통"}],
+                ensure_ascii=False,
+            ),
+        ],
+    )
+    stream = ConfigStream(str(path))
+    configs = list(stream)
+    assert [cfg["query"] for cfg in configs] == ["예산", "도로", "예산"]
+    assert configs[0]["include"] == "null"
+    assert configs[2]["include"] == "교통"
+    assert stream.count == 3
+    assert stream.source == str(path.resolve())
+
+
+def test_last_line_without_newline(tmp_path):
+    path = tmp_path / "configs.jsonl"
+    path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    assert len(list(ConfigStream(str(path)))) == 1
+
+
+def test_follow_waits_for_appended_lines_until_end_marker(tmp_path):
+    path = tmp_path / "configs.jsonl"
+    write(path, [json.dumps(CONFIG)])
+
+    def append():
+        time.sleep(0.1)
+        with open(path, "a", encoding="utf-8") as f:
+            # 쓰다 만 줄은 줄바꿈이 들어올 때까지 기다린다
+            f.write(json.dumps({**CONFIG, "query": "도로"})[:10])
+            f.flush()
+            time.sleep(0.1)
+            f.write(json.dumps({**CONFIG, "query": "도로"})[10:] + "\n")
+            f.write(json.dumps({"end": True}) + "\n")
+            f.write(json.dumps({**CONFIG, "query": "무시"}) + "\n")
+
+    writer = threading.Thread(target=append)
+    writer.start()
+    configs = list(ConfigStream(str(path), follow=True, pollInterval=0.02))
+    writer.join()
+    assert [cfg["query"] for cfg in configs] == ["예산", "도로"]
@@ -0,0 +1,102 @@
+import json
+import socket
+import threading
+
+import pytest
+
+from classes.Logger import log
+from main import buildParser
+from services.daemon import DaemonSocketServer, EngineDaemon
+
+CONFIG = {
+    "query": "예산",
+    "organization": "교육청",
+    "location": "서울",
+    "startDate": "2024-01-01",
+    "endDate": "2024-12-31",
+}
+
+
+@pytest.fixture
+def engine(tmp_path):
+    # start()를 부르지 않으면 warm 브라우저를 띄우지 않고 명령 처리만 확인할 수 있다
+    args = buildParser().parse_args(
+        ["--daemon", "stdin", "--debug", '"false"', "--baseDir", str(tmp_path)]
+    )
+    return EngineDaemon(args, buildParser)
+
+
+def submit(engine, tmp_path, **command):
+    engine.handle(
+        {
+            "cmd": "submit",
+            "baseDir": str(tmp_path),
+            "excelName": "결과.xlsx",
+            "configs": [CONFIG],
+            **command,
+        }
+    )
+
+
+def test_submit_parses_options_per_job(engine, tmp_path):
+    submit(engine, tmp_path, id="a1", options={"lean": "true", "excelMode": "store"})
+    submit(engine, tmp_path, id="a2")
+    first, second = engine.pending.get_nowait(), engine.pending.get_nowait()
+    assert (first.id, first.status) == ("a1", "queued")
+    assert first.args.lean == "true" and first.args.excelMode == "store"
+    # 앞 작업의 옵션이 다음 작업에 남지 않는다
+    assert second.args.lean == "false" and second.args.excelMode == "legacy"
+    assert first.configs[0]["query"] == "예산"
+
+
+@pytest.mark.parametrize("key", ["rateLimit", "verbose", "baseDir", "token"])
+def test_submit_rejects_process_and_command_options(engine, tmp_path, key):
+    with pytest.raises(ValueError):
+        submit(engine, tmp_path, id="bad", options={key: "true"})
+    assert engine.pending.empty()
+    assert "bad" not in engine.jobs
+
+
+def test_submit_rejects_duplicate_running_id(engine, tmp_path):
+    submit(engine, tmp_path, id="a1")
+    with pytest.raises(ValueError):
+        submit(engine, tmp_path, id="a1")
+
+
+def test_cancel_queued_job_and_stream_end(engine, tmp_path):
+    submit(engine, tmp_path, id="a1")
+    engine.handle({"cmd": "cancel", "id": "a1"})
+    job = engine.jobs["a1"]
+    assert job.status == "cancelled"
+    assert job.cancelEvent.is_set()
+
+    submit(engine, tmp_path, id="s1", stream=True, configs=[])
+    engine.handle(
+        {"cmd": "append", "id": "s1", "configs": [{**CONFIG, "query": "도로"}]}
+    )
+    engine.handle({"cmd": "end", "id": "s1"})
+    assert [cfg["query"] for cfg in engine.jobs["s1"].configs] == ["도로"]
+    with pytest.raises(ValueError):
+        engine.handle({"cmd": "append", "id": "a1", "configs": [CONFIG]})
+
+
+def test_socket_requires_token(engine):
+    server = DaemonSocketServer(0, engine, "secret")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with socket.create_connection(server.server_address, timeout=5) as conn:
+            reader = conn.makefile("r", encoding="utf-8")
+            conn.sendall(b'{"cmd": "status", "token": "wrong"}\n')
+            rejected = json.loads(reader.readline())
+            assert rejected["level"] == "error"
+            conn.sendall(b'{"cmd": "status", "token": "secret"}\n')
+            while True:
+                event = json.loads(reader.readline())
+                if event.get("event") == "status":
+                    break
+            assert event["jobs"] == []
+    finally:
+        server.shutdown()
+        server.server_close()
+        log.flush()
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+from classes.Downloader import Downloader, downloadRequestOf, fileNameOf
+from classes.Http import HttpSession
+
+PAGE = "https://www.open.go.kr/othicInfo/infoList/infoListDetl.do?prdnNstRgstNo=A1"
+
+
+def test_request_from_href():
+    assert downloadRequestOf({"href": "/util/fileDownload.do?fileSn=0"}, PAGE) == {
+        "method": "GET",
+        "url": "https://www.open.go.kr/util/fileDownload.do?fileSn=0",
+        "fields": [],
+    }
+
+
+def test_request_from_submit_form():
+    form = {
+        "method": "POST",
+        "url": "https://www.open.go.kr/util/fileDownload.do",
+        "fields": [["fileNo", "A1"], ["fileSn", "0"]],
+    }
+    assert downloadRequestOf({"href": None, "onclick": None, "form": form}, PAGE) == {
+        "method": "POST",
+        "url": "https://www.open.go.kr/util/fileDownload.do",
+        "fields": [("fileNo", "A1"), ("fileSn", "0")],
+    }
+
+
+def test_request_from_url_literal_in_script():
+    onclick = "window.open('/util/fileDownload.do?fileNo=A1&fileSn=1'); return false;"
+    assert downloadRequestOf({"href": "#none", "onclick": onclick}, PAGE)["url"] == (
+        "https://www.open.go.kr/util/fileDownload.do?fileNo=A1&fileSn=1"
+    )
+    href = 'javascript:location.href="https://files.example.com/a.hwp"'
+    assert downloadRequestOf({"href": href}, PAGE)["url"] == (
+        "https://files.example.com/a.hwp"
+    )
+
+
+def test_function_call_without_url_is_left_to_clicking():
+    # 페이지 함수가 요청을 만드는 버튼은 실행하지 않고 클릭 방식으로 넘긴다
+    attrs = {"href": "#none", "onclick": "fileDown('A1', 0); return false;"}
+    assert downloadRequestOf(attrs, PAGE) is None
+    assert (
+        downloadRequestOf({"href": None, "onclick": None, "form": None}, PAGE) is None
+    )
+
+
+def test_file_name_from_disposition():
+    assert fileNameOf("attachment; filename*=UTF-8''%EB%B6%99%EC%9E%84.hwp", "") == (
+        "붙임.hwp"
+    )
+    assert fileNameOf('attachment; filename="a/b:c.pdf"', "") == "b_c.pdf"
+    assert fileNameOf(None, "https://x/files/%EB%B3%B8%EB%AC%B8.pdf") == "본문.pdf"
+
+
+@pytest.fixture
+def downloader():
+    downloader = Downloader(HttpSession(), maxWorkers=2, maxAttempts=1)
+    yield downloader
+    downloader.close()
+
+
+def test_download_all_keeps_button_order_and_shares_duplicates(
+    downloader, fakeServer, tmp_path
+):
+    url = f"{fakeServer.baseUrl}/util/fileDownload.do"
+
+    def post(sn):
+        return {
+            "method": "POST",
+            "url": url,
+            "fields": [("fileNo", "A1"), ("fileSn", sn)],
+        }
+
+    results = downloader.downloadAll(
+        [post("0"), None, post("1"), post("0")], str(tmp_path), fakeServer.baseUrl
+    )
+    assert results[1] is None
+    assert os.path.basename(results[0]["path"]) == "첨부_A1_0.hwp"
+    assert os.path.basename(results[2]["path"]) == "첨부_A1_1.hwp"
+    # 같은 요청은 한 번만 받고 결과를 같이 쓴다
+    assert results[3] == results[0]
+    assert fakeServer.stats.snapshot()["download"] == 2
+    assert sorted(os.listdir(tmp_path)) == ["첨부_A1_0.hwp", "첨부_A1_1.hwp"]
+    assert results[0]["size"] == 4096
+
+
+def test_html_response_is_a_failed_download(downloader, fakeServer, tmp_path):
+    req = {
+        "method": "GET",
+        "url": f"{fakeServer.baseUrl}/com/main/mainView.do",
+        "fields": [],
+    }
+    assert downloader.downloadAll([req], str(tmp_path), fakeServer.baseUrl) == [None]
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,159 @@
+import os
+
+import pytest
+from selenium.common.exceptions import (
+    NoSuchDriverException,
+    SessionNotCreatedException,
+    WebDriverException,
+)
+from selenium.webdriver.chrome.options import Options
+
+from classes import Driver
+from classes.Driver import DriverFactory, DriverStartError, backoffDelay, classifyError
+from constants.index import (
+    DRIVER_BACKOFF_BASE,
+    DRIVER_BACKOFF_MAX,
+    DRIVER_START_ATTEMPTS,
+)
+
+
+@pytest.fixture
+def factory(tmp_path):
+    return DriverFactory(str(tmp_path / "cache" / "driver.json"))
+
+
+@pytest.fixture
+def driverFile(tmp_path):
+    path = tmp_path / "chromedriver"
+    path.write_bytes(b"")
+    return str(path)
+
+
+def test_cache_round_trip_and_mtime_invalidation(factory, driverFile):
+    paths = {"driverPath": driverFile, "browserPath": ""}
+    factory.writeCache(paths)
+    assert factory.readCache() == paths
+
+    # 드라이버가 업데이트되어 파일이 바뀌면 캐시를 버린다
+    stat = os.stat(driverFile)
+    os.utime(driverFile, (stat.st_atime, stat.st_mtime + 60))
+    assert factory.readCache() is None
+
+    factory.writeCache(paths)
+    os.remove(driverFile)
+    assert factory.readCache() is None
+
+
+def test_resolve_skips_selenium_manager_on_cache_hit(factory, driverFile, monkeypatch):
+    calls = []
+
+    class FakeManager:
+        def binary_paths(self, args):
+            calls.append(args)
+            return {"driver_path": driverFile, "browser_path": ""}
+
+    monkeypatch.setattr(Driver, "SeleniumManager", FakeManager)
+    assert factory.resolve()["driverPath"] == driverFile
+    assert len(calls) == 1
+
+    # 새 프로세스(팩토리)도 파일 캐시를 쓰고 Selenium Manager를 부르지 않는다
+    other = DriverFactory(factory.cachePath)
+    assert other.resolve()["driverPath"] == driverFile
+    assert len(calls) == 1
+
+
+def test_classify_error():
+    assert classifyError(PermissionError("denied")) == "fatal"
+    assert classifyError(OSError("Exec format error")) == "fatal"
+    assert classifyError(NoSuchDriverException("missing")) == "stale"
+    assert (
+        classifyError(
+            SessionNotCreatedException(
+                "This version of ChromeDriver only supports Chrome version 120"
+            )
+        )
+        == "stale"
+    )
+    assert classifyError(WebDriverException("chrome not reachable")) == "transient"
+
+
+def test_backoff_delay_is_bounded(monkeypatch):
+    # 지터의 상한만 확인 (uniform이 항상 최댓값을 돌려준다고 가정)
+    monkeypatch.setattr(Driver.random, "uniform", lambda low, high: high)
+    delays = [backoffDelay(attempt) for attempt in range(1, 12)]
+    assert delays[0] == DRIVER_BACKOFF_BASE
+    assert delays == sorted(delays)
+    assert max(delays) == DRIVER_BACKOFF_MAX
+    assert all(0 <= backoffDelay(attempt) <= DRIVER_BACKOFF_MAX for attempt in (1, 30))
+
+
+class StartScript:
+    """webdriver.Chrome 대신, 정해진 순서대로 예외를 던지고 마지막에 드라이버를 돌려준다"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self, options, service):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "driver"
+
+
+@pytest.fixture
+def started(factory, monkeypatch):
+    sleeps = []
+    invalidated = []
+    monkeypatch.setattr(Driver.time, "sleep", sleeps.append)
+    monkeypatch.setattr(factory, "ensureService", lambda: (object(), ""))
+    monkeypatch.setattr(factory, "invalidate", lambda: invalidated.append(True))
+
+    def run(errors):
+        script = StartScript(errors)
+        monkeypatch.setattr(Driver.webdriver, "Chrome", script)
+        try:
+            return factory.create(Options()), script, sleeps, invalidated
+        except DriverStartError as e:
+            return e, script, sleeps, invalidated
+
+    return run
+
+
+def test_transient_failures_back_off_then_start(started):
+    result, script, sleeps, invalidated = started(
+        [WebDriverException("chrome not reachable")] * 2
+    )
+    assert result == "driver"
+    assert script.calls == 3
+    assert len(sleeps) == 2
+    assert not invalidated
+
+
+def test_transient_failures_stop_after_bounded_attempts(started):
+    result, script, sleeps, _ = started(
+        [WebDriverException("chrome not reachable")] * (DRIVER_START_ATTEMPTS + 5)
+    )
+    assert isinstance(result, DriverStartError)
+    assert not result.fatal
+    assert script.calls == DRIVER_START_ATTEMPTS
+    assert len(sleeps) == DRIVER_START_ATTEMPTS - 1
+    assert all(0 <= delay <= DRIVER_BACKOFF_MAX for delay in sleeps)
+
+
+def test_stale_path_is_resolved_again_once(started):
+    result, script, sleeps, invalidated = started(
+        [NoSuchDriverException("gone"), NoSuchDriverException("gone")]
+    )
+    # 경로를 한 번만 다시 찾고, 그래도 안 되면 재시도 없이 실패
+    assert isinstance(result, DriverStartError) and result.fatal
+    assert script.calls == 2
+    assert invalidated == [True]
+    assert not sleeps
+
+
+def test_fatal_error_is_not_retried(started):
+    result, script, sleeps, _ = started([PermissionError("permission denied")])
+    assert isinstance(result, DriverStartError) and result.fatal
+    assert script.calls == 1
+    assert not sleeps
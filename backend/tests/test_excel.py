@@ -0,0 +1,99 @@
+import datetime
+
+import openpyxl
+import pytest
+from openpyxl.drawing.image import Image as OpenpyxlImage
+from openpyxl.styles import Font
+
+from classes.Excel import HEADER, MISSING_TEXT, StreamingExcelHelper
+
+
+def writeExisting(path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Sheet1"
+    sheet.append(HEADER)
+    sheet.append(["예산", "교육청", "기존 문서", "도로관리", datetime.date(2024, 3, 5)])
+    sheet.append(["합계", None, 12, 3.5])
+    notes = workbook.create_sheet("Notes", 0)
+    notes["A1"] = "메모"
+    notes["A1"].font = Font(bold=True)
+    notes["B2"] = 42
+    notes["C3"] = "링크"
+    notes["C3"].hyperlink = "https://www.open.go.kr/"
+    notes.merge_cells("A5:B5")
+    notes.column_dimensions["A"].width = 30
+    workbook.save(path)
+
+
+def test_other_sheets_and_cell_types_survive_save(tmp_path):
+    path = tmp_path / "결과.xlsx"
+    writeExisting(path)
+
+    excel = StreamingExcelHelper(str(tmp_path), "결과.xlsx")
+    excel.notFoundData("도로", "시청", "검색 결과가 0건입니다.")
+    excel.save()
+    # 체크포인트처럼 여러 번 저장해도 같은 결과
+    excel.save()
+
+    workbook = openpyxl.load_workbook(path)
+    assert workbook.sheetnames == ["Notes", "Sheet1"]
+    notes = workbook["Notes"]
+    assert notes["A1"].value == "메모"
+    assert notes["A1"].font.bold
+    assert notes["B2"].value == 42
+    assert notes["C3"].hyperlink.target == "https://www.open.go.kr/"
+    assert [str(r) for r in notes.merged_cells.ranges] == ["A5:B5"]
+    assert notes.column_dimensions["A"].width == 30
+
+    rows = [list(row) for row in workbook["Sheet1"].iter_rows(values_only=True)]
+    assert rows[1][4] == datetime.datetime(2024, 3, 5)
+    assert rows[2][2:4] == [12, 3.5]
+    assert rows[3][:3] == ["도로", "시청", "검색 결과가 0건입니다."]
+
+
+def test_spool_truncate_and_edit_last_row(tmp_path):
+    attachment = tmp_path / "붙임.hwp"
+    attachment.write_bytes(b"hwp")
+    excel = StreamingExcelHelper(str(tmp_path), "결과.xlsx")
+    excel.notFoundData("a", "b", "c")
+    excel.notFoundData("d", "e", "f")
+    assert excel.rowCount() == 3
+    excel.truncate(2)
+    assert excel.rowCount() == 2
+    # truncate 뒤의 마지막 행에도 링크를 붙일 수 있어야 함
+    excel.setHyperlink([str(attachment)], col=4, hasMissingDownloads=True)
+    excel.save()
+
+    sheet = openpyxl.load_workbook(tmp_path / "결과.xlsx")["Sheet1"]
+    assert sheet.max_row == 2
+    assert sheet["D2"].value == "바로가기"
+    assert sheet["D2"].hyperlink.target.endswith("붙임.hwp")
+    assert sheet["E2"].value == MISSING_TEXT
+
+
+def test_existing_images_sheet_keeps_pictures_and_appends_shots(tmp_path):
+    # openpyxl은 Pillow가 있어야 그림을 읽고 쓸 수 있음
+    Image = pytest.importorskip("PIL.Image")
+    thumbnail = tmp_path / "thumb.jpg"
+    Image.new("RGB", (40, 40)).save(thumbnail)
+    path = tmp_path / "결과.xlsx"
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Sheet1"
+    workbook.active.append(HEADER)
+    images = workbook.create_sheet("Images")
+    images["A1"] = "기존 그림"
+    images.add_image(OpenpyxlImage(str(thumbnail)), "C1")
+    workbook.save(path)
+
+    excel = StreamingExcelHelper(str(tmp_path), "결과.xlsx")
+    excel.addScreenshot(
+        {"name": "p1", "original": str(thumbnail), "thumbnail": str(thumbnail)}
+    )
+    excel.save()
+    excel.save()
+
+    sheet = openpyxl.load_workbook(path)["Images"]
+    assert sheet["A1"].value == "기존 그림"
+    assert sheet["A2"].value == "원본 보기"
+    assert [img.anchor._from.row for img in sheet._images] == [0, 1]
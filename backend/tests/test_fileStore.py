@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from classes.EngineOptions import EngineOptions
+from classes.FileStore import AttachmentStore
+from services.openGoKr import crawlDocument
+
+
+class FakeBrowser:
+    """상세 탭을 여는 크롬 대신 다운로드 호출만 기록"""
+
+    options = EngineOptions()
+
+    def __init__(self, downloadPath, contents):
+        self.downloadPath = str(downloadPath)
+        os.makedirs(self.downloadPath, exist_ok=True)
+        self.contents = contents
+        self.downloads = 0
+
+    def openTab(self, url):
+        pass
+
+    def closeTab(self):
+        pass
+
+    def waitExtract(self, point, fields):
+        return {"title": "회의 결과", "workUnit": "총무", "prodDate": "2024-03-05"}
+
+    def countElements(self, by, value, point):
+        return len(self.contents)
+
+    def downloadOpenGoKr(self, by, value):
+        self.downloads += 1
+        paths = []
+        for name, data in self.contents:
+            path = os.path.join(self.downloadPath, name)
+            with open(path, "wb") as f:
+                f.write(data)
+            paths.append(path)
+        return (paths, False)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AttachmentStore(str(tmp_path / ".attachments"))
+    yield store
+    store.close()
+
+
+def test_known_attachments_skip_the_download(store, tmp_path):
+    contents = [("본문.hwp", b"body"), ("붙임.pdf", b"attachment")]
+    first = FakeBrowser(tmp_path / "run1", contents)
+    doc = crawlDocument(first, "A1", "20240305", "list", store)
+    assert first.downloads == 1
+    assert [open(p, "rb").read() for p in doc["files"]] == [b"body", b"attachment"]
+
+    # 다른 작업 폴더에서 같은 문서를 다시 만나면 버튼 수만 세고 저장소에서 연결
+    second = FakeBrowser(tmp_path / "run2", contents)
+    doc = crawlDocument(second, "A1", "20240305", "list", store)
+    assert second.downloads == 0
+    assert [os.path.dirname(p) for p in doc["files"]] == [second.downloadPath] * 2
+    assert [open(p, "rb").read() for p in doc["files"]] == [b"body", b"attachment"]
+    assert doc["hasMissing"] is False
+
+
+def test_partial_store_hit_downloads_again(store, tmp_path):
+    first = FakeBrowser(tmp_path / "run1", [("본문.hwp", b"body")])
+    crawlDocument(first, "A1", "20240305", "list", store)
+    # 첨부가 하나 더 생겼으면 저장소만으로는 채울 수 없다
+    second = FakeBrowser(
+        tmp_path / "run2", [("본문.hwp", b"body"), ("붙임.pdf", b"new")]
+    )
+    doc = crawlDocument(second, "A1", "20240305", "list", store)
+    assert second.downloads == 1
+    assert len(doc["files"]) == 2
+
+
+def test_same_content_is_stored_once(store, tmp_path):
+    for no in ("A1", "B2"):
+        browser = FakeBrowser(tmp_path / no, [("같은파일.hwp", b"same")])
+        crawlDocument(browser, no, "20240305", "list", store)
+    objects = [name for _, _, files in os.walk(store.objectsDir) for name in files]
+    assert objects == ["같은파일.hwp"]
+    assert store.lookup("B2", "20240305", 1) == store.lookup("A1", "20240305", 1)
@@ -0,0 +1,107 @@
+import json
+
+from selenium.common.exceptions import TimeoutException
+
+from classes.InstitutionCache import InstitutionCache
+from services.openGoKr import selectInstitution
+
+SELECTED = {"#insttCd": "7010000", "#insttNm": "서울특별시교육청"}
+
+
+class FakeElement:
+    def get_attribute(self, name):
+        return "서울특별시교육청"
+
+
+class FakeBrowser:
+    """기관찾기 팝업 흐름만 흉내, 확인 버튼을 누르면 폼에 기관 코드가 채워진다"""
+
+    def __init__(self, matches=True, applies=True):
+        self.matches = matches
+        self.applies = applies
+        self.form = {"#kwd": "예산", "#insttCd": "", "#insttNm": ""}
+        self.popups = 0
+
+    def snapshotInputs(self):
+        return dict(self.form)
+
+    def applyInputs(self, fields):
+        if not self.applies:
+            return False
+        self.form.update(fields)
+        return True
+
+    def goToNewWindow(self, by, value, point):
+        self.popups += 1
+
+    def typingInputElement(self, by, value, text, point=None):
+        pass
+
+    def clickElement(self, by, value, point=None, timeout=None):
+        if point == "institutionResult" and not self.matches:
+            raise TimeoutException()
+        if point == "institutionConfirm":
+            self.form.update(SELECTED)
+
+    def getElement(self, by, value, point=None):
+        return FakeElement()
+
+    def goToDefaultWindow(self):
+        pass
+
+    def focusIframe(self, by, value, point=None):
+        pass
+
+
+def test_miss_opens_popup_and_caches_changed_fields(tmp_path):
+    cache = InstitutionCache(str(tmp_path / "institutions.json"))
+    browser = FakeBrowser()
+
+    assert selectInstitution(browser, "교육청", "서울", cache)
+    assert browser.popups == 1
+    # 팝업 선택으로 바뀐 값만 저장하고 검색어는 저장하지 않는다
+    assert cache.get("교육청", "서울") == {
+        "title": "서울특별시교육청",
+        "fields": SELECTED,
+    }
+    assert cache.get("교육청", "부산") is None
+
+
+def test_hit_skips_popup(tmp_path):
+    path = str(tmp_path / "institutions.json")
+    InstitutionCache(path).put("교육청", "서울", "서울특별시교육청", SELECTED)
+    browser = FakeBrowser()
+
+    # 앞뒤 공백이 달라도 같은 기관
+    assert selectInstitution(browser, " 교육청", "서울 ", InstitutionCache(path))
+    assert browser.popups == 0
+    assert browser.form["#insttCd"] == "7010000"
+
+
+def test_hit_falls_back_to_popup_when_form_changed(tmp_path):
+    cache = InstitutionCache(str(tmp_path / "institutions.json"))
+    cache.put("교육청", "서울", "서울특별시교육청", SELECTED)
+    browser = FakeBrowser(applies=False)
+
+    assert selectInstitution(browser, "교육청", "서울", cache)
+    assert browser.popups == 1
+
+
+def test_unmatched_institution_is_not_cached(tmp_path):
+    cache = InstitutionCache(str(tmp_path / "institutions.json"))
+
+    assert not selectInstitution(FakeBrowser(matches=False), "없는기관", "서울", cache)
+    assert cache.get("없는기관", "서울") is None
+    assert not (tmp_path / "institutions.json").exists()
+
+
+def test_put_merges_entries_saved_by_other_processes(tmp_path):
+    path = str(tmp_path / "institutions.json")
+    first, second = InstitutionCache(path), InstitutionCache(path)
+    first.put("교육청", "서울", "서울특별시교육청", SELECTED)
+    second.put("시청", "부산", "부산광역시", {"#insttCd": "6260000"})
+
+    with open(path, encoding="utf-8") as f:
+        saved = json.load(f)
+    assert sorted(saved) == ["부산|시청", "서울|교육청"]
+    assert InstitutionCache(path).get("교육청", "서울")["title"] == "서울특별시교육청"
@@ -0,0 +1,92 @@
+import pytest
+
+from classes.Journal import CrawlJournal
+
+
+@pytest.fixture
+def journal(tmp_path):
+    journal = CrawlJournal(str(tmp_path / "state" / "crawl_state.sqlite3"))
+    yield journal
+    journal.close()
+
+
+def document(title, files=()):
+    return {
+        "title": title,
+        "workUnit": "도로관리",
+        "prodDate": "2024-03-05",
+        "detailUrl": f"https://www.open.go.kr/detail?{title}",
+        "hasMissing": False,
+        "files": list(files),
+    }
+
+
+def test_keys_are_stable_and_order_sensitive():
+    configs = [{"query": "a"}, {"query": "b"}]
+    runKey = CrawlJournal.runKeyOf("결과.xlsx", configs)
+    assert runKey == CrawlJournal.runKeyOf("결과.xlsx", [dict(c) for c in configs])
+    assert runKey != CrawlJournal.runKeyOf("결과.xlsx", configs[::-1])
+    assert CrawlJournal.configKeyOf(runKey, 0, configs[0]) != CrawlJournal.configKeyOf(
+        runKey, 1, configs[0]
+    )
+
+
+def test_unfinished_run_resumes_and_finished_run_starts_over(journal):
+    assert journal.beginRun("run", 3) == (3, False)
+    journal.beginConfig("run", "cfg")
+    journal.saveDocument("cfg", "A1", "20240105", document("a"))
+    # 중단된 실행은 시작 시점의 행 수와 함께 이어서 진행
+    assert journal.beginRun("run", 10) == (3, True)
+    assert journal.getDocument("cfg", "A1", "20240105")["title"] == "a"
+    journal.finishRun("run")
+    assert journal.beginRun("run", 10) == (10, False)
+    assert journal.getDocument("cfg", "A1", "20240105") is None
+    assert journal.beginConfig("run", "cfg") == {"finished": 0, "outcome": None}
+
+
+def test_finished_config_keeps_outcome(journal):
+    journal.beginRun("run", 0)
+    journal.beginConfig("run", "cfg")
+    journal.finishConfig("cfg", "검색 결과가 0건입니다.")
+    assert journal.beginConfig("run", "cfg") == {
+        "finished": 1,
+        "outcome": "검색 결과가 0건입니다.",
+    }
+
+
+def test_documents_restore_in_order_until_a_file_is_missing(journal, tmp_path):
+    attachment = tmp_path / "붙임.hwp"
+    attachment.write_bytes(b"hwp")
+    journal.beginRun("run", 0)
+    journal.beginConfig("run", "cfg")
+    journal.saveDocument("cfg", "B2", "20240104", document("b", [str(attachment)]))
+    journal.saveDocument("cfg", "A1", "20240105", document("a"))
+    docs = journal.listDocuments("cfg")
+    assert [doc["title"] for doc in docs] == ["b", "a"]
+    assert docs[0]["files"] == [str(attachment)]
+    # 기록된 첨부파일이 지워지면 그 문서는 다시 처리해야 한다
+    attachment.unlink()
+    assert journal.getDocument("cfg", "B2", "20240104") is None
+    assert journal.listDocuments("cfg") is None
+
+
+def test_watermark_advances_only_with_finished_configs(journal):
+    key = CrawlJournal.watermarkKeyOf("예산", "교육청", "서울", None, "null")
+    assert key == CrawlJournal.watermarkKeyOf("예산", "교육청", "서울", "null", None)
+    assert journal.getWatermark(key) is None
+    journal.beginRun("run", 0)
+    journal.beginConfig("run", "cfg")
+    journal.saveDocument("cfg", "A1", "20240105", document("a"))
+    journal.saveDocument("cfg", "B2", "20240311", document("b"))
+    journal.advanceWatermark(key, "cfg")
+    assert journal.getWatermark(key) == {
+        "latestPrdnDt": "20240311",
+        "seen": {("A1", "20240105"), ("B2", "20240311")},
+    }
+    # 다음 실행에서 처리한 문서가 더해져도 이전 문서는 그대로 남는다
+    journal.beginConfig("run2", "cfg2")
+    journal.saveDocument("cfg2", "C3", "20240201", document("c"))
+    journal.advanceWatermark(key, "cfg2")
+    watermark = journal.getWatermark(key)
+    assert watermark["latestPrdnDt"] == "20240311"
+    assert len(watermark["seen"]) == 3
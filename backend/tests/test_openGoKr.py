@@ -0,0 +1,20 @@
+from services.openGoKr import narrowStartDate, parseCount
+
+
+def test_narrow_start_date_keeps_input_format():
+    assert narrowStartDate("2024-01-01", "20240311") == "2024-03-11"
+    assert narrowStartDate("2024.01.01", "20240311093000") == "2024.03.11"
+    assert narrowStartDate("20240101", "20240311") == "20240311"
+
+
+def test_narrow_start_date_never_moves_backwards():
+    assert narrowStartDate("2024-06-01", "20240311") == "2024-06-01"
+    assert narrowStartDate("2024-03-11", "20240311") == "2024-03-11"
+    # 알 수 없는 형식이면 입력 그대로
+    assert narrowStartDate("2024-01-01", "") == "2024-01-01"
+    assert narrowStartDate("2024-1-1", "20240311") == "2024-1-1"
+
+
+def test_parse_count():
+    assert parseCount("총 1,234건") == 1234
+    assert parseCount("") == 0
@@ -0,0 +1,37 @@
+import os
+
+from services.openGoKrDetail import DetailParser
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def parse(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        html = f.read()
+    parser = DetailParser()
+    parser.feed(html)
+    parser.close()
+    return parser.result()
+
+
+def test_static_detail_with_files():
+    detail = parse("detailWithFiles.html")
+    assert detail == {
+        "title": "2024년 도로 정비 계획 & 예산",
+        "workUnit": "도로관리 일반",
+        "prodDate": "2024-03-05",
+        "attachments": 3,
+        "fileTable": True,
+    }
+
+
+def test_script_rendered_file_table_needs_browser():
+    detail = parse("detailScriptFiles.html")
+    assert detail is not None
+    assert detail["title"] == "회의 결과 보고"
+    assert detail["attachments"] == 0
+    assert detail["fileTable"] is False
+
+
+def test_script_rendered_fields_need_browser():
+    assert parse("detailScriptFields.html") is None
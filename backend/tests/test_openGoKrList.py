@@ -0,0 +1,73 @@
+import json
+
+from services.openGoKrList import (
+    extractDetailIds,
+    fieldsOf,
+    findPageField,
+    findSizeField,
+    withOverrides,
+)
+
+
+def test_find_page_field_prefers_page_index_over_size():
+    fields = [("kwd", "예산"), ("rowPage", "2"), ("pageIndex", "2"), ("sort", "d")]
+    assert findPageField(fields) == "pageIndex"
+    assert findSizeField(fields) == "rowPage"
+
+
+def test_find_page_field_single_candidate_or_none():
+    assert findPageField([("kwd", "2024"), ("p", "2")]) == "p"
+    # 값이 2인 필드가 여럿이고 이름으로 구분할 수 없으면 고르지 않는다
+    assert findPageField([("a", "2"), ("b", "2")]) is None
+    assert findPageField([("pageIndex", "1")]) is None
+
+
+def test_find_size_field_needs_numeric_value():
+    assert findSizeField([("pageUnit", "ten"), ("recordCountPerPage", "10")]) == (
+        "recordCountPerPage"
+    )
+    assert findSizeField([("kwd", "10")]) is None
+
+
+def test_fields_of_form_json_and_query():
+    assert fieldsOf("/list.do", "kwd=%EC%98%88&pageIndex=2&insttCd=") == [
+        ("kwd", "예"),
+        ("pageIndex", "2"),
+        ("insttCd", ""),
+    ]
+    assert fieldsOf("/list.do", '{"pageIndex": 2}') == [("pageIndex", "2")]
+    assert fieldsOf("/list.do?pageIndex=2", None) == [("pageIndex", "2")]
+    request = {
+        "method": "POST",
+        "url": "/list.do",
+        "body": None,
+        "fields": [("kwd", "예산"), ("pageIndex", "2")],
+    }
+    assert withOverrides(request, {"pageIndex": "5"}) == [
+        ("kwd", "예산"),
+        ("pageIndex", "5"),
+    ]
+
+
+def test_extract_detail_ids_from_html_in_order_without_duplicates():
+    html = """
+    <a href="javascript:goDetail('A1', '20240105')">1</a>
+    <a onclick="goDetail( 'B2','20240104' )">2</a>
+    <a href="javascript:goDetail('A1', '20240105')">1</a>
+    """
+    assert extractDetailIds(html) == [("A1", "20240105"), ("B2", "20240104")]
+
+
+def test_extract_detail_ids_from_json():
+    text = json.dumps(
+        {
+            "result": {
+                "list": [
+                    {"prdnNstRgstNo": "A1", "prdnDt": 20240105, "title": "x"},
+                    {"prdnNstRgstNo": "B2", "prdnDt": "20240104"},
+                ]
+            }
+        }
+    )
+    assert extractDetailIds(text) == [("A1", "20240105"), ("B2", "20240104")]
+    assert extractDetailIds("<html>결과 없음</html>") == []
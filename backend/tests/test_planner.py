@@ -0,0 +1,64 @@
+from services.planner import planConfigs
+
+
+def config(query, organization="교육청", startDate="2024-01-01", **extra):
+    return {
+        "query": query,
+        "organization": organization,
+        "location": "서울",
+        "startDate": startDate,
+        "endDate": "2024-12-31",
+        **extra,
+    }
+
+
+def queries(groups):
+    return [[cfg["query"] for _, cfg in group] for group in groups]
+
+
+def test_sequential_keeps_input_order():
+    configs = [
+        config("a"),
+        config("b", organization="시청"),
+        config("c"),
+        config("d"),
+    ]
+    groups = planConfigs(configs)
+    # 연속한 같은 조건만 묶고, 떨어진 같은 조건은 순서를 바꾸지 않는다
+    assert queries(groups) == [["a"], ["b"], ["c", "d"]]
+    assert [idx for group in groups for idx, _ in group] == [0, 1, 2, 3]
+
+
+def test_parallel_groups_same_condition_largest_first():
+    configs = [
+        config("a"),
+        config("b", organization="시청"),
+        config("c"),
+        config("d", startDate="2024-06-01"),
+        config("e"),
+    ]
+    groups = planConfigs(configs, parallel=True)
+    assert queries(groups) == [["a", "c", "e"], ["b"], ["d"]]
+    assert [idx for idx, _ in groups[0]] == [0, 2, 4]
+
+
+def test_duplicates_and_invalid_configs_are_dropped():
+    configs = [
+        config("a"),
+        config(" a "),
+        config("a", include=""),
+        {"query": "b"},
+        "not a config",
+        config("c", include="예산"),
+    ]
+    groups = planConfigs(configs)
+    assert queries(groups) == [["a"], ["c"]]
+    # configKey가 입력 순서를 따르도록 원래 위치를 유지
+    assert [idx for group in groups for idx, _ in group] == [0, 5]
+    assert groups[1][0][1]["include"] == "예산"
+    assert groups[0][0][1]["exclude"] == "null"
+
+
+def test_dates_pass_through_unchanged():
+    groups = planConfigs([config("a", startDate="2024.1.1")])
+    assert groups[0][0][1]["startDate"] == "2024.1.1"
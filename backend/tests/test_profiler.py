@@ -0,0 +1,24 @@
+from classes.Profiler import Profiler
+
+
+def test_disabled_profiler_keeps_nothing():
+    profiler = Profiler()
+    profiler.record("rate.wait", 0.5)
+    profiler.count("retry.download")
+    with profiler.span("list"):
+        pass
+    assert not profiler.durations and not profiler.calls and not profiler.counters
+
+
+def test_enabled_profiler_records_spans_and_counts():
+    profiler = Profiler()
+    profiler.enable()
+    profiler.record("rate.wait", 0.5)
+    profiler.record("rate.wait", 0.25)
+    with profiler.span("list"):
+        pass
+    profiler.count("retry.download", 2)
+    assert profiler.durations["rate.wait"] == [0.5, 0.25]
+    assert profiler.totals["rate.wait"] == 0.75
+    assert profiler.calls["list"] == 1
+    assert profiler.counters["retry.download"] == 2
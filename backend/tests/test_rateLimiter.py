@@ -0,0 +1,134 @@
+import os
+import time
+
+import pytest
+
+from classes.Http import HttpSession
+from classes.RateLimiter import HostRateLimiter, fileLock, limiter as sharedLimiter
+from constants.index import (
+    RATE_BURST,
+    RATE_DECREASE,
+    RATE_INCREASE,
+    RATE_INITIAL,
+    RATE_MAX,
+    RATE_MIN,
+)
+
+URL = "https://www.open.go.kr/util/fileDownload.do"
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    limiter = HostRateLimiter(str(tmp_path))
+    limiter.configure(True)
+    return limiter
+
+
+def rateOf(limiter):
+    with limiter.state("www.open.go.kr") as state:
+        return state["rate"]
+
+
+def test_disabled_limiter_keeps_no_state(tmp_path):
+    limiter = HostRateLimiter(str(tmp_path / "rate"))
+    limiter.acquire(URL)
+    limiter.failure(URL, "alert")
+    assert not os.path.exists(tmp_path / "rate")
+
+
+def test_success_increases_additively(limiter):
+    limiter.success(URL)
+    limiter.success(URL)
+    assert rateOf(limiter) == pytest.approx(RATE_INITIAL + 2 * RATE_INCREASE)
+
+
+def test_failure_decreases_once_per_cooldown(limiter):
+    limiter.failure(URL, "alert")
+    assert rateOf(limiter) == pytest.approx(RATE_INITIAL * RATE_DECREASE)
+    # 동시에 실패한 요청은 한 번만 반영
+    limiter.failure(URL, "timeout")
+    assert rateOf(limiter) == pytest.approx(RATE_INITIAL * RATE_DECREASE)
+    with limiter.state("www.open.go.kr") as state:
+        state["decreasedAt"] = 0.0
+        state["rate"] = RATE_MIN
+    limiter.failure(URL, "timeout")
+    assert rateOf(limiter) == RATE_MIN
+
+
+def test_rate_is_capped_and_refill_is_bounded_by_burst(limiter):
+    with limiter.state("www.open.go.kr") as state:
+        state["rate"] = RATE_MAX
+        # 오래 쉬었던 호스트도 burst 이상은 한 번에 보내지 않는다
+        state["updatedAt"] -= 3600
+    limiter.success(URL)
+    with limiter.state("www.open.go.kr") as state:
+        assert state["rate"] == RATE_MAX
+        assert state["tokens"] == RATE_BURST
+
+
+def test_hosts_are_limited_separately(limiter):
+    limiter.failure(URL, "alert")
+    limiter.success("https://example.com/a")
+    with limiter.state("example.com") as state:
+        assert state["rate"] == pytest.approx(RATE_INITIAL + RATE_INCREASE)
+    assert rateOf(limiter) == pytest.approx(RATE_INITIAL * RATE_DECREASE)
+
+
+def test_corrupt_state_file_starts_over(limiter, tmp_path):
+    limiter.failure(URL, "alert")
+    for name in os.listdir(tmp_path):
+        if name.endswith(".json"):
+            (tmp_path / name).write_text("{broken", encoding="utf-8")
+    assert rateOf(limiter) == pytest.approx(RATE_INITIAL)
+
+
+def test_report_maps_status_codes(limiter):
+    limiter.report(URL, 404)
+    assert rateOf(limiter) == pytest.approx(RATE_INITIAL)
+    limiter.report(URL, 200)
+    assert rateOf(limiter) == pytest.approx(RATE_INITIAL + RATE_INCREASE)
+    limiter.report(URL, 429)
+    assert rateOf(limiter) < RATE_INITIAL
+
+
+def test_state_is_shared_through_files(limiter, tmp_path):
+    limiter.failure(URL, "http500")
+    other = HostRateLimiter(str(tmp_path))
+    other.configure(True)
+    assert rateOf(other) == pytest.approx(RATE_INITIAL * RATE_DECREASE)
+
+
+def test_acquire_waits_when_bucket_is_empty(limiter):
+    for _ in range(int(RATE_BURST)):
+        limiter.acquire(URL)
+    with limiter.state("www.open.go.kr") as state:
+        state["rate"] = 4.0
+        state["tokens"] = 0.0
+    begun = time.monotonic()
+    limiter.acquire(URL)
+    assert time.monotonic() - begun >= 0.2
+
+
+def test_file_lock_times_out_and_proceeds(tmp_path):
+    path = str(tmp_path / "held.lock")
+    with fileLock(path):
+        begun = time.monotonic()
+        # 같은 프로세스의 다른 파일 핸들도 flock은 따로 잠근다
+        with fileLock(path, timeout=0.1):
+            pass
+        assert time.monotonic() - begun >= 0.1
+
+
+def test_http_server_errors_slow_the_host_down(fakeServer, tmp_path, monkeypatch):
+    # 실제 요청 경로(HttpSession)에서 5xx 응답이 공유 limiter로 전달되는지 확인
+    monkeypatch.setattr(sharedLimiter, "stateDir", str(tmp_path))
+    monkeypatch.setattr(sharedLimiter, "enabled", True)
+    fakeServer.cfg.errorRate = 1.0
+    http = HttpSession()
+    url = f"{fakeServer.baseUrl}/othicInfo/infoList/infoListDetl.do"
+    try:
+        assert http.getText(url) is None
+    finally:
+        http.close()
+    with sharedLimiter.state(f"127.0.0.1:{fakeServer.server_address[1]}") as state:
+        assert state["rate"] == pytest.approx(RATE_INITIAL * RATE_DECREASE)
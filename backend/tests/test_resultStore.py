@@ -0,0 +1,139 @@
+import csv
+import datetime
+import os
+
+import openpyxl
+
+from classes.Excel import HEADER, MISSING_TEXT
+from classes.Journal import CrawlJournal
+from classes.ResultStore import ResultStore
+from services.openGoKr import beginJournalRun
+
+
+def document(title, files=(), hasMissing=False):
+    return {
+        "title": title,
+        "workUnit": "도로관리",
+        "prodDate": "2024-03-05",
+        "detailUrl": f"https://www.open.go.kr/detail?{title}",
+        "hasMissing": hasMissing,
+        "files": list(files),
+    }
+
+
+def readSheet(path):
+    workbook = openpyxl.load_workbook(path)
+    sheet = workbook["Sheet1"]
+    return [
+        [
+            (cell.value, cell.hyperlink.target if cell.hyperlink else None)
+            for cell in row
+        ]
+        for row in sheet.iter_rows()
+    ]
+
+
+def test_rows_render_to_excel_layout(tmp_path):
+    attachment = tmp_path / "붙임.hwp"
+    attachment.write_bytes(b"hwp")
+    store = ResultStore(str(tmp_path), "결과.xlsx")
+    store.addDocument("예산", "교육청", document("a", [str(attachment)]))
+    store.addNotFound("도로", "시청", "검색 결과가 0건입니다.")
+    store.addDocument("예산", "교육청", document("b", [str(tmp_path / "없음.pdf")]))
+    store.save()
+    store.close()
+
+    rows = readSheet(tmp_path / "결과.xlsx")
+    assert [value for value, _ in rows[0][: len(HEADER)]] == HEADER
+    assert rows[1][2] == ("a", "https://www.open.go.kr/detail?a")
+    assert rows[1][5][0] == "바로가기"
+    assert rows[1][5][1].endswith(os.path.abspath(attachment).replace("\\", "/"))
+    assert [value for value, _ in rows[2][:3]] == [
+        "도로",
+        "시청",
+        "검색 결과가 0건입니다.",
+    ]
+    # 기록된 파일이 사라졌으면 링크는 빼고 파일 칸 뒤에 누락 경고
+    assert rows[3][5][0] is None
+    assert rows[3][6][0] == MISSING_TEXT
+
+
+def test_reopen_uses_store_until_workbook_is_edited(tmp_path):
+    store = ResultStore(str(tmp_path), "결과.xlsx")
+    store.addDocument("예산", "교육청", document("a"))
+    store.save()
+    store.close()
+
+    store = ResultStore(str(tmp_path), "결과.xlsx")
+    assert store.rowCount() == 2
+    assert [r["kind"] for r in store.records()] == ["header", "document"]
+    store.close()
+
+    # 사용자가 엑셀을 직접 고치면 엑셀 내용을 기존 행으로 가져온다
+    path = tmp_path / "결과.xlsx"
+    workbook = openpyxl.load_workbook(path)
+    workbook["Sheet1"].append(["수기", "입력"])
+    workbook.save(path)
+    store = ResultStore(str(tmp_path), "결과.xlsx")
+    assert [r["kind"] for r in store.records()] == ["header", "cells", "cells"]
+    store.addDocument("예산", "교육청", document("b"))
+    store.save()
+    store.close()
+    values = [[value for value, _ in row] for row in readSheet(path)]
+    assert values[2][:2] == ["수기", "입력"]
+    assert values[3][2] == "b"
+
+
+def test_other_sheets_and_cell_types_survive_render(tmp_path):
+    path = tmp_path / "결과.xlsx"
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Sheet1"
+    workbook.active.append(HEADER)
+    workbook.active.append(["수기", "입력", 12, "도로", datetime.datetime(2024, 3, 5)])
+    workbook.create_sheet("Notes")["A1"] = "메모"
+    workbook.save(path)
+
+    store = ResultStore(str(tmp_path), "결과.xlsx")
+    store.addDocument("예산", "교육청", document("a"))
+    store.save()
+    store.close()
+    # 저장소를 그대로 이어 쓰는 실행에서도 다른 시트가 유지되어야 함
+    store = ResultStore(str(tmp_path), "결과.xlsx")
+    store.save()
+    store.close()
+
+    workbook = openpyxl.load_workbook(path)
+    assert workbook.sheetnames == ["Sheet1", "Notes"]
+    assert workbook["Notes"]["A1"].value == "메모"
+    values = [[value for value, _ in row] for row in readSheet(path)]
+    assert values[1][2] == 12
+    assert values[1][4] == datetime.datetime(2024, 3, 5)
+    assert values[2][2] == "a"
+
+
+def test_resumed_run_truncates_rows_from_interrupted_attempt(tmp_path):
+    journal = CrawlJournal(str(tmp_path / "crawl_state.sqlite3"))
+    store = ResultStore(str(tmp_path), "결과.xlsx")
+    store.addDocument("이전", "실행", document("old"))
+    assert beginJournalRun(journal, "run", store) is False
+    store.addDocument("예산", "교육청", document("a"))
+    store.addDocument("예산", "교육청", document("b"))
+    # 같은 실행을 다시 시작하면 시작 시점 이후의 행을 지우고 기록으로 다시 채운다
+    assert beginJournalRun(journal, "run", store) is True
+    assert [r["title"] for r in store.records()] == [None, "old"]
+    store.close()
+    journal.close()
+
+
+def test_csv_export(tmp_path):
+    store = ResultStore(str(tmp_path), "결과.xlsx", export="csv")
+    store.addDocument("예산", "교육청", document("a", ["x.hwp", "y.pdf"], True))
+    store.addNotFound("도로", "시청", "검색 결과가 0건입니다.")
+    store.save()
+    store.close()
+    with open(tmp_path / "결과.csv", encoding="utf-8-sig", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["kind"] for row in rows] == ["document", "notFound"]
+    assert rows[0]["files"] == "x.hwp\ny.pdf"
+    assert rows[0]["hasMissing"] == "1"
+    assert rows[1]["message"] == "검색 결과가 0건입니다."
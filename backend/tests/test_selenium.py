@@ -0,0 +1,87 @@
+import os
+
+from selenium.common.exceptions import NoAlertPresentException
+
+from classes.Selenium import Selenium, prepareDownloadDirs
+
+
+class FakeAlert:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def accept(self):
+        self.driver.accepted += 1
+
+
+class FakeSwitch:
+    def __init__(self, driver):
+        self.driver = driver
+
+    @property
+    def alert(self):
+        if not self.driver.alertOpen:
+            raise NoAlertPresentException()
+        return FakeAlert(self.driver)
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alertOpen = False
+        self.accepted = 0
+        self.switch_to = FakeSwitch(self)
+
+
+def eventBrowser(tmp_path, batches):
+    # Chrome 없이 이벤트 대기만 확인, pollDownloadEvents가 호출될 때마다 다음 묶음을 돌려줌
+    browser = Selenium.__new__(Selenium)
+    browser.downloadPath, browser.stagingPath = prepareDownloadDirs(str(tmp_path))
+    browser.driver = FakeDriver()
+    pending = list(batches)
+    browser.pollDownloadEvents = lambda: pending.pop(0) if pending else []
+    return browser
+
+
+def test_download_event_completion_moves_staged_file(tmp_path):
+    browser = eventBrowser(
+        tmp_path,
+        [
+            [
+                (
+                    "Page.downloadWillBegin",
+                    {"guid": "g1", "suggestedFilename": "붙임.hwp"},
+                )
+            ],
+            [("Page.downloadProgress", {"guid": "g1", "state": "inProgress"})],
+            [
+                # 다른 다운로드의 이벤트는 무시
+                ("Page.downloadProgress", {"guid": "other", "state": "completed"}),
+                ("Page.downloadProgress", {"guid": "g1", "state": "completed"}),
+            ],
+        ],
+    )
+    with open(os.path.join(browser.stagingPath, "g1"), "wb") as f:
+        f.write(b"hwp")
+
+    filePath, failed = browser.waitDownloadEvent(1, 1, timeout=5)
+
+    assert not failed
+    assert filePath == os.path.join(browser.downloadPath, "붙임.hwp")
+    with open(filePath, "rb") as f:
+        assert f.read() == b"hwp"
+    assert not (tmp_path / "files" / ".staging" / "g1").exists()
+
+
+def test_download_event_alert_and_cancel(tmp_path):
+    browser = eventBrowser(tmp_path, [[("Page.javascriptDialogOpening", {})]])
+    browser.driver.alertOpen = True
+    assert browser.waitDownloadEvent(1, 1, timeout=5) == (None, True)
+    assert browser.driver.accepted == 1
+
+    browser = eventBrowser(
+        tmp_path,
+        [
+            [("Page.downloadWillBegin", {"guid": "g2"})],
+            [("Page.downloadProgress", {"guid": "g2", "state": "canceled"})],
+        ],
+    )
+    assert browser.waitDownloadEvent(1, 1, timeout=5) == (None, False)
@@ -0,0 +1,84 @@
+from urllib.parse import parse_qsl, urlsplit
+
+from classes.EngineOptions import EngineOptions
+from classes.Session import BrowserSession, conditionInUrl
+
+CONDITION = ("교육청", "서울", "2024-01-01", "2024-12-31", "null", "null")
+RESULT_URL = (
+    "https://www.open.go.kr/othicInfo/infoList/orginlInfoList.do"
+    "?kwd=%EC%98%88%EC%82%B0&insttCd=7010000&startDate=20240101&endDate=20241231"
+)
+
+
+def session(url=RESULT_URL, query="예산", condition=CONDITION):
+    s = BrowserSession("https://www.open.go.kr/com/main/mainView.do", "/tmp", "false")
+    s.rememberSearch(url, query, condition)
+    return s
+
+
+def test_revisit_replaces_only_the_keyword():
+    url = session().revisitUrl("도로", CONDITION)
+    assert url is not None
+    assert url.startswith(urlsplit(RESULT_URL)._replace(query="").geturl())
+    assert parse_qsl(urlsplit(url).query) == [
+        ("kwd", "도로"),
+        ("insttCd", "7010000"),
+        ("startDate", "20240101"),
+        ("endDate", "20241231"),
+    ]
+
+
+def test_no_revisit_without_previous_search_or_for_other_condition():
+    fresh = BrowserSession("https://www.open.go.kr", "/tmp", "false")
+    assert fresh.revisitUrl("도로", CONDITION) is None
+    other = ("교육청", "서울", "2024-02-01", "2024-12-31", "null", "null")
+    assert session().revisitUrl("도로", other) is None
+    # 같은 검색어면 다시 열 필요가 없다
+    assert session().revisitUrl("예산", CONDITION) is None
+
+
+def test_no_revisit_when_condition_is_not_in_url():
+    # 기관 코드가 URL에 없으면 조건이 서버 세션이나 POST에 있다는 뜻
+    url = RESULT_URL.replace("&insttCd=7010000", "")
+    assert session(url).revisitUrl("도로", CONDITION) is None
+    # 포함어가 있는데 URL에 없으면 다시 열지 않는다
+    withInclude = CONDITION[:4] + ("교통", "null")
+    assert session(condition=withInclude).revisitUrl("도로", withInclude) is None
+
+
+def test_condition_in_url_compares_date_digits_and_filters():
+    params = {
+        "kwd": "예산",
+        "insttCd": "7010000",
+        "startDate": "2024.01.01",
+        "endDate": "20241231",
+        "mustKeyword": "교통",
+    }
+    withInclude = CONDITION[:4] + ("교통", "null")
+    assert conditionInUrl(params, "예산", withInclude)
+    assert not conditionInUrl(params, "도로", withInclude)
+    assert not conditionInUrl(params, "예산", CONDITION)
+
+
+class FakeBrowser:
+    def __init__(self, options):
+        self.options = options
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_configure_swaps_runtime_options_and_relaunches_for_launch_options():
+    s = BrowserSession("https://www.open.go.kr", "/tmp", "false")
+    browser = FakeBrowser(s.options)
+    s.browser = browser
+    # 실행 중에 바꿀 수 있는 옵션은 떠 있는 브라우저에 바로 적용
+    s.configure(EngineOptions(httpDetail=True, listReplay=True))
+    assert s.browser is browser
+    assert browser.options.httpDetail and browser.options.listReplay
+    # Chrome 인자로 정해지는 옵션이 바뀌면 브라우저를 닫고 다음 acquire에서 새로 띄움
+    s.configure(EngineOptions(lean=True))
+    assert browser.closed
+    assert s.browser is None
+    assert s.options.lean
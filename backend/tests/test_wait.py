@@ -0,0 +1,61 @@
+import json
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from classes.Wait import MIN_SAMPLES, AdaptiveWait
+
+
+def waits(path=None):
+    return AdaptiveWait(
+        str(path) if path else None,
+        defaultTimeout=0.05,
+        minTimeout=0.01,
+        maxTimeout=0.3,
+    )
+
+
+def never(_):
+    return False
+
+
+def test_consecutive_timeouts_raise_the_limit_until_a_success():
+    wait = waits()
+    for expected in (0.05, 0.1, 0.2, 0.3, 0.3):
+        assert wait.timeoutFor("presence:resultCount") == pytest.approx(expected)
+        with pytest.raises(TimeoutException):
+            wait.until(None, "presence:resultCount", never)
+    wait.until(None, "presence:resultCount", lambda _: True)
+    assert wait.timeoutFor("presence:resultCount") == pytest.approx(0.05)
+
+
+def test_explicit_timeout_miss_is_not_counted():
+    wait = waits()
+    for _ in range(3):
+        with pytest.raises(TimeoutException):
+            wait.until(None, "clickable:institutionResult", never, timeout=0.01)
+    assert wait.timeoutFor("clickable:institutionResult") == pytest.approx(0.05)
+    assert wait.timeouts == {}
+
+
+def test_timeout_follows_measured_p99():
+    wait = waits()
+    for _ in range(MIN_SAMPLES):
+        wait.record("ready:mainPage", 0.02)
+    # p99 * factor
+    assert wait.timeoutFor("ready:mainPage") == pytest.approx(0.04)
+
+
+def test_save_replaces_stats_file(tmp_path):
+    path = tmp_path / "stats" / ".wait_stats.json"
+    wait = waits(path)
+    wait.record("ready:mainPage", 0.5)
+    wait.recordTimeout("presence:resultCount")
+    wait.save()
+    assert [p.name for p in path.parent.iterdir()] == [".wait_stats.json"]
+    assert json.loads(path.read_text(encoding="utf-8")) == {
+        "samples": {"ready:mainPage": [0.5]},
+        "timeouts": {"presence:resultCount": 1},
+    }
+    loaded = waits(path)
+    assert loaded.timeoutFor("presence:resultCount") == pytest.approx(0.1)
@@ -0,0 +1,96 @@
+import time
+
+import pytest
+
+from services import workerPool
+from services.openGoKr import CrawlContext
+
+
+class RecordingSink:
+    def __init__(self):
+        self.rows = []
+        self.saved = False
+
+    def addNotFound(self, query, organization, message):
+        self.rows.append(query)
+
+    def pretterColumns(self):
+        pass
+
+    def save(self):
+        self.saved = True
+
+
+def config(query, organization="교육청"):
+    return {
+        "query": query,
+        "organization": organization,
+        "location": "서울",
+        "startDate": "2024-01-01",
+        "endDate": "2024-12-31",
+    }
+
+
+@pytest.fixture
+def sink(monkeypatch):
+    recorded = RecordingSink()
+    monkeypatch.setattr(workerPool, "createSink", lambda *args, **kwargs: recorded)
+    return recorded
+
+
+def runParallel(tmp_path, groups, crawl, monkeypatch, workers=3):
+    monkeypatch.setattr(workerPool, "crawlOpenGoKr", crawl)
+    context = CrawlContext(str(tmp_path), "결과.xlsx", '"false"')
+    return workerPool.crawlOpenGoKrParallel(context, groups, workers)
+
+
+def test_results_merge_in_submission_order(tmp_path, monkeypatch, sink):
+    # 앞 그룹일수록 늦게 끝나도 엑셀에는 제출 순서대로 들어가야 한다
+    delays = {"a": 0.3, "b": 0.2, "c": 0.1, "d": 0}
+
+    def crawl(context, query, organization, configKey="", **_):
+        time.sleep(delays[query])
+        context.excel.addNotFound(query, organization, "없음")
+
+    groups = [
+        [(0, config("a")), (1, config("b"))],
+        [(2, config("c", "시청"))],
+        [(3, config("d", "도청"))],
+    ]
+
+    assert runParallel(tmp_path, groups, crawl, monkeypatch)
+    assert sink.rows == ["a", "b", "c", "d"]
+    assert sink.saved
+
+
+def test_failed_config_keeps_other_rows_of_its_group(tmp_path, monkeypatch, sink):
+    def crawl(context, query, organization, configKey="", **_):
+        context.excel.addNotFound(query, organization, "없음")
+        if query == "b":
+            raise ValueError("검색 실패")
+
+    groups = [[(0, config("a")), (1, config("b")), (2, config("c"))]]
+
+    with pytest.raises(RuntimeError) as raised:
+        runParallel(tmp_path, groups, crawl, monkeypatch)
+    assert isinstance(raised.value.__cause__, ValueError)
+    # 실패한 config의 행만 빠지고 같은 그룹의 앞뒤 config는 병합된다
+    assert sink.rows == ["a", "c"]
+    assert sink.saved
+
+
+def test_stop_skips_remaining_configs(tmp_path, monkeypatch, sink):
+    crawled = []
+
+    def crawl(context, query, organization, configKey="", **_):
+        crawled.append(query)
+        context.excel.addNotFound(query, organization, "없음")
+
+    monkeypatch.setattr(workerPool, "crawlOpenGoKr", crawl)
+    context = CrawlContext(
+        str(tmp_path), "결과.xlsx", '"false"', shouldStop=lambda: len(crawled) >= 1
+    )
+    groups = [[(0, config("a")), (1, config("b"))]]
+
+    assert not workerPool.crawlOpenGoKrParallel(context, groups, 1)
+    assert sink.rows == ["a"]
@@ -3,6 +3,7 @@ import { fileURLToPath } from "node:url";
 import path from "node:path";
 import { downloadDirIpc, downloadQueryExcel, openFinderIpc, preventPowerSave } from "./ipcs";
 import { openGoKrIpc } from "./openGoKr";
+import OpenGoKrController from "./openGoKr/controller/OpenGoKr.controller";
 import { naraG2bIpc } from "./naraG2b";
 import { comsiganIpc } from "./comsigan";
 
@@ -70,6 +71,7 @@ app.on("activate", () => {
 
 app.on("before-quit", () => {
   preventPowerSave.stop();
+  OpenGoKrController.stopEngine();
 });
 
 app.whenReady().then(() => {
@@ -1 +1,4 @@
 export const PREFIX = "openGoKr";
+
+// 상주 엔진(daemon) 사용 여부, 검증 전까지는 작업마다 엔진을 새로 띄우는 CLI 방식이 기본
+export const USE_ENGINE_DAEMON = process.env.OPEN_GO_KR_ENGINE_DAEMON === "true";
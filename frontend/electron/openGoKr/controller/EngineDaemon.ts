@@ -0,0 +1,137 @@
+import { app } from "electron";
+import { type ChildProcessWithoutNullStreams, spawn } from "node:child_process";
+import fs from "node:fs";
+import path from "node:path";
+import { fileURLToPath } from "node:url";
+
+export type EngineJobStatus = "queued" | "running" | "done" | "cancelled" | "failed";
+
+type EngineJobHandler = {
+  onLines: (lines: string[]) => void;
+  onStatus: (status: EngineJobStatus, error: string | null) => void;
+  // 작업이 시작되기 전에 엔진이 죽거나 뜨지 못하면 호출, 호출한 쪽에서 CLI 방식으로 다시 실행
+  onUnavailable?: () => void;
+};
+
+const FINISHED: EngineJobStatus[] = ["done", "cancelled", "failed"];
+
+/**
+ * 상주 엔진(script --daemon stdin)과 통신하는 클라이언트
+ * 첫 작업 때 엔진을 띄우고 이후 작업은 warm 브라우저를 재사용한다
+ * 엔진 출력 중 job 필드가 있는 줄은 해당 작업의 핸들러로 넘긴다
+ */
+class EngineDaemon {
+  private static dirName = path.dirname(fileURLToPath(import.meta.url));
+  private static child: ChildProcessWithoutNullStreams | null = null;
+  private static handlers = new Map<string, EngineJobHandler>();
+  // 엔진에서 running 상태를 받은 작업 id
+  private static started = new Set<string>();
+
+  public static exePath() {
+    const exeName = process.platform === "win32" ? "script.exe" : "script";
+    const resourceDir = app.isPackaged
+      ? path.join(process.resourcesPath, "resources")
+      : path.join(this.dirName, "..", "resources");
+    // onedir 빌드(resources/script/script)가 있으면 압축 해제 없이 바로 뜨는 쪽을 우선 사용
+    const onedirPath = path.join(resourceDir, "script", exeName);
+    return fs.existsSync(onedirPath) ? onedirPath : path.join(resourceDir, exeName);
+  }
+
+  public static submit(id: string, payload: Record<string, unknown>, handler: EngineJobHandler) {
+    this.handlers.set(id, handler);
+    this.send({ cmd: "submit", id, ...payload });
+  }
+
+  public static cancel(id: string) {
+    if (!this.handlers.has(id)) return false;
+    this.send({ cmd: "cancel", id });
+    return true;
+  }
+
+  public static stop() {
+    if (!this.child) return;
+    this.send({ cmd: "shutdown" });
+    this.child.stdin.end();
+    this.child = null;
+  }
+
+  private static send(command: Record<string, unknown>) {
+    this.ensureStarted().stdin.write(`${JSON.stringify(command)}\n`);
+  }
+
+  private static ensureStarted() {
+    if (this.child) return this.child;
+
+    const child = spawn(this.exePath(), ["--daemon", "stdin", "--debug", JSON.stringify("false")]);
+    this.child = child;
+
+    child.stdin.on("error", (error) => console.error(`엔진 명령 전달 실패: ${error}`));
+
+    // 청크가 줄 중간에서 끊길 수 있으므로 마지막 미완성 줄은 다음 청크와 합친다
+    let pending = "";
+    child.stdout.on("data", (chunk: Buffer) => {
+      const lines = (pending + chunk.toString("utf-8")).split(/\r?\n/);
+      pending = lines.pop() ?? "";
+      this.route(lines);
+    });
+
+    const onExit = () => {
+      if (this.child === child) this.child = null;
+      // 엔진이 죽으면 시작 전 작업은 호출한 쪽에 넘기고, 진행 중이던 작업은 실패 처리, 다음 submit 때 다시 띄운다
+      this.handlers.forEach((handler, id) => {
+        if (!this.started.has(id) && handler.onUnavailable) handler.onUnavailable();
+        else handler.onStatus("failed", "엔진 프로세스가 종료되었습니다");
+      });
+      this.handlers.clear();
+      this.started.clear();
+    };
+    child.on("close", onExit);
+    child.on("error", onExit);
+
+    return child;
+  }
+
+  private static route(lines: string[]) {
+    const byJob = new Map<string, string[]>();
+
+    for (const line of lines) {
+      if (!line.trim()) continue;
+
+      let event: { event?: string; job?: string; id?: string; status?: EngineJobStatus; error?: string | null };
+      try {
+        event = JSON.parse(line);
+      } catch {
+        continue;
+      }
+      if (!event || typeof event !== "object") continue;
+
+      if (event.event === "job" && event.id && event.status) {
+        const handler = this.handlers.get(event.id);
+        if (!handler) continue;
+        // 상태 변경 전에 모인 로그를 먼저 넘긴다
+        const buffered = byJob.get(event.id);
+        if (buffered) {
+          handler.onLines(buffered);
+          byJob.delete(event.id);
+        }
+        if (event.status === "running") this.started.add(event.id);
+        handler.onStatus(event.status, event.error ?? null);
+        if (FINISHED.includes(event.status)) {
+          this.handlers.delete(event.id);
+          this.started.delete(event.id);
+        }
+        continue;
+      }
+
+      if (event.job) {
+        const buffered = byJob.get(event.job) ?? [];
+        buffered.push(line);
+        byJob.set(event.job, buffered);
+      }
+    }
+
+    byJob.forEach((jobLines, jobId) => this.handlers.get(jobId)?.onLines(jobLines));
+  }
+}
+
+export default EngineDaemon;
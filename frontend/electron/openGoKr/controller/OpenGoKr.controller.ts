@@ -1,10 +1,30 @@
-import { app, BrowserWindow, shell } from "electron";
+import { BrowserWindow, shell } from "electron";
 import { type ChildProcess, spawn } from "node:child_process";
+import { createHash } from "node:crypto";
 import fs from "node:fs";
 import path from "node:path";
-import { fileURLToPath } from "node:url";
 import type { TStatus } from "../../shared/types";
-import { PREFIX } from "../constants";
+import { PREFIX, USE_ENGINE_DAEMON } from "../constants";
+import EngineDaemon, { type EngineJobStatus } from "./EngineDaemon";
+
+export type OpenGoKrProgress = {
+  stage: string;
+  done: number;
+  total: number;
+  rows: number;
+  rowsPerMin: number;
+  etaSec: number | null;
+};
+
+// 엔진이 stdout으로 내보내는 JSON Lines 이벤트
+type EngineEvent = {
+  event: string;
+  ts?: number;
+  level?: string;
+  msg?: string;
+  trace?: string;
+  directory?: string;
+} & Partial<OpenGoKrProgress>;
 
 export type OpenGoKrTask = {
   id: string;
@@ -16,14 +36,20 @@ export type OpenGoKrTask = {
   process?: ChildProcess;
   logStream?: fs.WriteStream;
   debug: string | null;
+  progress?: OpenGoKrProgress;
+  // 상주 엔진에 맡긴 작업이면 true, 취소도 엔진에 요청
+  daemonJob?: boolean;
 };
 
 class OpenGoKrController {
-  private static dirName = path.dirname(fileURLToPath(import.meta.url));
   private static tasks = new Map<string, OpenGoKrTask>();
   private static scheduledTasks = new Map<string, NodeJS.Timeout>();
 
   /** READ */
+  public static stopEngine() {
+    EngineDaemon.stop();
+  }
+
   public static getAllTasks() {
     return [...this.tasks.values()].map(({ process: _, logStream: __, ...rest }) => rest);
   }
@@ -68,6 +94,11 @@ class OpenGoKrController {
       return true;
     }
 
+    // 상주 엔진 작업 -> 엔진에 취소 요청, 문서 사이에서 멈춘 뒤 job 이벤트로 취소됨 상태 반영
+    if (task.daemonJob && EngineDaemon.cancel(id)) {
+      return true;
+    }
+
     // 실행 중 작업 -> 실행 종료, 태스크 리스트에는 유지, 취소됨 상태로 변경 -> 어차피 error에서 캐치되면서 실패로 바뀜, 이후 UI 반영
     if (task.process) {
       task.process.kill();
@@ -125,11 +156,6 @@ class OpenGoKrController {
 
     this.updateTask(id, { status: "작업중" });
 
-    const exeName = process.platform === "win32" ? "script.exe" : "script";
-    const exePath = app.isPackaged
-      ? path.join(process.resourcesPath, "resources", exeName)
-      : path.join(this.dirName, "..", "resources", exeName);
-
     if (!task.baseDir) throw new Error("기본 저장 경로가 설정되지 않았습니다");
     if (!task.excelName || !task.data) throw new Error("엑셀을 정상적으로 인식하지 못했습니다");
 
@@ -155,43 +181,69 @@ class OpenGoKrController {
       console.error(`로그 파일 생성 실패: ${error}`);
     }
 
-    const child = spawn(exePath, [
+    // 같은 config 목록으로 다시 실행할 때만 중단된 실행을 이어서 진행
+    const runId = createHash("sha1").update(JSON.stringify(task.data)).digest("hex");
+
+    // 상주 엔진을 켠 경우 디버그가 아닌 작업은 엔진에 맡겨 브라우저 기동 비용을 줄인다
+    if (USE_ENGINE_DAEMON && task.debug !== "true") {
+      this.updateTask(id, { daemonJob: true });
+      EngineDaemon.submit(
+        id,
+        { baseDir: task.baseDir, excelName: task.excelName, configs: task.data, options: { runId } },
+        {
+          onLines: (lines) => this.handleOutput(id, lines),
+          onStatus: (status, error) => this.handleJobStatus(id, status, error),
+          // 엔진이 뜨지 못했거나 작업 시작 전에 죽었으면 CLI 방식으로 실행
+          onUnavailable: () => {
+            const currentTask = this.tasks.get(id);
+            if (!currentTask || currentTask.status !== "작업중") return;
+            this.updateTask(id, { daemonJob: false });
+            this.spawnEngine(id, currentTask, runId);
+          },
+        }
+      );
+      return;
+    }
+
+    this.spawnEngine(id, task, runId);
+  }
+
+  private static spawnEngine(id: string, task: OpenGoKrTask, runId: string) {
+    const data = task.data ?? [];
+    const child = spawn(EngineDaemon.exePath(), [
       "--baseDir",
-      task.baseDir,
+      task.baseDir ?? "",
       "--excelName",
-      task.excelName,
-      "--data",
-      JSON.stringify(task.data),
+      task.excelName ?? "",
+      // config는 argv 길이 제한을 피하기 위해 stdin으로 한 줄씩 전달
+      "--dataFile",
+      "-",
+      "--total",
+      String(data.length),
+      "--runId",
+      runId,
       "--debug",
       JSON.stringify(task.debug ?? false),
+      "--verbose",
+      task.debug === "true" ? "true" : "false",
     ]);
 
     this.updateTask(id, { process: child });
 
-    child.stdout.on("data", (chunk: Buffer) => {
-      const text = chunk.toString("utf-8");
-      const currentTask = this.tasks.get(id);
-
-      // 로그 파일에 쓰기
-      if (currentTask?.logStream) {
-        const now = new Date();
-        const timeString = `${String(now.getHours()).padStart(2, "0")}:${String(now.getMinutes()).padStart(
-          2,
-          "0"
-        )}:${String(now.getSeconds()).padStart(2, "0")}`;
-        currentTask.logStream.write(`[${timeString}]: ${text}\n`);
-      }
+    child.stdin.on("error", (error) => console.error(`config 전달 실패: ${error}`));
+    child.stdin.end(data.map((row) => JSON.stringify(row)).join("\n") + "\n");
 
-      const successDir = text.match(/DIRECTORY:(.+)/);
-      const failedDir = text.match(/FAILDIRECTORY:(.+)/);
+    // 청크가 줄 중간에서 끊길 수 있으므로 마지막 미완성 줄은 다음 청크와 합친다
+    let pending = "";
+    child.stdout.on("data", (chunk: Buffer) => {
+      const lines = (pending + chunk.toString("utf-8")).split(/\r?\n/);
+      pending = lines.pop() ?? "";
+      this.handleOutput(id, lines);
+    });
 
-      if (successDir && successDir[1]) {
-        const dir = successDir[1].trim();
-        shell.openPath(dir);
-      } else if (failedDir && failedDir[1]) {
-        const dir = failedDir[1].trim();
-        shell.openPath(dir);
-      }
+    child.stdout.on("end", () => {
+      if (pending) this.handleOutput(id, [pending]);
+      pending = "";
     });
 
     child.on("close", (code: number) => {
@@ -211,6 +263,87 @@ class OpenGoKrController {
     });
   }
 
+  private static handleJobStatus(id: string, status: EngineJobStatus, error: string | null) {
+    if (status === "queued" || status === "running") return;
+
+    const currentTask = this.tasks.get(id);
+    if (currentTask?.logStream) {
+      if (error) currentTask.logStream.write(`[${this.timeString(new Date())}] ERROR: ${error}\n`);
+      currentTask.logStream.end();
+    }
+    const statusMap = { done: "작업완료", failed: "작업실패", cancelled: "취소됨" } as const;
+    this.updateTask(id, { status: statusMap[status], daemonJob: false, logStream: undefined });
+  }
+
+  private static handleOutput(id: string, lines: string[]) {
+    const logLines: string[] = [];
+
+    for (const line of lines) {
+      if (!line.trim()) continue;
+
+      let event: EngineEvent | null = null;
+      try {
+        event = JSON.parse(line);
+      } catch {
+        event = null;
+      }
+
+      // JSON이 아닌 줄은 그대로 기록, DIRECTORY 호환 줄은 result/failure 이벤트로 이미 처리됨
+      if (!event || typeof event !== "object") {
+        logLines.push(`[${this.timeString(new Date())}]: ${line}`);
+        continue;
+      }
+
+      const time = this.timeString(event.ts ? new Date(event.ts * 1000) : new Date());
+      switch (event.event) {
+        case "log":
+          logLines.push(`[${time}] ${(event.level ?? "info").toUpperCase()}: ${event.msg ?? ""}`);
+          if (event.trace) logLines.push(event.trace);
+          break;
+        case "progress": {
+          // 전체 진행률은 config 단계 기준, 문서 단계 이벤트는 행 수/속도만 갱신
+          const current = this.tasks.get(id);
+          if (event.stage === "configs") {
+            this.updateTask(id, {
+              progress: {
+                stage: event.stage,
+                done: event.done ?? 0,
+                total: event.total ?? current?.data?.length ?? 0,
+                rows: event.rows ?? 0,
+                rowsPerMin: event.rowsPerMin ?? 0,
+                etaSec: event.etaSec ?? null,
+              },
+            });
+          } else if (current?.progress) {
+            this.updateTask(id, {
+              progress: { ...current.progress, rows: event.rows ?? 0, rowsPerMin: event.rowsPerMin ?? 0 },
+            });
+          }
+          break;
+        }
+        case "result":
+        case "failure":
+          logLines.push(`[${time}] ${event.event.toUpperCase()}: ${event.directory ?? ""}`);
+          if (event.directory) shell.openPath(event.directory.trim());
+          break;
+        default:
+          logLines.push(`[${time}] ${line}`);
+      }
+    }
+
+    // 로그 파일에는 청크 단위로 한 번만 쓰기
+    const currentTask = this.tasks.get(id);
+    if (currentTask?.logStream && logLines.length) {
+      currentTask.logStream.write(`${logLines.join("\n")}\n`);
+    }
+  }
+
+  private static timeString(date: Date) {
+    return `${String(date.getHours()).padStart(2, "0")}:${String(date.getMinutes()).padStart(2, "0")}:${String(
+      date.getSeconds()
+    ).padStart(2, "0")}`;
+  }
+
   private static notifyUpdate() {
     const allWindows = BrowserWindow.getAllWindows();
     allWindows.forEach((window) => {
@@ -21,7 +21,7 @@ type Props = {
 
 const OpenGoKrListItem = ({ task }: Props) => {
   const [time, setTime] = useState<string>("");
-  const { id, data, excelName, scheduledTime, status } = task;
+  const { id, data, excelName, scheduledTime, status, progress } = task;
   const statusColor = getStatusColor(status);
 
   const handleScheduledTimeChange = async (e: ChangeEvent<HTMLInputElement>) => {
@@ -137,6 +137,12 @@ const OpenGoKrListItem = ({ task }: Props) => {
       </Table.Cell>
       <Table.Cell>
         <span className={`text-xs ${statusColor}`}>{status}</span>
+        {status === "작업중" && progress && (
+          <p className="text-[10px] text-gray-500">
+            {progress.done}/{progress.total} · {progress.rowsPerMin}행/분
+            {progress.etaSec !== null && ` · 약 ${Math.ceil(progress.etaSec / 60)}분 남음`}
+          </p>
+        )}
       </Table.Cell>
       <Table.Cell>
         <Trash2 className="cursor-pointer hover:text-red-500" size={20} onClick={handleCancelTask} />
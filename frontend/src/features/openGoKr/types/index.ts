@@ -1,5 +1,14 @@
 import type { TStatusFE } from "@/types";
 
+export type OpenGoKrProgressFE = {
+  stage: string;
+  done: number;
+  total: number;
+  rows: number;
+  rowsPerMin: number;
+  etaSec: number | null;
+};
+
 export type OpenGoKrTaskFE = {
   id: string;
   data: unknown[] | null;
@@ -8,4 +17,5 @@ export type OpenGoKrTaskFE = {
   baseDir: string | null;
   status: TStatusFE;
   debug: string | null;
+  progress?: OpenGoKrProgressFE;
 };